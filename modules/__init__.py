@@ -1,6 +1,7 @@
 # modules/__init__.py
 from .parsers.sct_parser_simple import (
     SCTParser,
+    LazySCTData,
     parse_sct_file,
     quick_parse,
     SCTSectionType,
@@ -14,6 +15,7 @@ from .parsers.rwy_parser import RWYParser
 from .generators.random_generator import RandomScenarioGenerator
 from .calculators.runway_calculator import RunwayCalculator
 from .exporters.sweatbox_exporter import SweatboxExporter
+from .spatial import BoundaryLOD, PointIndex, SectorLocator
 
 # Import UI components directly (not through modules.ui)
 try:
@@ -30,6 +32,7 @@ except ImportError:
 
 __all__ = [
     'SCTParser',
+    'LazySCTData',
     'parse_sct_file',
     'quick_parse',
     'SCTSectionType',
@@ -42,6 +45,9 @@ __all__ = [
     'RunwayCalculator',
     'RWYParser',
     'SweatboxExporter',
+    'PointIndex',
+    'SectorLocator',
+    'BoundaryLOD',
     'SimpleOSMViewer',
     'AircraftViewer',
     'ControllerViewer',
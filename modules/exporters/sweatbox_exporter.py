@@ -57,12 +57,35 @@ class SweatboxExporter:
         
         # Aircraft
         lines.append("; Aircraft")
-        aircraft_count = 0
+        for aircraft_count, entry in enumerate(self.get_aircraft(), 1):
+            callsign = entry['callsign']
+            alt_clean = entry['altitude']
+            route = entry['route']
+            
+            # Generate aircraft entry in sweatbox format
+            lines.append(f"PSEUDOPILOT:{self.creator.master_controller}")
+            lines.append(f"@N:{callsign}:{aircraft_count:04d}:1:{entry['lat']}:{entry['lon']}:{alt_clean}:0:0:0")
+            lines.append(f"$FP{callsign}:*A:I:{entry['type']}:420:::{alt_clean}:::00:00:0:0::")
+            
+            # Add route with speed/heading if specified
+            if entry['speed'] != "250" or entry['heading'] != "000":
+                route_line = f"$ROUTE:{route}"
+                lines.append(route_line)
+            else:
+                lines.append(f"$ROUTE:{route}")
+            
+            lines.append(f"INITIALPSEUDOPILOT:{self.creator.master_controller}")
+            lines.append("")
+        
+        return '\n'.join(lines)
+    
+    def get_aircraft(self):
+        """Aircraft of the details tree as dicts (callsign, type, lat, lon, altitude, route, speed, heading)"""
+        aircraft = []
         
         for item in self.creator.aircraft_details_tree.get_children():
             values = self.creator.aircraft_details_tree.item(item, 'values')
             if values and len(values) >= 5:
-                aircraft_count += 1
                 callsign, ac_type, altitude, position, route = values[:5]
                 
                 # Parse position
@@ -95,19 +118,15 @@ class SweatboxExporter:
                     speed = values[5] if values[5] else "250"
                     heading = values[6] if values[6] else "000"
                 
-                # Generate aircraft entry in sweatbox format
-                lines.append(f"PSEUDOPILOT:{self.creator.master_controller}")
-                lines.append(f"@N:{callsign}:{aircraft_count:04d}:1:{lat}:{lon}:{alt_clean}:0:0:0")
-                lines.append(f"$FP{callsign}:*A:I:{ac_type}:420:::{alt_clean}:::00:00:0:0::")
-                
-                # Add route with speed/heading if specified
-                if speed != "250" or heading != "000":
-                    route_line = f"$ROUTE:{route}"
-                    lines.append(route_line)
-                else:
-                    lines.append(f"$ROUTE:{route}")
-                
-                lines.append(f"INITIALPSEUDOPILOT:{self.creator.master_controller}")
-                lines.append("")
+                aircraft.append({
+                    'callsign': callsign,
+                    'type': ac_type,
+                    'lat': lat,
+                    'lon': lon,
+                    'altitude': alt_clean,
+                    'route': route,
+                    'speed': speed,
+                    'heading': heading
+                })
         
-        return '\n'.join(lines)
\ No newline at end of file
+        return aircraft
\ No newline at end of file
@@ -3,10 +3,20 @@ import re
 from datetime import datetime
 from tkinter import messagebox
 
+from ..spatial import destination_point
+
 class RandomScenarioGenerator:
-    def __init__(self, creator):
+    # Radius around an aircraft or airport used when picking nearby fixes
+    NEARBY_FIX_RADIUS_NM = 100
+    # Candidate positions tried per aircraft before giving up on the sector filter
+    SECTOR_POSITION_ATTEMPTS = 20
+    
+    def __init__(self, creator, training_sectors=None):
         self.creator = creator
         
+        # ARTCC sector names traffic is placed in (None = anywhere near the airports)
+        self.training_sectors = set(training_sectors) if training_sectors else None
+        
         # Aircraft types by size/category
         self.aircraft_types = {
             'small': ['E190', 'E195', 'CRJ9', 'CRJ7', 'DH8D', 'AT76'],
@@ -126,18 +136,18 @@ class RandomScenarioGenerator:
         category = random.choice(['small', 'medium', 'large', 'heavy'])
         ac_type = random.choice(self.aircraft_types[category])
         
-        # Generate position based on loaded airports
-        lat, lon = self.generate_random_position()
-        position = f"{lat:.6f}, {lon:.6f}"
-        
         # Generate altitude based on aircraft type
         if category in ['heavy', 'large']:
             altitude = random.choice([28000, 32000, 35000, 38000])
         else:
             altitude = random.choice([5000, 8000, 10000, 12000, 15000, 18000])
         
+        # Generate position based on loaded airports, inside a trained sector at that level
+        lat, lon = self.generate_random_position(altitude_ft=altitude)
+        position = f"{lat:.6f}, {lon:.6f}"
+        
         # Generate route
-        route = self.generate_random_route()
+        route = self.generate_random_route(near=(lat, lon))
         
         # Generate speed and heading
         speed = str(random.randint(250, 480)).rjust(3)
@@ -154,8 +164,62 @@ class RandomScenarioGenerator:
             heading
         ))
     
-    def generate_random_position(self):
-        """Generate random position near loaded airports"""
+    def get_spatial_index(self):
+        """Spatial index of SCT navdata, or None if the parser has none"""
+        parser = self.creator.sct_parser
+        if parser and hasattr(parser, 'get_spatial_index'):
+            return parser.get_spatial_index()
+        return None
+    
+    def get_all_fix_names(self):
+        """Names of every fix in the SCT data"""
+        parser = self.creator.sct_parser
+        if parser and hasattr(parser, 'get_fix_names'):
+            return parser.get_fix_names()
+        if parser and hasattr(parser, 'get_data'):
+            data = parser.get_data()
+            if 'fixes' in data:
+                return [fix['name'] for fix in data['fixes'] if 'name' in fix]
+        return []
+    
+    def get_sector_locator(self):
+        """Point-in-sector locator for the SCT boundaries, or None without sectors"""
+        parser = self.creator.sct_parser
+        if parser and hasattr(parser, 'get_sector_locator'):
+            locator = parser.get_sector_locator()
+            if len(locator):
+                return locator
+        return None
+    
+    def is_fix(self, item):
+        return item['kind'] == 'fix'
+    
+    def generate_random_position(self, altitude_ft=None):
+        """Generate random position near loaded airports, inside the training sectors if any are set"""
+        locator = self.get_sector_locator() if self.training_sectors else None
+        if locator is None:
+            return self.generate_candidate_position()
+        
+        level = locator.level_for_altitude(altitude_ft)
+        if not locator.sector_names(level):
+            level = None
+        
+        # Classify a batch of candidates in one call and keep the first that fits
+        candidates = [self.generate_candidate_position() for _ in range(self.SECTOR_POSITION_ATTEMPTS)]
+        for candidate, sectors in zip(candidates, locator.locate_many(candidates, level=level)):
+            if self.in_training_sectors(sectors):
+                return candidate
+        
+        # Nothing near the airports fits, so sample inside a trained sector directly
+        point = locator.sample_point(self.training_sectors, level)
+        return point if point else candidates[0]
+    
+    def in_training_sectors(self, sectors):
+        """True if any of the located sectors is being trained"""
+        return any(sector['name'] in self.training_sectors for sector in sectors)
+    
+    def generate_candidate_position(self):
+        """Random position near loaded airports"""
         # Get airports from map viewer
         airports = []
         if self.creator.map_viewer and hasattr(self.creator.map_viewer, 'loaded_airports'):
@@ -167,6 +231,16 @@ class RandomScenarioGenerator:
             if 'airports' in data and data['airports']:
                 airport = random.choice(data['airports'])
                 if 'latitude' in airport and 'longitude' in airport:
+                    # Place the aircraft near a fix around the airport when possible
+                    index = self.get_spatial_index()
+                    if index is not None:
+                        nearby = index.within_radius(airport['latitude'], airport['longitude'],
+                                                     self.NEARBY_FIX_RADIUS_NM, accept=self.is_fix)
+                        if nearby:
+                            _, fix = random.choice(nearby)
+                            return destination_point(fix['lat'], fix['lon'],
+                                                     random.uniform(0, 360), random.uniform(0, 5))
+                    
                     lat = airport['latitude'] + random.uniform(-2.0, 2.0)
                     lon = airport['longitude'] + random.uniform(-2.0, 2.0)
                     return lat, lon
@@ -174,16 +248,18 @@ class RandomScenarioGenerator:
         # Default fallback position
         return random.uniform(-90, 90), random.uniform(-180, 180)
     
-    def generate_random_route(self):
-        """Generate random route using fixes from SCT data"""
+    def generate_random_route(self, near=None):
+        """Generate random route using fixes from SCT data (close to near=(lat, lon) if given)"""
         route_parts = []
         
-        # Get fixes from SCT parser if available
+        # Get fixes from SCT parser if available, nearby ones first
         fixes = []
-        if self.creator.sct_parser and hasattr(self.creator.sct_parser, 'get_data'):
-            data = self.creator.sct_parser.get_data()
-            if 'fixes' in data:
-                fixes = [fix['name'] for fix in data['fixes'] if 'name' in fix]
+        index = self.get_spatial_index() if near else None
+        if index is not None:
+            fixes = [item['name'] for _, item in
+                     index.within_radius(near[0], near[1], self.NEARBY_FIX_RADIUS_NM, accept=self.is_fix)]
+        if not fixes:
+            fixes = self.get_all_fix_names()
         
         # If we have fixes, use them
         if fixes:
@@ -264,11 +340,7 @@ class RandomScenarioGenerator:
     def generate_route_to_airport(self, fix_name, airport_icao):
         """Generate route from fix to airport"""
         # Get fixes from SCT parser if available
-        fixes = []
-        if self.creator.sct_parser and hasattr(self.creator.sct_parser, 'get_data'):
-            data = self.creator.sct_parser.get_data()
-            if 'fixes' in data:
-                fixes = [fix['name'] for fix in data['fixes'] if 'name' in fix]
+        fixes = self.get_all_fix_names()
         
         # Create route
         route_parts = [fix_name]
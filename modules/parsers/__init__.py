@@ -1,5 +1,6 @@
 from .sct_parser_simple import (
     SCTParser,
+    LazySCTData,
     parse_sct_file,
     quick_parse,
     SCTSectionType,
@@ -13,6 +14,7 @@ from .rwy_parser import RWYParser
 
 __all__ = [
     'SCTParser',
+    'LazySCTData',
     'parse_sct_file',
     'quick_parse',
     'SCTSectionType',
@@ -0,0 +1,221 @@
+# boundary_store.py
+"""Array-backed storage for ARTCC boundary polylines.
+
+A BoundaryStore keeps every vertex of a layer in one flat float64 array
+(lat, lon, lat, lon, ...) with two offset indexes:
+
+    path_offsets      vertex index where each path starts (len = paths + 1)
+    boundary_offsets  path index where each boundary starts (len = boundaries + 1)
+
+Indexing the store yields lightweight BoundaryView mappings with 'name',
+'paths' and a read-only 'segments' view, so code written against the old
+list-of-segment-dicts layout keeps working.
+"""
+from array import array
+from bisect import bisect_right
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from .ring_assembly import assemble_paths
+
+
+class BoundaryStore(Sequence):
+    """Boundaries of one ARTCC layer as polylines in contiguous arrays"""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.coords = array('d')
+        self.path_offsets = array('I', [0])
+        self.boundary_offsets = array('I', [0])
+
+    @classmethod
+    def from_arrays(cls, names: List[str], coords: array, path_offsets: array,
+                    boundary_offsets: array) -> 'BoundaryStore':
+        """Wrap already-packed arrays (e.g. read from the binary cache)"""
+        store = cls()
+        store.names = list(names)
+        store.coords = coords
+        store.path_offsets = path_offsets
+        store.boundary_offsets = boundary_offsets
+        return store
+
+    @classmethod
+    def from_boundaries(cls, boundaries: Iterable[Dict[str, Any]]) -> 'BoundaryStore':
+        """Build a store from the legacy {'name', 'segments'} dict layout"""
+        if isinstance(boundaries, BoundaryStore):
+            return boundaries
+        store = cls()
+        for boundary in boundaries:
+            store.start_boundary(boundary.get('name'))
+            current = []
+            for segment in boundary.get('segments', []):
+                start = (segment['start']['lat'], segment['start']['lon'])
+                end = (segment['end']['lat'], segment['end']['lon'])
+                if current and current[-1] == start:
+                    current.append(end)
+                else:
+                    store.add_path(current)
+                    current = [start, end]
+            store.add_path(current)
+        return store
+
+    def start_boundary(self, name: str):
+        """Begin a new boundary; later add_path calls belong to it"""
+        self.names.append(name)
+        self.boundary_offsets.append(self.boundary_offsets[-1])
+
+    def add_path(self, path: List[Tuple[float, float]]):
+        """Append one continuous path to the last boundary"""
+        if len(path) < 2:
+            return
+        for lat, lon in path:
+            self.coords.append(lat)
+            self.coords.append(lon)
+        self.path_offsets.append(len(self.coords) // 2)
+        self.boundary_offsets[-1] += 1
+
+    def extend(self, other: 'BoundaryStore'):
+        """Append every boundary of another store"""
+        other = BoundaryStore.from_boundaries(other)
+        vertex_base = self.path_offsets[-1]
+        path_base = self.boundary_offsets[-1]
+        self.names.extend(other.names)
+        self.coords.extend(other.coords)
+        self.path_offsets.extend(offset + vertex_base for offset in other.path_offsets[1:])
+        self.boundary_offsets.extend(offset + path_base for offset in other.boundary_offsets[1:])
+
+    def __add__(self, other: 'BoundaryStore') -> 'BoundaryStore':
+        combined = BoundaryStore()
+        combined.extend(self)
+        combined.extend(other)
+        return combined
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [BoundaryView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("boundary index out of range")
+        return BoundaryView(self, index)
+
+    def path_count(self) -> int:
+        return len(self.path_offsets) - 1
+
+    def segment_count(self) -> int:
+        return self.path_offsets[-1] - self.path_count()
+
+    def path(self, path_index: int) -> List[Tuple[float, float]]:
+        """Vertices of one path as (lat, lon) tuples"""
+        coords = self.coords
+        start = self.path_offsets[path_index] * 2
+        end = self.path_offsets[path_index + 1] * 2
+        return [(coords[j], coords[j + 1]) for j in range(start, end, 2)]
+
+    def boundary_paths(self, index: int) -> List[List[Tuple[float, float]]]:
+        """All paths of one boundary"""
+        return [self.path(p) for p in range(self.boundary_offsets[index], self.boundary_offsets[index + 1])]
+
+    def iter_paths(self) -> Iterator[List[Tuple[float, float]]]:
+        """Every path in the layer, in boundary order"""
+        for p in range(self.path_count()):
+            yield self.path(p)
+
+    def iter_segments(self) -> Iterator[Tuple[Tuple[float, float], Tuple[float, float]]]:
+        """Every (start, end) segment in the layer"""
+        coords = self.coords
+        for p in range(self.path_count()):
+            for vertex in range(self.path_offsets[p], self.path_offsets[p + 1] - 1):
+                j = vertex * 2
+                yield (coords[j], coords[j + 1]), (coords[j + 2], coords[j + 3])
+
+    def merged_paths(self, dedupe_shared: bool = True) -> List[List[Tuple[float, float]]]:
+        """Polylines for drawing the whole layer, with shared sector edges drawn once"""
+        return assemble_paths(self.iter_segments(), dedupe_shared=dedupe_shared)
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Plain-dict copy in the legacy layout, plus 'paths'"""
+        return [
+            {'name': view['name'], 'segments': list(view['segments']), 'paths': view['paths']}
+            for view in self
+        ]
+
+    def __repr__(self) -> str:
+        return f"BoundaryStore({len(self)} boundaries, {self.path_count()} paths)"
+
+
+class BoundaryView(Mapping):
+    """Read-only dict-like view of one boundary in a BoundaryStore"""
+
+    _KEYS = ('name', 'segments', 'paths')
+
+    def __init__(self, store: BoundaryStore, index: int):
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'name':
+            return self._store.names[self._index]
+        if key == 'segments':
+            return SegmentsView(self._store, self._index)
+        if key == 'paths':
+            return self._store.boundary_paths(self._index)
+        raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._KEYS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+
+    def __len__(self) -> int:
+        return len(self._KEYS)
+
+
+class SegmentsView(Sequence):
+    """Segment dicts of one boundary, built on access"""
+
+    def __init__(self, store: BoundaryStore, index: int):
+        self._store = store
+        first_path = store.boundary_offsets[index]
+        last_path = store.boundary_offsets[index + 1]
+        # Vertex ranges of the boundary's paths and cumulative segment counts
+        self._paths = [(store.path_offsets[p], store.path_offsets[p + 1]) for p in range(first_path, last_path)]
+        self._starts = []
+        total = 0
+        for start, end in self._paths:
+            self._starts.append(total)
+            total += end - start - 1
+        self._count = total
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _segment(self, vertex: int) -> Dict[str, Dict[str, float]]:
+        coords = self._store.coords
+        j = vertex * 2
+        return {
+            'start': {'lat': coords[j], 'lon': coords[j + 1]},
+            'end': {'lat': coords[j + 2], 'lon': coords[j + 3]}
+        }
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("segment index out of range")
+        path = bisect_right(self._starts, index) - 1
+        return self._segment(self._paths[path][0] + index - self._starts[path])
+
+    def __iter__(self) -> Iterator[Dict[str, Dict[str, float]]]:
+        for start, end in self._paths:
+            for vertex in range(start, end - 1):
+                yield self._segment(vertex)
+
+
+__all__ = ['BoundaryStore', 'BoundaryView', 'SegmentsView']
@@ -0,0 +1,108 @@
+# coordinates.py
+"""Batch decoding of sector-file coordinate tokens.
+
+Tokens are either DMS (``N026.08.00.000`` / ``E028.14.00.000``) or plain
+decimal degrees. When NumPy is installed the common fixed-width DMS form is
+decoded for a whole list of tokens in one vectorized pass; anything else
+(and everything when NumPy is missing) goes through a small cached decoder.
+Invalid tokens decode to NaN.
+"""
+import math
+import re
+from array import array
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAS_NUMPY = np is not None
+
+_DMS_TOKEN = re.compile(r'^([NSEWnsew])(\d+)\.(\d+)\.(\d+)\.(\d+)$')
+
+# Fixed-width layout: H DDD . MM . SS . FFF
+_FIXED_WIDTH = 14
+_DOT_COLUMNS = (4, 7, 10)
+_DIGIT_COLUMNS = (1, 2, 3, 5, 6, 8, 9, 11, 12, 13)
+_NEGATIVE_HEMISPHERES = b'SWsw'
+_HEMISPHERES = b'NSEWnsew'
+
+
+def is_dms_token(token: str) -> bool:
+    """Return True if the token is a DMS coordinate like N026.08.00.000"""
+    return _DMS_TOKEN.match(token) is not None
+
+
+@lru_cache(maxsize=65536)
+def decode_coordinate_token(token: str) -> float:
+    """Decode one DMS or decimal token to degrees (NaN if invalid)"""
+    match = _DMS_TOKEN.match(token)
+    if match:
+        hemisphere, deg, minutes, sec, frac = match.groups()
+        value = float(deg) + float(minutes) / 60 + (float(sec) + float(frac) / 1000) / 3600
+        return -value if hemisphere in 'SWsw' else value
+    try:
+        return float(token)
+    except ValueError:
+        return math.nan
+
+
+def decode_coordinate_pair(lat_token: str, lon_token: str) -> Optional[Tuple[float, float]]:
+    """Decode a lat/lon token pair, or None if either token is invalid"""
+    lat = decode_coordinate_token(lat_token)
+    lon = decode_coordinate_token(lon_token)
+    if math.isnan(lat) or math.isnan(lon):
+        return None
+    return lat, lon
+
+
+def decode_coordinate_tokens(tokens: Sequence[str]):
+    """Decode a list of tokens into a float64 array (NumPy array when available)"""
+    if np is None:
+        return array('d', map(decode_coordinate_token, tokens))
+
+    count = len(tokens)
+    values = np.full(count, np.nan)
+    if count == 0:
+        return values
+
+    lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=count)
+    fixed = np.flatnonzero(lengths == _FIXED_WIDTH)
+    decoded = np.zeros(count, dtype=bool)
+
+    if len(fixed):
+        text = ''.join([tokens[i] for i in fixed]).encode('latin-1', errors='replace')
+        chars = np.frombuffer(text, dtype=np.uint8).reshape(-1, _FIXED_WIDTH)
+
+        digits = chars[:, _DIGIT_COLUMNS].astype(np.int64) - 48
+        ok = np.isin(chars[:, 0], np.frombuffer(_HEMISPHERES, dtype=np.uint8))
+        ok &= (chars[:, _DOT_COLUMNS] == ord('.')).all(axis=1)
+        ok &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+
+        deg = digits[:, 0] * 100 + digits[:, 1] * 10 + digits[:, 2]
+        minutes = digits[:, 3] * 10 + digits[:, 4]
+        sec = digits[:, 5] * 10 + digits[:, 6]
+        frac = digits[:, 7] * 100 + digits[:, 8] * 10 + digits[:, 9]
+        # Same operation order as decode_coordinate_token so results match exactly
+        result = deg + minutes / 60 + (sec + frac / 1000) / 3600
+        negative = np.isin(chars[:, 0], np.frombuffer(_NEGATIVE_HEMISPHERES, dtype=np.uint8))
+        result = np.where(negative, -result, result)
+
+        values[fixed[ok]] = result[ok]
+        decoded[fixed[ok]] = True
+
+    # Decimal degrees and irregular DMS widths
+    for i in np.flatnonzero(~decoded):
+        values[i] = decode_coordinate_token(tokens[i])
+    return values
+
+
+__all__ = [
+    'HAS_NUMPY',
+    'is_dms_token',
+    'decode_coordinate_token',
+    'decode_coordinate_pair',
+    'decode_coordinate_tokens',
+]
@@ -0,0 +1,319 @@
+# ese_airspace.py
+"""Model of the [AIRSPACE] section of an ESE file.
+
+Sector lines (SECTORLINE + COORD, or CIRCLE_SECTORLINE) are kept once per
+id, with every vertex in one flat float64 array (lat, lon, lat, lon, ...)
+and an offset index, like a BoundaryStore. Sectors (SECTOR) reference
+their BORDER lines by id and carry their floor and ceiling and the OWNER
+and ALTOWNER priority lists of position identifiers.
+
+A CIRCLE_SECTORLINE centred on a name (an airport or navaid, as in
+CIRCLE_SECTORLINE:id:EDDM:5) cannot be placed from the ESE alone; it is
+kept in unresolved_circles until resolve_circles() is given a name lookup.
+
+For lookups each sector's border lines are stitched into closed rings by
+endpoint hashing, and the sector boxes are packed into an R-tree, so
+"which sector and owner covers this point and level" only ray-casts the
+few sectors whose boxes contain the point.
+"""
+import math
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..spatial.geo import destination_point
+from ..spatial.rtree import DEFAULT_NODE_CAPACITY, RTree, path_bbox
+from ..spatial.sector_locator import rings_contain
+from .coordinates import decode_coordinate_pair, decode_coordinate_tokens
+from .ring_assembly import assemble_rings
+
+# Vertices used to approximate a CIRCLE_SECTORLINE
+CIRCLE_SEGMENTS = 72
+# Ceiling (ft) of a sector whose limits cannot be read
+UNLIMITED_FT = 99999
+
+
+class Sector:
+    """One ESE sector: vertical limits, owner priority and the sector lines around it"""
+    __slots__ = ('name', 'floor', 'ceiling', 'owners', 'alt_owners', 'border', 'departure_airports',
+                 'arrival_airports', 'rings', 'bbox')
+
+    def __init__(self, name: str, floor: int, ceiling: int):
+        self.name = name
+        self.floor = floor
+        self.ceiling = ceiling
+        self.owners: Tuple[str, ...] = ()
+        self.alt_owners: List[Tuple[str, Tuple[str, ...]]] = []
+        self.border: Tuple[str, ...] = ()
+        self.departure_airports: Tuple[str, ...] = ()
+        self.arrival_airports: Tuple[str, ...] = ()
+        self.rings: List[List[Tuple[float, float]]] = []
+        self.bbox = None
+
+    def covers_level(self, altitude_ft: Optional[float]) -> bool:
+        """True if the altitude is within [floor, ceiling) (any altitude if None)"""
+        return altitude_ft is None or self.floor <= altitude_ft < self.ceiling
+
+    def contains(self, lat: float, lon: float) -> bool:
+        return rings_contain(self.rings, lat, lon)
+
+    def __repr__(self) -> str:
+        return f"Sector({self.name!r}, {self.floor}-{self.ceiling}, owners={self.owners})"
+
+
+def _level(text: str, default: int) -> int:
+    try:
+        return int(float(text))
+    except ValueError:
+        return default
+
+
+def _radius(text: str) -> float:
+    """Circle radius in NM, 0 if unreadable"""
+    try:
+        radius = float(text)
+    except ValueError:
+        return 0.0
+    return radius if math.isfinite(radius) else 0.0
+
+
+def _circle(lat: float, lon: float, radius_nm: float) -> List[Tuple[float, float]]:
+    """Closed polygon approximating a circle"""
+    return [destination_point(lat, lon, 360.0 * i / CIRCLE_SEGMENTS, radius_nm)
+            for i in range(CIRCLE_SEGMENTS + 1)]
+
+
+class AirspaceModel:
+    """Sector lines and sectors of an ESE file, with a point-and-level sector index"""
+
+    def __init__(self, node_capacity: int = DEFAULT_NODE_CAPACITY):
+        self.node_capacity = node_capacity
+        self.line_ids: List[str] = []
+        self.line_index: Dict[str, int] = {}
+        self.coords = array('d')
+        self.line_offsets = array('I', [0])
+        self.sectors: List[Sector] = []
+        self.sector_index: Dict[str, Sector] = {}
+        # Position identifier (as used by OWNER) -> callsign
+        self.owner_callsigns: Dict[str, str] = {}
+        self.duplicate_lines = 0
+        # (sector line id, centre name, radius NM) of circles centred on a name
+        self.unresolved_circles: List[Tuple[str, str, float]] = []
+        # AIRSPACE lines that could not be read at all
+        self.unparsed_lines = 0
+        self._tree = None
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], positions: Iterable[Dict[str, Any]] = (),
+                   **kwargs) -> 'AirspaceModel':
+        """Build from stripped, non-comment AIRSPACE lines and the ESE positions"""
+        model = cls(**kwargs)
+        for position in positions:
+            identifier = position.get('identifier')
+            if identifier:
+                model.owner_callsigns.setdefault(identifier, position.get('callsign', ''))
+        model.add_lines(lines)
+        return model
+
+    def add_lines(self, lines: Iterable[str]):
+        """Parse AIRSPACE lines; COORD tokens of all sector lines are decoded in one batch"""
+        line_ids = []
+        line_tokens = []  # per new sector line: [lat, lon, lat, lon, ...] tokens
+        circles = {}  # sector line id -> vertices
+        defined = set(self.line_index)
+        tokens = None
+        sector = None
+
+        for line in lines:
+            parts = line.split(':')
+            keyword = parts[0].upper()
+            if keyword == 'COORD':
+                if tokens is not None and len(parts) >= 3:
+                    tokens.append(parts[1].strip().upper())
+                    tokens.append(parts[2].strip().upper())
+            elif keyword == 'SECTORLINE':
+                line_id = parts[1].strip() if len(parts) > 1 else ''
+                tokens = None
+                if line_id in defined:
+                    # Only the first definition of an id is kept
+                    self.duplicate_lines += 1
+                    continue
+                defined.add(line_id)
+                tokens = []
+                line_ids.append(line_id)
+                line_tokens.append(tokens)
+            elif keyword == 'CIRCLE_SECTORLINE':
+                tokens = None
+                line_id = parts[1].strip() if len(parts) > 1 else ''
+                radius = _radius(parts[-1]) if len(parts) >= 4 else 0.0
+                if line_id in defined:
+                    self.duplicate_lines += 1
+                elif radius <= 0 or len(parts) > 5:
+                    self.unparsed_lines += 1
+                elif len(parts) == 4:
+                    # Centred on an airport or navaid name
+                    defined.add(line_id)
+                    self.unresolved_circles.append((line_id, parts[2].strip().upper(), radius))
+                else:
+                    center = decode_coordinate_pair(parts[2].strip().upper(), parts[3].strip().upper())
+                    if center is None:
+                        self.unparsed_lines += 1
+                    else:
+                        defined.add(line_id)
+                        circles[line_id] = _circle(center[0], center[1], radius)
+            elif keyword == 'SECTOR':
+                tokens = None
+                if len(parts) >= 2:
+                    name = parts[1].strip()
+                    floor = _level(parts[2], 0) if len(parts) > 2 else 0
+                    ceiling = _level(parts[3], UNLIMITED_FT) if len(parts) > 3 else UNLIMITED_FT
+                    sector = Sector(name, floor, ceiling)
+                    self.sectors.append(sector)
+                    self.sector_index.setdefault(name, sector)
+            elif sector is not None:
+                values = tuple(part.strip() for part in parts[1:] if part.strip())
+                if keyword == 'OWNER':
+                    sector.owners = values
+                elif keyword == 'ALTOWNER' and values:
+                    sector.alt_owners.append((values[0], values[1:]))
+                elif keyword == 'BORDER':
+                    sector.border = values
+                elif keyword == 'DEPAPT':
+                    sector.departure_airports = values
+                elif keyword == 'ARRAPT':
+                    sector.arrival_airports = values
+
+        values = decode_coordinate_tokens([token for tokens in line_tokens for token in tokens]).tolist()
+        index = 0
+        for line_id, tokens in zip(line_ids, line_tokens):
+            path = []
+            for i in range(index, index + len(tokens) - 1, 2):
+                lat, lon = values[i], values[i + 1]
+                if not (math.isnan(lat) or math.isnan(lon)):
+                    path.append((lat, lon))
+            index += len(tokens)
+            self._add_line(line_id, path)
+        for line_id, path in circles.items():
+            self._add_line(line_id, path)
+        self._tree = None
+
+    def resolve_circles(self, locate: Callable[[str], Optional[Tuple[float, float]]]) -> int:
+        """Place circles centred on a name with locate(name) -> (lat, lon) or None.
+
+        Returns how many were placed; the others stay in unresolved_circles.
+        """
+        unresolved = []
+        for line_id, name, radius in self.unresolved_circles:
+            center = locate(name)
+            if center is None:
+                unresolved.append((line_id, name, radius))
+            else:
+                self._add_line(line_id, _circle(center[0], center[1], radius))
+        placed = len(self.unresolved_circles) - len(unresolved)
+        self.unresolved_circles = unresolved
+        if placed:
+            self._tree = None
+        return placed
+    
+    def _add_line(self, line_id: str, path: List[Tuple[float, float]]):
+        self.line_index[line_id] = len(self.line_ids)
+        self.line_ids.append(line_id)
+        for lat, lon in path:
+            self.coords.append(lat)
+            self.coords.append(lon)
+        self.line_offsets.append(len(self.coords) // 2)
+
+    def __len__(self) -> int:
+        return len(self.sectors)
+
+    @property
+    def line_count(self) -> int:
+        return len(self.line_ids)
+
+    def line_coords(self, line_id: str) -> List[Tuple[float, float]]:
+        """Vertices of a sector line, or [] for an unknown id"""
+        index = self.line_index.get(line_id)
+        if index is None:
+            return []
+        coords = self.coords
+        return [(coords[2 * i], coords[2 * i + 1])
+                for i in range(self.line_offsets[index], self.line_offsets[index + 1])]
+
+    def sector(self, name: str) -> Optional[Sector]:
+        return self.sector_index.get(name)
+
+    def sector_rings(self, sector: Sector) -> List[List[Tuple[float, float]]]:
+        """Closed rings of a sector, stitched from its border lines"""
+        segments = []
+        for line_id in sector.border:
+            path = self.line_coords(line_id)
+            segments.extend(zip(path, path[1:]))
+        return assemble_rings(segments)
+
+    def _build(self):
+        self._tree = RTree(self.node_capacity)
+        for sector in self.sectors:
+            sector.rings = self.sector_rings(sector)
+            if sector.rings:
+                sector.bbox = path_bbox([point for ring in sector.rings for point in ring])
+                self._tree.insert(sector.bbox, sector)
+
+    def sectors_at(self, lat: float, lon: float, altitude_ft: Optional[float] = None) -> List[Sector]:
+        """Sectors containing the point (at the altitude, if given), most specific first"""
+        if self._tree is None:
+            self._build()
+        matches = [sector for sector in self._tree.search_point(lat, lon)
+                   if sector.covers_level(altitude_ft) and sector.contains(lat, lon)]
+
+        def extent(sector):
+            min_lat, min_lon, max_lat, max_lon = sector.bbox
+            return (sector.ceiling - sector.floor, (max_lat - min_lat) * (max_lon - min_lon), sector.name)
+
+        matches.sort(key=extent)
+        return matches
+
+    def owner(self, sector: Sector, online: Optional[Iterable[str]] = None,
+              alternative: Optional[str] = None) -> Optional[str]:
+        """First owner identifier of the sector that is online (any, if online is None).
+
+        alternative names an ALTOWNER list that replaces OWNER for sectors
+        that define it.
+        """
+        owners = sector.owners
+        if alternative is not None:
+            owners = next((alt for name, alt in sector.alt_owners if name == alternative), owners)
+        if online is None:
+            return owners[0] if owners else None
+        online = set(online)
+        for identifier in owners:
+            if identifier in online or self.owner_callsigns.get(identifier) in online:
+                return identifier
+        return None
+
+    def locate(self, lat: float, lon: float, altitude_ft: Optional[float] = None,
+               online: Optional[Iterable[str]] = None, alternative: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Sector and owning position covering a point and level, or None.
+
+        online (position identifiers or callsigns) skips owners that are not
+        staffed, falling through to the next sector covering the point;
+        alternative selects an ALTOWNER list (see owner()).
+        Returns {'sector', 'floor', 'ceiling', 'owner', 'callsign'}.
+        """
+        if online is not None:
+            online = set(online)
+        for sector in self.sectors_at(lat, lon, altitude_ft):
+            owner = self.owner(sector, online, alternative)
+            if owner is not None:
+                return {'sector': sector.name, 'floor': sector.floor, 'ceiling': sector.ceiling,
+                        'owner': owner, 'callsign': self.owner_callsigns.get(owner, owner)}
+        return None
+
+    def locate_many(self, points: Sequence[Sequence[float]], online: Optional[Iterable[str]] = None,
+                    alternative: Optional[str] = None) -> List[Optional[Dict[str, Any]]]:
+        """locate() many (lat, lon) or (lat, lon, altitude_ft) points in one call"""
+        if online is not None:
+            online = set(online)
+        return [self.locate(point[0], point[1], point[2] if len(point) > 2 else None, online, alternative)
+                for point in points]
+
+
+__all__ = ['AirspaceModel', 'Sector', 'CIRCLE_SEGMENTS']
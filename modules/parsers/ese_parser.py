@@ -1,199 +1,249 @@
-import re
+import os
+
+from .coordinates import decode_coordinate_token, is_dms_token
+from .ese_airspace import AirspaceModel
+from .ese_positions import PositionTable
+from .section_index import read_section_lines
 
 class ESEParser:
-    def __init__(self, ese_filepath):
+    """Parser for EuroScope ESE files.
+    
+    The file is read the first time any data is asked for (or when parse()
+    is called). That read is a single streaming pass: POSITIONS and
+    SIDSSTARS lines go straight to their line handlers, while the bulky
+    AIRSPACE, RADAR and FREETEXT sections are only located by byte range
+    and parsed on first access. get_airspace_model() reads AIRSPACE into
+    an AirspaceModel of sector lines, sectors and owners instead.
+    
+    Position coordinates are decoded once, at parse time, into a
+    PositionTable that the map and the controller list share.
+    
+    API note: constructing a parser no longer reads the file (pass
+    load=True for the old eager behaviour), and data is a property that
+    parses every pending section before returning the dict; assigning it
+    replaces the parsed data. The size and modification time of the file
+    are recorded when it is streamed; if they differ when a lazy section
+    is first read, the file is streamed again rather than read by stale
+    byte ranges.
+    """
+    # Section name -> data key
+    SECTION_KEYS = {
+        'POSITIONS': 'positions',
+        'SIDSSTARS': 'sidsstars',
+        'AIRSPACE': 'airspace',
+        'RADAR': 'radar',
+        'FREETEXT': 'freetext',
+    }
+    # Sections parsed while streaming the file; the others wait for first access
+    EAGER_SECTIONS = ('POSITIONS', 'SIDSSTARS')
+    
+    def __init__(self, ese_filepath, load=False):
         self.ese_filepath = ese_filepath
-        self.data = {
-            'positions': [],
-            'sidsstars': [],
-            'airspace': [],
-            'radar': [],
-            'freetext': [],
-        }
-        self.parse()
+        self._data = {key: [] for key in self.SECTION_KEYS.values()}
+        self._section_ranges = {}  # lazy section -> [(body start, body end)]
+        self._parsed_sections = set()
+        self._airspace_model = None
+        self._position_table = PositionTable()
+        self._source_stat = None  # (size, mtime_ns) of the file when it was streamed
+        self._loaded = False
+        if load:
+            self.parse()
+    
+    @property
+    def data(self):
+        """Every section's data, parsing whatever has not been read yet"""
+        for section in self.SECTION_KEYS:
+            self._ensure_section(section)
+        return self._data
+    
+    @data.setter
+    def data(self, value):
+        self._ensure_loaded()
+        self._data = value
+        self._parsed_sections = set(self.SECTION_KEYS)
+        self._airspace_model = None
+        self._position_table = PositionTable(value.get('positions', []))
     
     def parse(self):
-        with open(self.ese_filepath, 'r', encoding='latin-1') as f:
-            content = f.read()
-        
-        sections = self._split_sections(content)
+        """Stream the file once, parsing the eager sections and indexing the lazy ones"""
+        self._data = {key: [] for key in self.SECTION_KEYS.values()}
+        self._section_ranges = {}
+        self._parsed_sections = set()
+        self._airspace_model = None
         
-        for section_name, section_content in sections.items():
-            if section_name == 'POSITIONS':
-                self.data['positions'] = self._parse_positions(section_content)
-            elif section_name == 'SIDSSTARS':
-                self.data['sidsstars'] = self._parse_sidsstars(section_content)
-            elif section_name == 'AIRSPACE':
-                self.data['airspace'] = self._parse_airspace(section_content)
-            elif section_name == 'RADAR':
-                self.data['radar'] = self._parse_radar(section_content)
-            elif section_name == 'FREETEXT':
-                self.data['freetext'] = self._parse_freetext(section_content)
-    
-    def _split_sections(self, content):
-        sections = {}
-        current_section = None
-        current_content = []
-        
-        for line in content.split('\n'):
-            if line.strip().startswith('[') and line.strip().endswith(']'):
-                if current_section:
-                    sections[current_section] = '\n'.join(current_content)
+        handler = None
+        items = None
+        lazy_ranges = None
+        offset = 0
+        with open(self.ese_filepath, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            self._source_stat = (stat.st_size, stat.st_mtime_ns)
+            for raw_line in f:
+                line_start = offset
+                offset += len(raw_line)
+                
+                line = raw_line.strip()
+                if line.startswith(b'[') and line.endswith(b']'):
+                    if lazy_ranges is not None:
+                        lazy_ranges[-1] = (lazy_ranges[-1][0], line_start)
+                    section = line[1:-1].decode('latin-1')
+                    handler = items = lazy_ranges = None
+                    key = self.SECTION_KEYS.get(section)
+                    if key is None:
+                        continue
+                    if section in self.EAGER_SECTIONS:
+                        handler = self._line_handler(section)
+                        items = self._data[key]
+                    else:
+                        # Only remember where the body is; it is parsed on first access
+                        lazy_ranges = self._section_ranges.setdefault(section, [])
+                        lazy_ranges.append((offset, offset))
+                    continue
                 
-                current_section = line.strip()[1:-1]
-                current_content = []
-            else:
-                current_content.append(line)
+                if handler is None or not line or line.startswith(b';'):
+                    continue
+                item = handler(line.decode('latin-1'))
+                if item is not None:
+                    items.append(item)
         
-        if current_section:
-            sections[current_section] = '\n'.join(current_content)
+        if lazy_ranges is not None:
+            lazy_ranges[-1] = (lazy_ranges[-1][0], offset)
+        self._position_table = PositionTable(self._data['positions'])
+        self._loaded = True
+    
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.parse()
+    
+    def _ensure_current(self):
+        """Stream the file again if it changed since its byte ranges were recorded"""
+        self._ensure_loaded()
+        stat = os.stat(self.ese_filepath)
+        if (stat.st_size, stat.st_mtime_ns) != self._source_stat:
+            print(f"ESE file changed on disk, re-reading: {self.ese_filepath}")
+            self.parse()
+    
+    def _ensure_section(self, section):
+        """Parse a lazy section from its recorded byte ranges on first access"""
+        self._ensure_loaded()
+        if section in self.EAGER_SECTIONS or section in self._parsed_sections:
+            return
+        self._ensure_current()
+        self._parsed_sections.add(section)
         
-        return sections
-    
-    def _parse_positions(self, content):
-        positions = []
-        for line in content.split('\n'):
-            line = line.strip()
-            if not line or line.startswith(';'):
-                continue
-            
-            parts = line.split(':')
-            if len(parts) >= 11:
-                position = {
-                    'callsign': parts[0],
-                    'name': parts[1],
-                    'frequency': parts[2],
-                    'identifier': parts[3],
-                    'prefix': parts[4],
-                    'suffix': parts[5],
-                    'type': parts[6],
-                    'mid': parts[7],
-                    'vis_center1': parts[10] if len(parts) > 10 else '',
-                    'vis_center2': parts[11] if len(parts) > 11 else '',
-                }
-                
-                coords = []
-                for i in range(10, len(parts)):
-                    if self._is_coordinate(parts[i]):
-                        coords.append(parts[i])
-                position['coordinates'] = coords
-                
-                positions.append(position)
+        handler = self._line_handler(section)
+        items = self._data[self.SECTION_KEYS[section]]
+        for line in self._iter_section_lines(section):
+            item = handler(line)
+            if item is not None:
+                items.append(item)
+    
+    def _iter_section_lines(self, section):
+        """Stripped, non-comment lines of a lazy section, read from its byte ranges"""
+        self._ensure_loaded()
+        for start, end in self._section_ranges.get(section, ()):
+            for line in read_section_lines(self.ese_filepath, start, end):
+                line = line.strip()
+                if line and not line.startswith(';'):
+                    yield line
+    
+    def _line_handler(self, section):
+        """Function turning one stripped, non-comment line of a section into an item (or None)"""
+        if section == 'POSITIONS':
+            return self._parse_position_line
+        if section == 'SIDSSTARS':
+            return self._parse_sidsstar_line
+        # AIRSPACE, RADAR and FREETEXT are kept as raw lines
+        return str
+    
+    def _parse_position_line(self, line):
+        parts = line.split(':')
+        if len(parts) < 11:
+            return None
         
-        return positions
-    
-    def _parse_sidsstars(self, content):
-        sidsstars = []
-        for line in content.split('\n'):
-            line = line.strip()
-            if not line or line.startswith(';'):
-                continue
-            
-            parts = line.split(':')
-            if len(parts) >= 4:
-                sidsstar = {
-                    'type': parts[0],
-                    'airport': parts[1],
-                    'runway': parts[2],
-                    'name': parts[3],
-                    'waypoints': parts[4].split() if len(parts) > 4 else []
-                }
-                sidsstars.append(sidsstar)
+        position = {
+            'callsign': parts[0],
+            'name': parts[1],
+            'frequency': parts[2],
+            'identifier': parts[3],
+            'prefix': parts[4],
+            'suffix': parts[5],
+            'type': parts[6],
+            'mid': parts[7],
+            'vis_center1': parts[10] if len(parts) > 10 else '',
+            'vis_center2': parts[11] if len(parts) > 11 else '',
+        }
         
-        return sidsstars
-    
-    def _parse_airspace(self, content):
-        airspace = []
-        for line in content.split('\n'):
-            line = line.strip()
-            if not line or line.startswith(';'):
-                continue
-            airspace.append(line)
-        return airspace
-    
-    def _parse_radar(self, content):
-        radar = []
-        for line in content.split('\n'):
-            line = line.strip()
-            if not line or line.startswith(';'):
-                continue
-            radar.append(line)
-        return radar
-    
-    def _parse_freetext(self, content):
-        freetext = []
-        for line in content.split('\n'):
-            line = line.strip()
-            if not line or line.startswith(';'):
-                continue
-            freetext.append(line)
-        return freetext
+        coords = []
+        for i in range(10, len(parts)):
+            if self._is_coordinate(parts[i]):
+                coords.append(parts[i])
+        position['coordinates'] = coords
+        return position
+    
+    def _parse_sidsstar_line(self, line):
+        parts = line.split(':')
+        if len(parts) < 4:
+            return None
+        
+        return {
+            'type': parts[0],
+            'airport': parts[1],
+            'runway': parts[2],
+            'name': parts[3],
+            'waypoints': parts[4].split() if len(parts) > 4 else []
+        }
     
     def _is_coordinate(self, text):
-        return bool(re.match(r'^[NS]\d+\.\d+\.\d+\.\d+$', text, re.IGNORECASE) or
-                   re.match(r'^[EW]\d+\.\d+\.\d+\.\d+$', text, re.IGNORECASE))
+        return is_dms_token(text)
     
     def get_positions(self):
-        return self.data['positions']
+        self._ensure_loaded()
+        return self._data['positions']
     
     def get_sidsstars(self):
-        return self.data['sidsstars']
+        self._ensure_loaded()
+        return self._data['sidsstars']
+    
+    def get_airspace(self):
+        self._ensure_section('AIRSPACE')
+        return self._data['airspace']
+    
+    def get_airspace_model(self):
+        """Sector lines, sectors and owners of the AIRSPACE section, built on first use"""
+        if self._airspace_model is None:
+            self._ensure_current()
+            # Straight from the file, without keeping the raw lines
+            self._airspace_model = AirspaceModel.from_lines(self._iter_section_lines('AIRSPACE'),
+                                                            self.get_positions())
+        return self._airspace_model
+    
+    def get_radar(self):
+        self._ensure_section('RADAR')
+        return self._data['radar']
+    
+    def get_freetext(self):
+        self._ensure_section('FREETEXT')
+        return self._data['freetext']
+    
+    def get_position_table(self):
+        """Positions decoded once into columns, indexed by callsign, type and airport prefix"""
+        self._ensure_loaded()
+        return self._position_table
     
     def get_all_coordinates(self):
-        coordinates = []
-        for position in self.data['positions']:
-            if 'coordinates' in position:
-                lat = None
-                lon = None
-                
-                for coord in position['coordinates']:
-                    parsed = self._parse_coordinate(coord)
-                    if parsed:
-                        if parsed[0] is not None:
-                            lat = parsed[0]
-                        if parsed[1] is not None:
-                            lon = parsed[1]
-                
-                if lat is not None and lon is not None:
-                    coordinates.append({
-                        'lat': lat,
-                        'lon': lon,
-                        'name': position['callsign'],
-                        'type': 'POSITION'
-                    })
-        return coordinates
+        """Map points of every position with a visibility centre, from the position table"""
+        return self.get_position_table().coordinates()
     
     def _parse_coordinate(self, coord_str):
         if not coord_str:
             return None
         
         coord_str = coord_str.strip().upper()
+        if not is_dms_token(coord_str):
+            return None
         
-        lat_match = re.match(r'^([NS])(\d+)\.(\d+)\.(\d+)\.(\d+)$', coord_str)
-        lon_match = re.match(r'^([EW])(\d+)\.(\d+)\.(\d+)\.(\d+)$', coord_str)
-        
-        if lat_match:
-            direction = lat_match.group(1)
-            degrees = float(lat_match.group(2))
-            minutes = float(lat_match.group(3))
-            seconds = float(lat_match.group(4))
-            decimal = float(lat_match.group(5)) / 1000.0
-            
-            lat = degrees + minutes/60 + (seconds + decimal)/3600
-            if direction == 'S':
-                lat = -lat
-            return (lat, None)
-        
-        if lon_match:
-            direction = lon_match.group(1)
-            degrees = float(lon_match.group(2))
-            minutes = float(lon_match.group(3))
-            seconds = float(lon_match.group(4))
-            decimal = float(lon_match.group(5)) / 1000.0
-            
-            lon = degrees + minutes/60 + (seconds + decimal)/3600
-            if direction == 'W':
-                lon = -lon
-            return (None, lon)
-        
-        return None
\ No newline at end of file
+        value = decode_coordinate_token(coord_str)
+        if coord_str[0] in 'NS':
+            return (value, None)
+        return (None, value)
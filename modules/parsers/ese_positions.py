@@ -0,0 +1,120 @@
+# ese_positions.py
+"""Controller positions of an ESE file as a precomputed table.
+
+Every position's visibility-centre tokens are decoded once, in one batch,
+into parallel columns (callsign, type, frequency, lat, lon). Rows are
+indexed by callsign, by type and by airport prefix (the callsign up to the
+first '_'), so filtered queries cost the size of their result rather than
+a scan of every position.
+"""
+import math
+from array import array
+from typing import Any, Dict, Iterable, List, Optional
+
+from .coordinates import decode_coordinate_tokens, is_dms_token
+
+
+def callsign_prefix(callsign: str) -> str:
+    """Airport (or FIR) prefix of a callsign: EDDM_TWR -> EDDM"""
+    return callsign.split('_', 1)[0]
+
+
+class PositionTable:
+    """Decoded ESE positions in columns, with callsign, type and prefix indexes"""
+
+    def __init__(self, positions: Iterable[Dict[str, Any]] = ()):
+        self.positions: List[Dict[str, Any]] = list(positions)
+        self.callsigns = [position.get('callsign', '') for position in self.positions]
+        self.types = [position.get('type', '') for position in self.positions]
+        self.frequencies = [position.get('frequency', '') for position in self.positions]
+        # NaN where a position has no visibility centre
+        self.lats = array('d')
+        self.lons = array('d')
+
+        self.by_callsign: Dict[str, int] = {}
+        self.by_type: Dict[str, List[int]] = {}
+        self.by_prefix: Dict[str, List[int]] = {}
+        self.located: List[int] = []
+
+        self._decode()
+        for row, callsign in enumerate(self.callsigns):
+            self.by_callsign.setdefault(callsign, row)
+            self.by_type.setdefault(self.types[row], []).append(row)
+            self.by_prefix.setdefault(callsign_prefix(callsign), []).append(row)
+            if not math.isnan(self.lats[row]):
+                self.located.append(row)
+
+    def _decode(self):
+        """Fill lat/lon from each position's coordinate tokens (the last N/S and E/W ones win)"""
+        tokens = [token.strip().upper() for position in self.positions
+                  for token in position.get('coordinates', ())]
+        values = decode_coordinate_tokens(tokens).tolist()
+
+        index = 0
+        for position in self.positions:
+            lat = lon = math.nan
+            for _ in position.get('coordinates', ()):
+                token = tokens[index]
+                value = values[index]
+                index += 1
+                if value != value or not is_dms_token(token):
+                    continue
+                if token[0] in 'NS':
+                    lat = value
+                else:
+                    lon = value
+            if math.isnan(lat) or math.isnan(lon):
+                lat = lon = math.nan
+            self.lats.append(lat)
+            self.lons.append(lon)
+
+    def __len__(self) -> int:
+        return len(self.callsigns)
+
+    def find(self, callsign: str) -> Optional[int]:
+        """Row of a callsign, or None"""
+        return self.by_callsign.get(callsign)
+
+    def row(self, row: int) -> Dict[str, Any]:
+        """One row as {'callsign', 'type', 'frequency', 'lat', 'lon'} (lat/lon None if unknown)"""
+        lat = self.lats[row]
+        located = not math.isnan(lat)
+        return {'callsign': self.callsigns[row], 'type': self.types[row], 'frequency': self.frequencies[row],
+                'lat': lat if located else None, 'lon': self.lons[row] if located else None}
+
+    def select(self, position_type: Optional[str] = None, prefix: Optional[str] = None,
+               located: bool = False) -> List[int]:
+        """Rows matching every given filter, in file order.
+
+        The smallest matching index is walked and the other filters are
+        checked per row, so the cost follows the result, not the table.
+        """
+        candidates = []
+        if position_type is not None:
+            candidates.append(self.by_type.get(position_type, []))
+        if prefix is not None:
+            candidates.append(self.by_prefix.get(prefix, []))
+        if located:
+            candidates.append(self.located)
+        if not candidates:
+            return list(range(len(self)))
+
+        rows = min(candidates, key=len)
+        return [row for row in rows
+                if (position_type is None or self.types[row] == position_type)
+                and (prefix is None or callsign_prefix(self.callsigns[row]) == prefix)
+                and (not located or not math.isnan(self.lats[row]))]
+
+    def positions_of(self, rows: Iterable[int]) -> List[Dict[str, Any]]:
+        """Position dicts (as parsed) of some rows"""
+        return [self.positions[row] for row in rows]
+
+    def coordinates(self, rows: Optional[Iterable[int]] = None) -> List[Dict[str, Any]]:
+        """Map points {'lat', 'lon', 'name', 'type'} of the located rows (of some rows, if given)"""
+        if rows is None:
+            rows = self.located
+        return [{'lat': self.lats[row], 'lon': self.lons[row], 'name': self.callsigns[row], 'type': 'POSITION'}
+                for row in rows if not math.isnan(self.lats[row])]
+
+
+__all__ = ['PositionTable', 'callsign_prefix']
@@ -0,0 +1,108 @@
+# ring_assembly.py
+"""Stitch boundary segments into maximal polylines and closed rings.
+
+Segment endpoints are quantized and hashed, so joining does not depend on
+the order or direction the segments appear in the file. An endpoint joins
+the first vertex within the tolerance in its own or a neighbouring bucket,
+so points that round to different buckets still meet. Every segment is
+visited once: open chains are walked from their end points and junctions
+first, then whatever is left can only form closed rings.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+from ..spatial.geo import closed_rings
+
+Point = Tuple[float, float]
+Key = Tuple[int, int]
+
+# Endpoints closer than this on both axes (degrees, ~10 m) are treated as the same vertex
+DEFAULT_QUANTUM = 1e-4
+
+_NEIGHBOURS = [(d_row, d_col) for d_row in (0, -1, 1) for d_col in (0, -1, 1)]
+
+
+def _vertex_key(point: Point, quantum: float, vertices: Dict[Key, Point]) -> Key:
+    """Key of the vertex a point joins, adding a new vertex if none is close enough"""
+    row, col = round(point[0] / quantum), round(point[1] / quantum)
+    for d_row, d_col in _NEIGHBOURS:
+        key = (row + d_row, col + d_col)
+        vertex = vertices.get(key)
+        if vertex is not None and abs(vertex[0] - point[0]) < quantum and abs(vertex[1] - point[1]) < quantum:
+            return key
+    # Points sharing a bucket are within the tolerance, so the bucket is normally free here
+    vertices.setdefault((row, col), point)
+    return row, col
+
+
+def assemble_paths(segments: Iterable[Tuple[Point, Point]], quantum: float = DEFAULT_QUANTUM,
+                   dedupe_shared: bool = False) -> List[List[Point]]:
+    """Join (start, end) segments into polylines; closed rings repeat their first point.
+
+    With dedupe_shared=True a segment whose endpoints match an earlier one
+    (in either direction) is dropped, so edges shared by neighbouring
+    sectors are only kept once.
+    """
+    vertices: Dict[Key, Point] = {}
+    edges: List[Tuple[Key, Key]] = []
+    incident: Dict[Key, List[int]] = {}
+    seen = set()
+
+    for start, end in segments:
+        a = _vertex_key(start, quantum, vertices)
+        b = _vertex_key(end, quantum, vertices)
+        if a == b:
+            continue
+        if dedupe_shared:
+            edge_key = (a, b) if a < b else (b, a)
+            if edge_key in seen:
+                continue
+            seen.add(edge_key)
+        incident.setdefault(a, []).append(len(edges))
+        incident.setdefault(b, []).append(len(edges))
+        edges.append((a, b))
+
+    used = [False] * len(edges)
+
+    def walk(node, edge_index):
+        keys = [node]
+        while True:
+            used[edge_index] = True
+            a, b = edges[edge_index]
+            node = b if a == node else a
+            keys.append(node)
+            # Only pass straight through simple (degree 2) vertices
+            if len(incident[node]) != 2:
+                break
+            edge_index = next((e for e in incident[node] if not used[e]), None)
+            if edge_index is None:
+                break
+        return [vertices[key] for key in keys]
+
+    paths = []
+    # Open chains start at dead ends and junctions
+    for node, node_edges in incident.items():
+        if len(node_edges) != 2:
+            for edge_index in node_edges:
+                if not used[edge_index]:
+                    paths.append(walk(node, edge_index))
+
+    # Everything left is made of degree-2 vertices, i.e. closed rings
+    for edge_index, (a, _) in enumerate(edges):
+        if not used[edge_index]:
+            paths.append(walk(a, edge_index))
+
+    return paths
+
+
+def assemble_rings(segments: Iterable[Tuple[Point, Point]],
+                   quantum: float = DEFAULT_QUANTUM) -> List[List[Point]]:
+    """Closed rings (end point not repeated) stitched from segments; a lone open path is closed implicitly"""
+    return closed_rings(assemble_paths(segments, quantum))
+
+
+def is_closed(path: List[Point]) -> bool:
+    """True if the path is a closed ring"""
+    return len(path) > 3 and path[0] == path[-1]
+
+
+__all__ = ['DEFAULT_QUANTUM', 'assemble_paths', 'assemble_rings', 'is_closed']
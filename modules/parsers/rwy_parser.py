@@ -1,5 +1,10 @@
 import re
 
+from .coordinates import decode_coordinate_tokens
+
+# Lines parsed between progress reports
+PROGRESS_LINES = 5000
+
 class RWYParser:
     def __init__(self, file_path=None):
         self.file_path = file_path
@@ -7,7 +12,9 @@ class RWYParser:
         self.ils_data = []
         self.centerlines = []  # Store runway centerlines
         
-    def parse(self, file_path=None):
+    def parse(self, file_path=None, progress=None):
+        """Parse the RWY file; progress(fraction) is called every few thousand
+        lines, and an exception raised by it stops the parse"""
         if file_path:
             self.file_path = file_path
             
@@ -19,7 +26,9 @@ class RWYParser:
         
         lines = content.split('\n')
         
-        for line in lines:
+        for count, line in enumerate(lines, 1):
+            if progress and count % PROGRESS_LINES == 0:
+                progress(count / len(lines))
             line = line.strip()
             
             if not line or line.startswith(';'):
@@ -41,6 +50,8 @@ class RWYParser:
             elif any(x in line for x in ['CENTERLINE', 'CLINE']):
                 self.parse_centerline_line(line)
         
+        if progress:
+            progress(1.0)
         return self.get_data()
     
     def parse_ils_line(self, line):
@@ -49,18 +60,15 @@ class RWYParser:
         if len(parts) >= 5:
             try:
                 ils_name = parts[0]  # e.g., ILS21L
-                glideslope_lat = float(parts[1])
-                glideslope_lon = float(parts[2])
-                localizer_lat = float(parts[3])
-                localizer_lon = float(parts[4])
+                glideslope, localizer = self._parse_coordinate_list(parts[1:5])
                 
                 runway_num = ils_name.replace('ILS', '')
                 
                 self.ils_data.append({
                     'name': ils_name,
                     'runway': runway_num,
-                    'glideslope': (glideslope_lat, glideslope_lon),
-                    'localizer': (localizer_lat, localizer_lon),
+                    'glideslope': glideslope,
+                    'localizer': localizer,
                     'type': 'ILS'
                 })
                 
@@ -73,12 +81,7 @@ class RWYParser:
         if len(parts) >= 4:
             try:
                 rwy_num = parts[1]
-                coordinates = []
-                
-                for i in range(2, len(parts)-1, 2):
-                    lat = float(parts[i])
-                    lon = float(parts[i+1])
-                    coordinates.append((lat, lon))
+                coordinates = self._parse_coordinate_list(parts[2:])
                 
                 if coordinates:
                     runway_data = {
@@ -106,12 +109,7 @@ class RWYParser:
             if len(parts) >= 4:
                 try:
                     rwy_num = parts[1]
-                    coordinates = []
-                    
-                    for i in range(2, len(parts)-1, 2):
-                        lat = float(parts[i])
-                        lon = float(parts[i+1])
-                        coordinates.append((lat, lon))
+                    coordinates = self._parse_coordinate_list(parts[2:])
                     
                     if coordinates:
                         runway_data = {
@@ -140,12 +138,7 @@ class RWYParser:
             if len(parts) >= 4:
                 try:
                     name = parts[1]
-                    coordinates = []
-                    
-                    for i in range(2, len(parts)-1, 2):
-                        lat = float(parts[i])
-                        lon = float(parts[i+1])
-                        coordinates.append((lat, lon))
+                    coordinates = self._parse_coordinate_list(parts[2:])
                     
                     if coordinates:
                         self.centerlines.append({
@@ -157,6 +150,14 @@ class RWYParser:
                 except (ValueError, IndexError):
                     pass
     
+    def _parse_coordinate_list(self, tokens):
+        """Decode lat:lon token pairs (decimal or DMS) in one batch"""
+        tokens = [token.strip() for token in tokens[:len(tokens) - len(tokens) % 2]]
+        values = decode_coordinate_tokens(tokens).tolist()
+        if any(value != value for value in values):
+            raise ValueError("Invalid coordinate in RWY line")
+        return list(zip(values[0::2], values[1::2]))
+    
     def get_ils_for_runway(self, runway_number):
         """Get ILS data for specific runway"""
         for ils in self.ils_data:
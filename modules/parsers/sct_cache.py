@@ -0,0 +1,233 @@
+# sct_cache.py
+"""Compact binary cache format for parsed SCT models.
+
+Layout (all integers little-endian):
+
+    magic        4s   b'SCTC'
+    version      H    CACHE_FORMAT_VERSION
+    flags        H    FLAG_ZLIB when the body is zlib-compressed
+    header_len   I    length of the JSON header in bytes
+    header       JSON non-coordinate fields plus array descriptors
+    body         concatenated packed arrays, optionally compressed
+
+Coordinates never go through JSON: every section keeps its lat/lon pairs in
+one packed float64 array, with uint32 offset arrays describing where each
+runway, taxiway, path and boundary starts.
+"""
+import json
+import struct
+import sys
+import zlib
+from array import array
+from typing import Any, Dict, List
+
+from .boundary_store import BoundaryStore
+
+CACHE_MAGIC = b'SCTC'
+# Bumped whenever cached models would differ from a fresh parse
+# (2: E/W decoding, 3: boundary ring assembly)
+CACHE_FORMAT_VERSION = 3
+FLAG_ZLIB = 0x1
+
+_PREAMBLE = struct.Struct('<4sHHI')
+_ZLIB_LEVEL = 1
+_BOUNDARY_SECTIONS = ('ARTCC_HIGH', 'ARTCC_LOW')
+
+
+class CacheFormatError(ValueError):
+    """Raised when a cache file is not a readable SCTC file"""
+
+
+class _ArrayWriter:
+    """Collect packed arrays and their descriptors for the body"""
+
+    def __init__(self):
+        self.descriptors: Dict[str, List] = {}
+        self.chunks: List[bytes] = []
+        self.size = 0
+
+    def add(self, name: str, typecode: str, values) -> None:
+        packed = array(typecode, values)
+        if sys.byteorder == 'big':
+            packed.byteswap()
+        data = packed.tobytes()
+        self.descriptors[name] = [typecode, self.size, len(packed)]
+        self.chunks.append(data)
+        self.size += len(data)
+
+
+def _read_array(body: memoryview, descriptors: Dict[str, List], name: str) -> array:
+    typecode, offset, count = descriptors[name]
+    values = array(typecode)
+    values.frombytes(body[offset:offset + count * values.itemsize])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _flatten_points(items: List, lat_index, lon_index) -> List[float]:
+    flat = []
+    for item in items:
+        flat.append(item[lat_index])
+        flat.append(item[lon_index])
+    return flat
+
+
+def _pack_polylines(writer: _ArrayWriter, prefix: str, polylines: List[List]) -> None:
+    coords = []
+    offsets = [0]
+    for line in polylines:
+        for lat, lon in line:
+            coords.append(lat)
+            coords.append(lon)
+        offsets.append(len(coords) // 2)
+    writer.add(f'{prefix}.coords', 'd', coords)
+    writer.add(f'{prefix}.offsets', 'I', offsets)
+
+
+def _unpack_polylines(body, descriptors, prefix: str) -> List[List[List[float]]]:
+    coords = _read_array(body, descriptors, f'{prefix}.coords')
+    offsets = _read_array(body, descriptors, f'{prefix}.offsets')
+    polylines = []
+    for i in range(len(offsets) - 1):
+        start, end = offsets[i] * 2, offsets[i + 1] * 2
+        polylines.append([[coords[j], coords[j + 1]] for j in range(start, end, 2)])
+    return polylines
+
+
+def encode_model(model: Dict[str, Any], compress: bool = True) -> bytes:
+    """Encode a model dict (SCTParser._model_to_dict layout) to SCTC bytes"""
+    writer = _ArrayWriter()
+
+    airports = model.get('airports', [])
+    fixes = model.get('fixes', [])
+    header: Dict[str, Any] = {
+        'metadata': model.get('metadata', {}),
+        'version': model.get('version', ""),
+        'frequencies': model.get('frequencies', []),
+        'airports': {
+            'icao': [a.get('icao') for a in airports],
+            'name': [a.get('name') for a in airports],
+        },
+        'fixes': {'name': [f.get('name') for f in fixes]},
+    }
+    writer.add('airports.coords', 'd', _flatten_points(airports, 'latitude', 'longitude'))
+    writer.add('fixes.coords', 'd', _flatten_points(fixes, 'latitude', 'longitude'))
+
+    for key in ('VOR', 'NDB'):
+        navaids = model.get(key, [])
+        header[key] = {
+            'id': [n[0] for n in navaids],
+            'name': [n[1] for n in navaids],
+            'freq': [n[2] for n in navaids],
+        }
+        writer.add(f'{key}.coords', 'd', _flatten_points(navaids, 3, 4))
+
+    runways = model.get('runways', [])
+    header['runways'] = [{k: v for k, v in r.items() if k != 'coordinates'} for r in runways]
+    _pack_polylines(writer, 'runways', [r['coordinates'] for r in runways])
+    _pack_polylines(writer, 'taxiways', model.get('taxiways', []))
+
+    # Boundary stores are already packed, so their arrays are written as-is
+    for section in _BOUNDARY_SECTIONS:
+        store = BoundaryStore.from_boundaries(model.get(section, []))
+        header[section] = {'name': store.names}
+        writer.add(f'{section}.paths.coords', 'd', store.coords)
+        writer.add(f'{section}.paths.offsets', 'I', store.path_offsets)
+        writer.add(f'{section}.boundary_offsets', 'I', store.boundary_offsets)
+
+    header['arrays'] = writer.descriptors
+    header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    body = b''.join(writer.chunks)
+    flags = 0
+    if compress:
+        body = zlib.compress(body, _ZLIB_LEVEL)
+        flags |= FLAG_ZLIB
+
+    preamble = _PREAMBLE.pack(CACHE_MAGIC, CACHE_FORMAT_VERSION, flags, len(header_bytes))
+    return preamble + header_bytes + body
+
+
+def decode_model(data: bytes) -> Dict[str, Any]:
+    """Decode SCTC bytes back into a model dict"""
+    if len(data) < _PREAMBLE.size:
+        raise CacheFormatError("Cache file is truncated")
+
+    magic, version, flags, header_len = _PREAMBLE.unpack_from(data)
+    if magic != CACHE_MAGIC:
+        raise CacheFormatError("Not an SCT binary cache file")
+    if version != CACHE_FORMAT_VERSION:
+        raise CacheFormatError(f"Unsupported cache format version {version}")
+
+    header_end = _PREAMBLE.size + header_len
+    header = json.loads(data[_PREAMBLE.size:header_end].decode('utf-8'))
+    body = data[header_end:]
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+    body = memoryview(body)
+    descriptors = header['arrays']
+
+    coords = _read_array(body, descriptors, 'airports.coords')
+    airports = [
+        {'icao': icao, 'latitude': coords[2 * i], 'longitude': coords[2 * i + 1], 'name': name}
+        for i, (icao, name) in enumerate(zip(header['airports']['icao'], header['airports']['name']))
+    ]
+
+    coords = _read_array(body, descriptors, 'fixes.coords')
+    fixes = [
+        {'name': name, 'latitude': coords[2 * i], 'longitude': coords[2 * i + 1]}
+        for i, name in enumerate(header['fixes']['name'])
+    ]
+
+    model: Dict[str, Any] = {
+        'metadata': header['metadata'],
+        'version': header['version'],
+        'frequencies': header['frequencies'],
+        'airports': airports,
+        'fixes': fixes,
+    }
+
+    for key in ('VOR', 'NDB'):
+        coords = _read_array(body, descriptors, f'{key}.coords')
+        fields = header[key]
+        model[key] = [
+            [navaid_id, name, freq, coords[2 * i], coords[2 * i + 1]]
+            for i, (navaid_id, name, freq) in enumerate(zip(fields['id'], fields['name'], fields['freq']))
+        ]
+
+    runway_coords = _unpack_polylines(body, descriptors, 'runways')
+    model['runways'] = [dict(r, coordinates=c) for r, c in zip(header['runways'], runway_coords)]
+    model['taxiways'] = _unpack_polylines(body, descriptors, 'taxiways')
+
+    for section in _BOUNDARY_SECTIONS:
+        model[section] = BoundaryStore.from_arrays(
+            header[section]['name'],
+            _read_array(body, descriptors, f'{section}.paths.coords'),
+            _read_array(body, descriptors, f'{section}.paths.offsets'),
+            _read_array(body, descriptors, f'{section}.boundary_offsets'),
+        )
+
+    return model
+
+
+def write_binary_cache(path: str, model: Dict[str, Any], compress: bool = True) -> None:
+    """Write a model dict to an SCTC cache file"""
+    with open(path, 'wb') as f:
+        f.write(encode_model(model, compress=compress))
+
+
+def read_binary_cache(path: str) -> Dict[str, Any]:
+    """Read a model dict from an SCTC cache file"""
+    with open(path, 'rb') as f:
+        return decode_model(f.read())
+
+
+__all__ = [
+    'CACHE_MAGIC',
+    'CACHE_FORMAT_VERSION',
+    'CacheFormatError',
+    'encode_model',
+    'decode_model',
+    'write_binary_cache',
+    'read_binary_cache',
+]
@@ -3,10 +3,20 @@ import re
 import json
 import os
 import hashlib
-from typing import Dict, List, Optional, Tuple, Any
+import math
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
+from ..spatial import BoundaryLOD, PointIndex, SectorLocator, build_navdata_index
+from .boundary_store import BoundaryStore
+from .coordinates import decode_coordinate_tokens, is_dms_token
+from .ring_assembly import DEFAULT_QUANTUM, assemble_paths
+from .sct_cache import CACHE_FORMAT_VERSION, read_binary_cache, write_binary_cache
+from .section_index import read_section_lines, read_section_text, scan_section_ranges, split_section_range
+
 class SCTSectionType(Enum):
     INFO = "INFO"
     VOR = "VOR"
@@ -55,13 +65,58 @@ class Navaid:
 
 class SCTParser:
     # Pre-compiled regex patterns for efficiency
-    _COORD_PATTERN = re.compile(r'([NS])(\d+)\.(\d+)\.(\d+)\.(\d+)')
     _SECTION_PATTERN = re.compile(r'^\[([^\]]+)\]$')
     _VERSION_PATTERN = re.compile(r'VERSION\s+(\d+\.\d+)', re.IGNORECASE)
     _ILS_PATTERN = re.compile(r'ILS\s+(\d+\.\d+)')
     _FREQ_PATTERN_VOR = re.compile(r'(\d+\.\d+)')
     _FREQ_PATTERN_NDB = re.compile(r'(\d+)')
     
+    _CACHE_INDEX_FILE = 'index.json'
+    # Lines read between progress reports when streaming
+    _PROGRESS_LINES = 20000
+    
+    # Section name -> handler; handlers consume an iterable of stripped lines
+    _SECTION_HANDLERS = {
+        'INFO': '_extract_metadata',
+        'AIRPORT': '_parse_airports',
+        'FIXES': '_parse_fixes',
+        'RUNWAY': '_parse_runways',
+        'FREQUENCY': '_parse_frequencies',
+        'VOR': '_parse_vors',
+        'NDB': '_parse_ndbs',
+        'TAXIWAY': '_parse_taxiways',
+        'ARTCC HIGH': '_parse_artcc_high',
+        'ARTCC_HIGH': '_parse_artcc_high',
+        'ARTCC LOW': '_parse_artcc_low',
+        'ARTCC_LOW': '_parse_artcc_low',
+        'ARTCC': '_parse_artcc_generic',
+    }
+    
+    # get_data() key -> sections it is built from ('*' means every section)
+    _DATA_KEY_SECTIONS = {
+        'metadata': ('INFO',),
+        'runways': ('RUNWAY',),
+        'frequencies': ('FREQUENCY',),
+        'VOR': ('VOR',),
+        'NDB': ('NDB',),
+        'taxiways': ('TAXIWAY',),
+        'airports': ('AIRPORT',),
+        'fixes': ('FIXES',),
+        'ARTCC_HIGH': ('ARTCC HIGH', 'ARTCC_HIGH'),
+        'ARTCC_LOW': ('ARTCC LOW', 'ARTCC_LOW', 'ARTCC'),
+        'ARTCC': ('ARTCC HIGH', 'ARTCC_HIGH', 'ARTCC LOW', 'ARTCC_LOW', 'ARTCC'),
+        'version': ('*',),
+        'raw_sections': (),
+    }
+    
+    # Sections the parallel mode never splits (handlers keep state across lines)
+    _UNSPLITTABLE_SECTIONS = ('INFO', 'TAXIWAY')
+    _BOUNDARY_SECTIONS = ('ARTCC HIGH', 'ARTCC_HIGH', 'ARTCC LOW', 'ARTCC_LOW', 'ARTCC')
+    
+    # Model attributes a decoded chunk hands back for merging
+    _CHUNK_LIST_FIELDS = ('runways', 'frequencies', 'vors', 'ndbs', 'taxiways', 'airports', 'fixes',
+                          'artcc_high_boundaries', 'artcc_low_boundaries', 'artcc_generic_boundaries')
+    
     def __init__(self, file_path: Optional[str] = None, ese_name: Optional[str] = None):
         self.file_path = file_path
         self.ese_name = ese_name
@@ -75,25 +130,122 @@ class SCTParser:
         self.taxiways: List[List[Coordinate]] = []
         self.airports: List[Dict] = []
         self.fixes: List[Dict] = []
-        self.artcc_high_boundaries: List[Dict] = []
-        self.artcc_low_boundaries: List[Dict] = []
+        self.artcc_high_boundaries = BoundaryStore()
+        self.artcc_low_boundaries = BoundaryStore()
+        self.artcc_generic_boundaries = BoundaryStore()
         self.version: str = ""
         self.cache_dir = "cache"
+        self.cache_compress = True
+        self._fingerprint: Optional[Dict[str, Any]] = None
+        
+        # Lazy mode: byte ranges of sections that have not been parsed yet
+        self._section_ranges: List[Tuple[str, int, int]] = []
+        self._pending_sections: set = set()
+        self._version_resolved = True
+        
+        # Lookup indexes, built on first use and dropped when the model changes
+        self._indexes: Dict[str, Any] = {}
+        
+        # Parallel mode: chunk size and worker count (None = CPU count)
+        self.parallel_chunk_bytes = 4 * 1024 * 1024
+        self.parallel_workers: Optional[int] = None
+        
+        # Drop repeated edges inside a boundary when assembling rings
+        self.dedupe_boundary_edges = False
+        
+    def _reset_model(self):
+        """Clear any previously parsed model so parse() can be called again"""
+        self.raw_data = {}
+        self.parsed_data = {}
+        self.metadata = {}
+        self.runways = []
+        self.frequencies = []
+        self.vors = []
+        self.ndbs = []
+        self.taxiways = []
+        self.airports = []
+        self.fixes = []
+        self.artcc_high_boundaries = BoundaryStore()
+        self.artcc_low_boundaries = BoundaryStore()
+        self.artcc_generic_boundaries = BoundaryStore()
+        self.version = ""
+        self._section_ranges = []
+        self._pending_sections = set()
+        self._version_resolved = True
+        self._indexes = {}
+    
+    def _get_source_fingerprint(self) -> Optional[Dict[str, Any]]:
+        """Return size, mtime and content hash of the source file.
+        
+        The content hash is reused from the cache index while size and mtime
+        are unchanged, so a warm load does not have to read the file at all.
+        """
+        if not self.file_path or not os.path.exists(self.file_path):
+            return None
+        
+        stat = os.stat(self.file_path)
+        source_key = os.path.abspath(self.file_path)
+        index = self._load_cache_index()
+        entry = index.get(source_key)
+        if entry and entry.get('size') == stat.st_size and entry.get('mtime') == stat.st_mtime:
+            return entry
         
-        # Coordinate cache for performance
-        self._coord_cache: Dict[str, Optional[Tuple[float, float]]] = {}
+        hasher = hashlib.md5()
+        with open(self.file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                hasher.update(chunk)
         
-    def _get_cache_filename(self) -> str:
-        """Generate cache filename based on ESE name and file hash"""
+        entry = {
+            'size': stat.st_size,
+            'mtime': stat.st_mtime,
+            'hash': hasher.hexdigest()
+        }
+        index[source_key] = entry
+        self._save_cache_index(index)
+        return entry
+    
+    def _load_cache_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the path -> fingerprint index kept next to the cache files"""
+        index_path = os.path.join(self.cache_dir, self._CACHE_INDEX_FILE)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+    
+    def _save_cache_index(self, index: Dict[str, Dict[str, Any]]):
+        """Persist the path -> fingerprint index"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, self._CACHE_INDEX_FILE), 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+        except Exception:
+            pass
+    
+    def _get_cache_filename(self, extension: str = 'bin') -> str:
+        """Generate cache filename based on ESE name, file content hash and parse options.
+
+        The cache format version and the options that change the parsed
+        model are hashed into the key, so toggling them never reuses a
+        cache built with other settings.
+        """
         if not self.file_path:
             return None
+        
+        if self._fingerprint is None:
+            self._fingerprint = self._get_source_fingerprint()
+        if not self._fingerprint:
+            return None
             
         prefix = self.ese_name[:4].upper() if self.ese_name else "SECT"
-        file_hash = hashlib.md5(self.file_path.encode()).hexdigest()[:8]
-        return f"{prefix}-{file_hash}-cache.json"
+        # Boundary paths are cached assembled, so the join tolerance is part of the key
+        options = (f"v{CACHE_FORMAT_VERSION}:dedupe={int(bool(self.dedupe_boundary_edges))}"
+                   f":quantum={DEFAULT_QUANTUM!r}")
+        options_hash = hashlib.md5(options.encode('ascii')).hexdigest()[:8]
+        return f"{prefix}-{self._fingerprint['hash'][:16]}-{options_hash}-cache.{extension}"
     
     def _load_from_cache(self) -> bool:
-        """Try to load data from cache file"""
+        """Try to load the full parsed model from the binary cache file"""
         cache_file = self._get_cache_filename()
         if not cache_file:
             return False
@@ -104,20 +256,17 @@ class SCTParser:
             return False
             
         try:
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                cached_data = json.load(f)
-                
-            self.artcc_high_boundaries = cached_data.get('ARTCC_HIGH', [])
-            self.artcc_low_boundaries = cached_data.get('ARTCC_LOW', [])
+            self._model_from_dict(read_binary_cache(cache_path))
             
             print(f"Loaded from cache: {cache_file}")
             return True
             
         except Exception:
+            self._reset_model()
             return False
     
     def _save_to_cache(self):
-        """Save boundary data to cache file"""
+        """Save the full parsed model to the binary cache file"""
         cache_file = self._get_cache_filename()
         if not cache_file:
             return
@@ -125,68 +274,157 @@ class SCTParser:
         os.makedirs(self.cache_dir, exist_ok=True)
         cache_path = os.path.join(self.cache_dir, cache_file)
         
+        try:
+            write_binary_cache(cache_path, self._model_to_dict(), compress=self.cache_compress)
+            print(f"Saved to cache: {cache_file}")
+        except Exception:
+            pass
+    
+    def export_cache_json(self, path: Optional[str] = None) -> Optional[str]:
+        """Write the cached model as indented JSON for debugging.
+        
+        Defaults to the cache directory, next to the binary cache file.
+        Returns the path written, or None if there is nothing to export.
+        """
+        if path is None:
+            cache_file = self._get_cache_filename('json')
+            if not cache_file:
+                return None
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = os.path.join(self.cache_dir, cache_file)
+        
         cache_data = {
-            'ARTCC_HIGH': self.artcc_high_boundaries,
-            'ARTCC_LOW': self.artcc_low_boundaries,
+            'model': self._model_to_dict(),
             'source_file': self.file_path,
+            'source': self._fingerprint,
             'timestamp': __import__('datetime').datetime.now().isoformat(),
-            'cache_version': '1.0'
+            'cache_version': CACHE_FORMAT_VERSION
         }
         
-        try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
-            print(f"Saved to cache: {cache_file}")
-        except Exception:
-            pass
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(cache_data, f, indent=2, default=_json_default)
+        return path
+    
+    def _model_to_dict(self) -> Dict[str, Any]:
+        """Serialize every parsed section (boundaries stay BoundaryStore)"""
+        return {
+            'metadata': self.metadata,
+            'runways': [
+                {
+                    'number': r.number,
+                    'heading': r.heading,
+                    'length': r.length,
+                    'width': r.width,
+                    'surface': r.surface,
+                    'ils': r.ils,
+                    'coordinates': [[c.lat, c.lon] for c in r.coordinates]
+                }
+                for r in self.runways
+            ],
+            'frequencies': [[f.type, f.name, f.freq] for f in self.frequencies],
+            'VOR': [[v.id, v.name, v.freq, v.coord.lat, v.coord.lon] for v in self.vors],
+            'NDB': [[n.id, n.name, n.freq, n.coord.lat, n.coord.lon] for n in self.ndbs],
+            'taxiways': [[[c.lat, c.lon] for c in taxiway] for taxiway in self.taxiways],
+            'airports': self.airports,
+            'fixes': self.fixes,
+            'ARTCC_HIGH': self.artcc_high_boundaries,
+            'ARTCC_LOW': self.artcc_low_boundaries,
+            'version': self.version
+        }
+    
+    def _model_from_dict(self, model: Dict[str, Any]):
+        """Restore every parsed section from _model_to_dict output"""
+        self._reset_model()
+        self.metadata = model.get('metadata', {})
+        self.runways = [
+            Runway(
+                number=r['number'],
+                heading=r['heading'],
+                length=r['length'],
+                width=r['width'],
+                surface=r['surface'],
+                ils=r['ils'],
+                coordinates=[Coordinate(lat, lon) for lat, lon in r['coordinates']]
+            )
+            for r in model.get('runways', [])
+        ]
+        self.frequencies = [Frequency(type=t, name=n, freq=f) for t, n, f in model.get('frequencies', [])]
+        self.vors = [Navaid(id=i, name=n, freq=f, coord=Coordinate(lat, lon), type='VOR')
+                     for i, n, f, lat, lon in model.get('VOR', [])]
+        self.ndbs = [Navaid(id=i, name=n, freq=f, coord=Coordinate(lat, lon), type='NDB')
+                     for i, n, f, lat, lon in model.get('NDB', [])]
+        self.taxiways = [[Coordinate(lat, lon) for lat, lon in taxiway] for taxiway in model.get('taxiways', [])]
+        self.airports = model.get('airports', [])
+        self.fixes = model.get('fixes', [])
+        self.artcc_high_boundaries = BoundaryStore.from_boundaries(model.get('ARTCC_HIGH', []))
+        self.artcc_low_boundaries = BoundaryStore.from_boundaries(model.get('ARTCC_LOW', []))
+        self.version = model.get('version', "")
+        
+    def parse(self, file_path: Optional[str] = None, streaming: bool = False,
+              lazy: bool = False, parallel: bool = False,
+              progress: Optional[Callable[[float], None]] = None) -> Dict[str, Any]:
+        """Parse the SCT file and return the data dictionary.
         
-    def parse(self, file_path: Optional[str] = None) -> Dict[str, Any]:
+        With streaming=True each line is handed straight to its section
+        handler as it is read, so no copy of the file text or list of lines
+        is kept and 'raw_sections' stays empty.
+        
+        With lazy=True only the section byte ranges are recorded; the
+        returned LazySCTData parses each section the first time one of its
+        keys is read; 'raw_sections' stays empty. A cache hit always
+        restores the full model.
+        
+        With parallel=True sections (and chunks of large sections) are
+        decoded in a process pool and merged back in file order, so the
+        result matches streaming=True.
+        
+        progress(fraction) is called as the text is parsed (per step, per
+        decoded chunk, or every few thousand lines when streaming). An
+        exception raised by it aborts the parse before the cache is
+        written.
+        """
         if file_path:
             self.file_path = file_path
+            self._fingerprint = None
             
         if not self.file_path:
             raise ValueError("No SCT file path provided")
         
-        # Try to load from cache first
-        cache_loaded = self._load_from_cache()
+        self._reset_model()
         
-        # Parse file content
-        with open(self.file_path, 'r', encoding='latin-1') as f:
-            content = f.read()
-            
-        self._parse_raw_sections(content)
+        # A cache hit restores the whole model, so the text is never parsed
+        cache_loaded = self._load_from_cache()
+        if not cache_loaded and lazy:
+            self._section_ranges = scan_section_ranges(self.file_path)
+            self._pending_sections = {name for name, _, _ in self._section_ranges
+                                      if name in self._SECTION_HANDLERS}
+            self._version_resolved = False
+            self.parsed_data = LazySCTData(self)
+            return self.parsed_data
         
-        # Only parse boundaries if not loaded from cache
         if not cache_loaded:
-            self._parse_artcc_boundaries()
+            if parallel:
+                self._parse_parallel(progress)
+            elif streaming:
+                self._parse_stream(progress)
+            else:
+                with open(self.file_path, 'r', encoding='latin-1') as f:
+                    content = f.read()
+                    
+                self._parse_raw_sections(content)
+                steps = (self._parse_artcc_boundaries, self._extract_metadata, self._parse_runways,
+                         self._parse_frequencies, self._parse_navaids, self._parse_taxiways,
+                         self._parse_airports, self._parse_fixes, self._parse_version)
+                for done, step in enumerate(steps, 1):
+                    if progress:
+                        progress((done - 1) / len(steps))
+                    step()
+                if progress:
+                    progress(1.0)
             self._save_to_cache()
         
-        # Parse other sections
-        self._extract_metadata()
-        self._parse_runways()
-        self._parse_frequencies()
-        self._parse_navaids()
-        self._parse_taxiways()
-        self._parse_airports()
-        self._parse_fixes()
-        self._parse_version()
-        
         # Build final parsed data
-        self.parsed_data = {
-            'metadata': self.metadata,
-            'runways': [r.__dict__ for r in self.runways],
-            'frequencies': [f.__dict__ for f in self.frequencies],
-            'VOR': [{'latitude': v.coord.lat, 'longitude': v.coord.lon, 'name': v.name, 'id': v.id} for v in self.vors],
-            'NDB': [{'latitude': n.coord.lat, 'longitude': n.coord.lon, 'name': n.name, 'id': n.id} for n in self.ndbs],
-            'taxiways': self.taxiways,
-            'airports': self.airports,
-            'fixes': self.fixes,
-            'ARTCC_HIGH': self.artcc_high_boundaries,
-            'ARTCC_LOW': self.artcc_low_boundaries,
-            'ARTCC': self.artcc_high_boundaries + self.artcc_low_boundaries,
-            'version': self.version,
-            'raw_sections': self.raw_data
-        }
+        self.parsed_data = self._build_parsed_data()
         
         print(f"DEBUG PARSER: Parsed {len(self.airports)} airports, {len(self.fixes)} fixes")
         print(f"DEBUG PARSER: ARTCC HIGH: {len(self.artcc_high_boundaries)} boundaries")
@@ -196,45 +434,96 @@ class SCTParser:
         
         return self.parsed_data
     
-    def _parse_coordinate_fast(self, coord_str: str) -> Optional[Tuple[float, float]]:
-        """Optimized coordinate parsing with caching"""
-        if coord_str in self._coord_cache:
-            return self._coord_cache[coord_str]
+    def _build_parsed_data(self) -> Dict[str, Any]:
+        """Assemble the public data dictionary from the parsed model"""
+        return {key: self._build_parsed_value(key) for key in self._DATA_KEY_SECTIONS}
+    
+    def _build_parsed_value(self, key: str) -> Any:
+        """Build one get_data() entry from the parsed model"""
+        if key == 'metadata':
+            return self.metadata
+        if key == 'runways':
+            return [r.__dict__ for r in self.runways]
+        if key == 'frequencies':
+            return [f.__dict__ for f in self.frequencies]
+        if key == 'VOR':
+            return [{'latitude': v.coord.lat, 'longitude': v.coord.lon, 'name': v.name, 'id': v.id} for v in self.vors]
+        if key == 'NDB':
+            return [{'latitude': n.coord.lat, 'longitude': n.coord.lon, 'name': n.name, 'id': n.id} for n in self.ndbs]
+        if key == 'taxiways':
+            return self.taxiways
+        if key == 'airports':
+            return self.airports
+        if key == 'fixes':
+            return self.fixes
+        if key == 'ARTCC_HIGH':
+            return self.artcc_high_boundaries
+        if key == 'ARTCC_LOW':
+            return self.artcc_low_boundaries
+        if key == 'ARTCC':
+            return self.artcc_high_boundaries + self.artcc_low_boundaries
+        if key == 'version':
+            return self.version
+        if key == 'raw_sections':
+            return self.raw_data
+        raise KeyError(key)
+    
+    def _ensure_data_key(self, key: str):
+        """Parse whatever sections a get_data() key needs (lazy mode only)"""
+        sections = self._DATA_KEY_SECTIONS[key]
+        if sections == ('*',):
+            self._ensure_version()
+        else:
+            self._ensure_sections(sections)
+    
+    def _ensure_sections(self, sections: Iterable[str]):
+        """Parse pending sections from their recorded byte ranges"""
+        wanted = self._pending_sections.intersection(sections)
+        if not wanted:
+            return
         
-        coord_str = coord_str.strip()
+        for name, start, end in self._section_ranges:
+            if name in wanted:
+                lines = self._iter_lines(read_section_lines(self.file_path, start, end))
+                self._decode_lines(name, lines)
         
-        # Try N/S E/W format
-        match = self._COORD_PATTERN.findall(coord_str)
-        if len(match) == 2:
-            lat_match, lon_match = match
-            lat_dir, lat_deg, lat_min, lat_sec, lat_frac = lat_match
-            lon_dir, lon_deg, lon_min, lon_sec, lon_frac = lon_match
-            
-            # Fast calculation
-            lat = float(lat_deg) + float(lat_min)/60 + (float(lat_sec) + float(lat_frac)/1000)/3600
-            if lat_dir == 'S':
-                lat = -lat
-                
-            lon = float(lon_deg) + float(lon_min)/60 + (float(lon_sec) + float(lon_frac)/1000)/3600
-            if lon_dir == 'W':
-                lon = -lon
-            
-            result = (lat, lon)
-            self._coord_cache[coord_str] = result
-            return result
-        
-        # Try decimal format
-        parts = coord_str.split()
-        if len(parts) == 2:
-            try:
-                result = (float(parts[0]), float(parts[1]))
-                self._coord_cache[coord_str] = result
-                return result
-            except ValueError:
-                pass
+        self._pending_sections -= wanted
+        self._indexes = {}
+        self._finalize_artcc()
         
-        self._coord_cache[coord_str] = None
-        return None
+        if not self._pending_sections and self._version_resolved:
+            self._save_to_cache()
+    
+    def _ensure_all_sections(self):
+        """Parse every pending section (lazy mode only)"""
+        self._ensure_sections(set(self._pending_sections))
+        self._ensure_version()
+    
+    def _ensure_version(self):
+        """Find the VERSION line without parsing whole sections"""
+        if self._version_resolved:
+            return
+        
+        for _, start, end in self._section_ranges:
+            text = read_section_text(self.file_path, start, end)
+            for line in text.split('\n'):
+                line = line.strip()
+                if line and not line.startswith(';'):
+                    version_match = self._VERSION_PATTERN.search(line)
+                    if version_match:
+                        self.version = version_match.group(1)
+                        break
+            if self.version:
+                break
+        
+        self._version_resolved = True
+        if not self._pending_sections:
+            self._save_to_cache()
+    
+    def _finalize_artcc(self):
+        """Use a plain ARTCC section as LOW when there is no ARTCC LOW"""
+        if self.artcc_generic_boundaries and not self.artcc_low_boundaries:
+            self.artcc_low_boundaries = self.artcc_generic_boundaries
     
     def _parse_artcc_boundaries(self):
         """Parse ARTCC boundaries"""
@@ -254,88 +543,233 @@ class SCTParser:
             if not self.artcc_low_boundaries:
                 self.artcc_low_boundaries = artcc_data
     
-    def _parse_artcc_section_optimized(self, lines: List[str]) -> List[Dict]:
-        """Optimized ARTCC boundary parsing with line combination"""
-        boundaries = []
-        current_boundary = None
-        current_path = []  # Track current continuous path
+    def _parse_artcc_section_optimized(self, lines: Iterable[str]) -> BoundaryStore:
+        """Optimized ARTCC boundary parsing with line combination.
+        
+        All coordinate tokens of the section are collected first and decoded
+        in one batch, then each boundary's segments are stitched into
+        maximal polylines and closed rings regardless of their order.
+        """
+        names = []
+        tokens = []
+        segment_owners = []  # Boundary index of each 4-token segment
         
         for line in lines:
             line = line.strip()
             if not line:
                 continue
             
+            parts = line.split()
+            
             # Check if it's a boundary name (not starting with coordinate pattern)
             if not line.startswith(('N', 'S', ' ')) and not line[0].isdigit():
-                # End previous boundary
-                if current_boundary:
-                    # Add any remaining path segments
-                    self._add_path_to_boundary(current_boundary, current_path)
-                    boundaries.append(current_boundary)
-                
-                # Start new boundary
-                current_boundary = {
-                    'name': line,
-                    'segments': []
-                }
-                current_path = []  # Reset current path
+                name, parts = self._split_boundary_name(line, parts)
+                names.append(name)
+            
+            if not names:
                 continue
             
-            # Parse coordinate line for current boundary
-            if current_boundary is not None:
-                # Split line into coordinate parts
-                parts = line.split()
-                
-                # Process each pair of coordinates in the line
-                for i in range(0, len(parts), 4):
-                    if i + 3 >= len(parts):
-                        break
-                    
-                    # Parse start and end coordinates
-                    start_str = f"{parts[i]} {parts[i+1]}"
-                    end_str = f"{parts[i+2]} {parts[i+3]}"
-                    
-                    start_coord = self._parse_coordinate_fast(start_str)
-                    end_coord = self._parse_coordinate_fast(end_str)
-                    
-                    if not start_coord or not end_coord:
-                        continue
-                    
-                    # Check if we can continue the current path
-                    if not current_path:
-                        # Start new path
-                        current_path = [start_coord, end_coord]
-                    elif self._coords_equal(current_path[-1], start_coord):
-                        # Continue existing path
-                        current_path.append(end_coord)
-                    else:
-                        # End current path and start new one
-                        self._add_path_to_boundary(current_boundary, current_path)
-                        current_path = [start_coord, end_coord]
-        
-        # Handle last boundary and path
-        if current_boundary:
-            self._add_path_to_boundary(current_boundary, current_path)
-            boundaries.append(current_boundary)
+            # Each group of four tokens is one start/end segment
+            for i in range(0, len(parts) - 3, 4):
+                tokens.extend(parts[i:i + 4])
+                segment_owners.append(len(names) - 1)
+        
+        values = decode_coordinate_tokens(tokens).tolist()
+        
+        boundaries = BoundaryStore()
+        k = 0
+        for owner, name in enumerate(names):
+            boundaries.start_boundary(name)
+            segments = []
+            
+            while k < len(segment_owners) and segment_owners[k] == owner:
+                start_lat, start_lon, end_lat, end_lon = values[4 * k:4 * k + 4]
+                k += 1
+                # NaN marks an undecodable token
+                if start_lat != start_lat or start_lon != start_lon or end_lat != end_lat or end_lon != end_lon:
+                    continue
+                segments.append(((start_lat, start_lon), (end_lat, end_lon)))
+            
+            for path in assemble_paths(segments, dedupe_shared=self.dedupe_boundary_edges):
+                boundaries.add_path(path)
         
         return boundaries
     
-    def _coords_equal(self, coord1: Tuple[float, float], coord2: Tuple[float, float]) -> bool:
-        """Check if two coordinates are approximately equal"""
-        return (abs(coord1[0] - coord2[0]) < 0.0001 and 
-                abs(coord1[1] - coord2[1]) < 0.0001)
+    def _split_boundary_name(self, line: str, parts: List[str]) -> Tuple[str, List[str]]:
+        """Split 'NAME lat lon lat lon' into the name and its first segment"""
+        if len(parts) >= 5 and all(is_dms_token(token) for token in parts[-4:]):
+            return ' '.join(parts[:-4]), parts[-4:]
+        return line, []
     
-    def _add_path_to_boundary(self, boundary: Dict, path: List[Tuple[float, float]]):
-        """Convert a continuous path into segments and add to boundary"""
-        if len(path) < 2:
-            return
+    def _parse_stream(self, progress: Optional[Callable[[float], None]] = None):
+        """Parse the file line by line, dispatching each section to its handler"""
+        with open(self.file_path, 'r', encoding='latin-1') as f:
+            lines = self._iter_progress(f, os.path.getsize(self.file_path), progress) if progress else f
+            for section, body in self._iter_sections(self._iter_lines(lines)):
+                self._decode_lines(section, body)
+        
+        self._finalize_artcc()
+    
+    def _iter_progress(self, lines: Iterable[str], total: int,
+                       progress: Callable[[float], None]) -> Iterator[str]:
+        """Pass lines through, reporting the fraction of total characters read every few thousand lines"""
+        read = 0
+        for count, line in enumerate(lines, 1):
+            read += len(line)
+            if count % self._PROGRESS_LINES == 0:
+                progress(min(read / total, 1.0) if total else 1.0)
+            yield line
+        progress(1.0)
+    
+    def _parse_parallel(self, progress: Optional[Callable[[float], None]] = None):
+        """Decode section ranges in a process pool and merge them in file order"""
+        tasks = self._build_parallel_tasks()
         
-        # Create segments from the path
-        for i in range(len(path) - 1):
-            boundary['segments'].append({
-                'start': {'lat': path[i][0], 'lon': path[i][1]},
-                'end': {'lat': path[i + 1][0], 'lon': path[i + 1][1]}
-            })
+        results = None
+        if len(tasks) > 1:
+            results = self._decode_in_pool(tasks, progress)
+        
+        if results is None:
+            results = []
+            for task in tasks:
+                results.append(_decode_section_range(*task))
+                if progress:
+                    progress(len(results) / len(tasks))
+        
+        for result in results:
+            self._merge_chunk(result)
+        self._finalize_artcc()
+    
+    def _decode_in_pool(self, tasks: List[Tuple[str, str, int, int, bool]],
+                        progress: Optional[Callable[[float], None]] = None) -> Optional[List[Dict[str, Any]]]:
+        """Decoded chunks in task order, or None if the process pool fails.
+        
+        progress is called as chunks arrive, outside the pool error
+        handling, so an exception from it cancels the outstanding chunks
+        and propagates.
+        """
+        executor = None
+        try:
+            executor = ProcessPoolExecutor(max_workers=self.parallel_workers)
+            futures = [executor.submit(_decode_section_range, *task) for task in tasks]
+        except Exception as e:
+            print(f"Parallel decode failed, falling back to serial: {e}")
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            return None
+        
+        try:
+            results = []
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"Parallel decode failed, falling back to serial: {e}")
+                    return None
+                if progress:
+                    progress(len(results) / len(tasks))
+            return results
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _build_parallel_tasks(self) -> List[Tuple[str, str, int, int, bool]]:
+        """Split the file into (file, section, start, end, dedupe) decode tasks"""
+        tasks = []
+        for name, start, end in scan_section_ranges(self.file_path):
+            if name in self._UNSPLITTABLE_SECTIONS:
+                chunks = [(name, start, end)]
+            elif name in self._BOUNDARY_SECTIONS:
+                chunks = split_section_range(self.file_path, name, start, end,
+                                             self.parallel_chunk_bytes, _is_boundary_name_line)
+            else:
+                chunks = split_section_range(self.file_path, name, start, end,
+                                             self.parallel_chunk_bytes)
+            for chunk_name, chunk_start, chunk_end in chunks:
+                tasks.append((self.file_path, chunk_name, chunk_start, chunk_end,
+                              self.dedupe_boundary_edges))
+        return tasks
+    
+    def _decode_lines(self, section: str, lines: Iterable[str]):
+        """Run the handler for one section on already-filtered lines"""
+        handler_name = self._SECTION_HANDLERS.get(section)
+        if handler_name == '_extract_metadata':
+            self._extract_metadata(self._watch_version(lines))
+        elif handler_name:
+            getattr(self, handler_name)(lines)
+        elif not self.version:
+            self._parse_version(lines)
+    
+    def _chunk_result(self) -> Dict[str, Any]:
+        """Collect the model fields a decoded chunk produced"""
+        result = {field: getattr(self, field) for field in self._CHUNK_LIST_FIELDS}
+        result['metadata'] = self.metadata
+        result['version'] = self.version
+        return result
+    
+    def _merge_chunk(self, result: Dict[str, Any]):
+        """Append a decoded chunk to the model"""
+        for field in self._CHUNK_LIST_FIELDS:
+            getattr(self, field).extend(result[field])
+        self.metadata.update(result['metadata'])
+        if not self.version:
+            self.version = result['version']
+    
+    def _iter_lines(self, lines: Iterable[str]) -> Iterator[str]:
+        """Yield stripped lines, skipping blanks and comments"""
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith(';'):
+                yield line
+    
+    def _iter_sections(self, lines: Iterator[str]) -> Iterator[Tuple[str, Iterator[str]]]:
+        """Group a line stream into (section name, body iterator) pairs.
+        
+        Body iterators share the underlying stream, so whatever a handler
+        leaves unread is skipped before the next section is yielded.
+        """
+        state = {'next': None}
+        
+        def body():
+            for line in lines:
+                if line[0] == '[':
+                    section_match = self._SECTION_PATTERN.match(line)
+                    if section_match:
+                        state['next'] = section_match.group(1)
+                        return
+                yield line
+        
+        # Lines before the first section header are ignored
+        for _ in body():
+            pass
+        
+        while state['next'] is not None:
+            section = state['next']
+            state['next'] = None
+            section_lines = body()
+            yield section, section_lines
+            for _ in section_lines:
+                pass
+    
+    def _watch_version(self, lines: Iterable[str]) -> Iterator[str]:
+        """Pass lines through while looking for the VERSION line"""
+        for line in lines:
+            if not self.version:
+                version_match = self._VERSION_PATTERN.search(line)
+                if version_match:
+                    self.version = version_match.group(1)
+            yield line
+    
+    def _parse_artcc_high(self, lines: Iterable[str]):
+        """Parse an ARTCC HIGH section"""
+        self.artcc_high_boundaries.extend(self._parse_artcc_section_optimized(lines))
+    
+    def _parse_artcc_low(self, lines: Iterable[str]):
+        """Parse an ARTCC LOW section"""
+        self.artcc_low_boundaries.extend(self._parse_artcc_section_optimized(lines))
+    
+    def _parse_artcc_generic(self, lines: Iterable[str]):
+        """Parse a plain ARTCC section (used as LOW when there is no ARTCC LOW)"""
+        self.artcc_generic_boundaries.extend(self._parse_artcc_section_optimized(lines))
     
     def _parse_raw_sections(self, content: str):
         """Parse raw sections from content"""
@@ -357,51 +791,54 @@ class SCTParser:
             if current_section:
                 self.raw_data[current_section].append(line)
     
-    def _extract_metadata(self):
+    def _extract_metadata(self, lines: Optional[Iterable[str]] = None):
         """Extract metadata from INFO section"""
-        if 'INFO' in self.raw_data:
-            for line in self.raw_data['INFO']:
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    self.metadata[key.strip()] = value.strip()
+        if lines is None:
+            lines = self.raw_data.get('INFO', [])
+        for line in lines:
+            if '=' in line:
+                key, value = line.split('=', 1)
+                self.metadata[key.strip()] = value.strip()
     
-    def _parse_airports(self):
+    def _parse_airports(self, lines: Optional[Iterable[str]] = None):
         """Parse airport data"""
-        if 'AIRPORT' in self.raw_data:
-            for line in self.raw_data['AIRPORT']:
-                parts = line.split()
-                if len(parts) >= 4:
-                    try:
-                        self.airports.append({
-                            'icao': parts[0],
-                            'latitude': float(parts[1]),
-                            'longitude': float(parts[2]),
-                            'name': ' '.join(parts[3:]) if len(parts) > 3 else parts[0]
-                        })
-                    except ValueError:
-                        continue
-    
-    def _parse_fixes(self):
+        if lines is None:
+            lines = self.raw_data.get('AIRPORT', [])
+        for line in lines:
+            parts = line.split()
+            if len(parts) >= 4:
+                try:
+                    self.airports.append({
+                        'icao': parts[0],
+                        'latitude': float(parts[1]),
+                        'longitude': float(parts[2]),
+                        'name': ' '.join(parts[3:]) if len(parts) > 3 else parts[0]
+                    })
+                except ValueError:
+                    continue
+    
+    def _parse_fixes(self, lines: Optional[Iterable[str]] = None):
         """Parse fix/waypoint data"""
-        if 'FIXES' in self.raw_data:
-            for line in self.raw_data['FIXES']:
-                parts = line.split()
-                if len(parts) >= 3:
-                    try:
-                        self.fixes.append({
-                            'name': parts[0],
-                            'latitude': float(parts[1]),
-                            'longitude': float(parts[2])
-                        })
-                    except ValueError:
-                        continue
-    
-    def _parse_runways(self):
+        if lines is None:
+            lines = self.raw_data.get('FIXES', [])
+        for line in lines:
+            parts = line.split()
+            if len(parts) >= 3:
+                try:
+                    self.fixes.append({
+                        'name': parts[0],
+                        'latitude': float(parts[1]),
+                        'longitude': float(parts[2])
+                    })
+                except ValueError:
+                    continue
+    
+    def _parse_runways(self, lines: Optional[Iterable[str]] = None):
         """Parse runway data"""
-        if 'RUNWAY' not in self.raw_data:
-            return
+        if lines is None:
+            lines = self.raw_data.get('RUNWAY', [])
             
-        for line in self.raw_data['RUNWAY']:
+        for line in lines:
             parts = line.split()
             if len(parts) >= 6:
                 try:
@@ -437,12 +874,12 @@ class SCTParser:
                 except (ValueError, IndexError):
                     continue
     
-    def _parse_frequencies(self):
+    def _parse_frequencies(self, lines: Optional[Iterable[str]] = None):
         """Parse frequency data"""
-        if 'FREQUENCY' not in self.raw_data:
-            return
+        if lines is None:
+            lines = self.raw_data.get('FREQUENCY', [])
             
-        for line in self.raw_data['FREQUENCY']:
+        for line in lines:
             parts = line.split()
             if len(parts) >= 3:
                 try:
@@ -459,12 +896,12 @@ class SCTParser:
         self._parse_vors()
         self._parse_ndbs()
     
-    def _parse_vors(self):
+    def _parse_vors(self, lines: Optional[Iterable[str]] = None):
         """Parse VOR data"""
-        if 'VOR' not in self.raw_data:
-            return
+        if lines is None:
+            lines = self.raw_data.get('VOR', [])
             
-        for line in self.raw_data['VOR']:
+        for line in lines:
             parts = line.split()
             if len(parts) >= 4:
                 try:
@@ -489,12 +926,12 @@ class SCTParser:
                 except ValueError:
                     continue
     
-    def _parse_ndbs(self):
+    def _parse_ndbs(self, lines: Optional[Iterable[str]] = None):
         """Parse NDB data"""
-        if 'NDB' not in self.raw_data:
-            return
+        if lines is None:
+            lines = self.raw_data.get('NDB', [])
             
-        for line in self.raw_data['NDB']:
+        for line in lines:
             parts = line.split()
             if len(parts) >= 4:
                 try:
@@ -519,13 +956,13 @@ class SCTParser:
                 except ValueError:
                     continue
     
-    def _parse_taxiways(self):
+    def _parse_taxiways(self, lines: Optional[Iterable[str]] = None):
         """Parse taxiway data"""
-        if 'TAXIWAY' not in self.raw_data:
-            return
+        if lines is None:
+            lines = self.raw_data.get('TAXIWAY', [])
             
         current_taxiway = []
-        for line in self.raw_data['TAXIWAY']:
+        for line in lines:
             if line.startswith(';'):
                 if current_taxiway:
                     self.taxiways.append(current_taxiway)
@@ -541,38 +978,132 @@ class SCTParser:
         if current_taxiway:
             self.taxiways.append(current_taxiway)
     
-    def _parse_version(self):
+    def _parse_version(self, lines: Optional[Iterable[str]] = None):
         """Parse version information"""
-        for section in self.raw_data:
-            for line in self.raw_data[section]:
-                version_match = self._VERSION_PATTERN.search(line)
-                if version_match:
-                    self.version = version_match.group(1)
-                    return
+        if lines is None:
+            lines = (line for section in self.raw_data.values() for line in section)
+        for line in lines:
+            version_match = self._VERSION_PATTERN.search(line)
+            if version_match:
+                self.version = version_match.group(1)
+                return
+    
+    def _get_index(self, name: str) -> Dict[str, Any]:
+        """Return a lookup index, building it from the model on first use"""
+        index = self._indexes.get(name)
+        if index is not None:
+            return index
+        
+        index = {}
+        if name == 'airports':
+            for airport in self.airports:
+                index.setdefault(airport.get('icao'), airport)
+        elif name == 'fixes':
+            for fix in self.fixes:
+                index.setdefault(fix.get('name'), []).append(fix)
+        elif name == 'navaids':
+            for navaid in self.vors + self.ndbs:
+                index.setdefault(navaid.id, []).append(navaid)
+        elif name == 'runways':
+            for runway in self.runways:
+                index.setdefault(runway.number, runway)
+        elif name == 'frequencies':
+            for freq in self.frequencies:
+                index.setdefault(freq.name, freq)
+        
+        self._indexes[name] = index
+        return index
+    
+    def _nearest(self, items: List[Any], near: Optional[Tuple[float, float]], position) -> Any:
+        """Pick the item closest to near (first item when near is None)"""
+        if near is None or len(items) == 1:
+            return items[0]
+        
+        lat0, lon0 = near
+        scale = math.cos(math.radians(lat0))
+        
+        def distance_sq(item):
+            lat, lon = position(item)
+            return (lat - lat0) ** 2 + ((lon - lon0) * scale) ** 2
+        
+        return min(items, key=distance_sq)
     
     def get_runway_by_number(self, rwy_number: str) -> Optional[Runway]:
-        for runway in self.runways:
-            if runway.number == rwy_number:
-                return runway
-        return None
+        self._ensure_sections(('RUNWAY',))
+        return self._get_index('runways').get(rwy_number)
     
     def get_frequency_by_name(self, name: str) -> Optional[Frequency]:
-        for freq in self.frequencies:
-            if freq.name == name:
-                return freq
-        return None
-    
-    def get_navaid_by_id(self, navaid_id: str) -> Optional[Navaid]:
-        for vor in self.vors:
-            if vor.id == navaid_id:
-                return vor
-        for ndb in self.ndbs:
-            if ndb.id == navaid_id:
-                return ndb
-        return None
+        self._ensure_sections(('FREQUENCY',))
+        return self._get_index('frequencies').get(name)
+    
+    def get_navaid_by_id(self, navaid_id: str, near: Optional[Tuple[float, float]] = None) -> Optional[Navaid]:
+        """Look up a VOR or NDB; near=(lat, lon) picks between duplicate idents"""
+        navaids = self.get_navaids_by_id(navaid_id)
+        if not navaids:
+            return None
+        return self._nearest(navaids, near, lambda n: (n.coord.lat, n.coord.lon))
+    
+    def get_navaids_by_id(self, navaid_id: str) -> List[Navaid]:
+        """All VORs and NDBs sharing an ident (VORs first)"""
+        self._ensure_sections(('VOR', 'NDB'))
+        return self._get_index('navaids').get(navaid_id, [])
+    
+    def get_airport(self, icao: str) -> Optional[Dict]:
+        """Look up an airport by ICAO code"""
+        self._ensure_sections(('AIRPORT',))
+        return self._get_index('airports').get(icao)
+    
+    def get_fix(self, name: str, near: Optional[Tuple[float, float]] = None) -> Optional[Dict]:
+        """Look up a fix; near=(lat, lon) picks the closest of duplicate names"""
+        fixes = self.get_fixes_by_name(name)
+        if not fixes:
+            return None
+        return self._nearest(fixes, near, lambda f: (f['latitude'], f['longitude']))
+    
+    def get_fixes_by_name(self, name: str) -> List[Dict]:
+        """All fixes sharing a name (names repeat across regions)"""
+        self._ensure_sections(('FIXES',))
+        return self._get_index('fixes').get(name, [])
+    
+    def get_fix_names(self) -> List[str]:
+        """Unique fix names in file order"""
+        self._ensure_sections(('FIXES',))
+        return list(self._get_index('fixes'))
+    
+    def get_spatial_index(self) -> PointIndex:
+        """Grid index of fixes, VORs, NDBs and airports for radius/nearest/bbox queries"""
+        self._ensure_sections(('FIXES', 'VOR', 'NDB', 'AIRPORT'))
+        index = self._indexes.get('spatial')
+        if index is None:
+            data = {key: self._build_parsed_value(key) for key in ('fixes', 'VOR', 'NDB', 'airports')}
+            index = build_navdata_index(data)
+            self._indexes['spatial'] = index
+        return index
+    
+    def get_sector_locator(self) -> SectorLocator:
+        """R-tree point-in-sector lookup over the ARTCC HIGH/LOW polygons"""
+        self._ensure_sections(self._BOUNDARY_SECTIONS)
+        locator = self._indexes.get('sectors')
+        if locator is None:
+            locator = SectorLocator()
+            locator.add_layer('HIGH', self.artcc_high_boundaries)
+            locator.add_layer('LOW', self.artcc_low_boundaries)
+            self._indexes['sectors'] = locator
+        return locator
+    
+    def get_boundary_lod(self, key: str = 'ARTCC') -> BoundaryLOD:
+        """Zoom level-of-detail pyramid of an ARTCC layer ('ARTCC_HIGH', 'ARTCC_LOW' or 'ARTCC')"""
+        self._ensure_data_key(key)
+        cache_key = f'lod:{key}'
+        lod = self._indexes.get(cache_key)
+        if lod is None:
+            lod = BoundaryLOD.from_boundaries(self._build_parsed_value(key))
+            self._indexes[cache_key] = lod
+        return lod
     
     def validate(self) -> Tuple[bool, List[str]]:
         errors = []
+        self._ensure_sections(('RUNWAY', 'FREQUENCY'))
         
         if not self.runways:
             errors.append("No runways found")
@@ -588,13 +1119,14 @@ class SCTParser:
     
     def export_json(self) -> str:
         import json
-        return json.dumps(self.parsed_data, indent=2, default=str)
+        return json.dumps(dict(self.parsed_data), indent=2, default=_json_default)
     
     def get_data(self) -> Dict[str, Any]:
         """Return the parsed data dictionary"""
         return self.parsed_data
     
     def export_summary(self) -> str:
+        self._ensure_all_sections()
         summary = []
         summary.append(f"SCT File: {self.file_path}")
         summary.append(f"Version: {self.version}")
@@ -615,6 +1147,59 @@ class SCTParser:
         return '\n'.join(summary)
 
 
+def _is_boundary_name_line(line: bytes) -> bool:
+    """True for an ARTCC line that starts a new boundary"""
+    line = line.strip()
+    return bool(line) and not line.startswith((b';', b'N', b'S')) and not line[:1].isdigit()
+
+
+def _decode_section_range(file_path: str, section: str, start: int, end: int,
+                          dedupe_boundary_edges: bool = False) -> Dict[str, Any]:
+    """Process-pool worker: decode one section range with a fresh parser"""
+    parser = SCTParser(file_path)
+    parser.dedupe_boundary_edges = dedupe_boundary_edges
+    lines = parser._iter_lines(read_section_lines(file_path, start, end))
+    parser._decode_lines(section, lines)
+    return parser._chunk_result()
+
+
+def _json_default(obj: Any) -> Any:
+    """json.dumps fallback for boundary stores and other non-JSON values"""
+    if isinstance(obj, BoundaryStore):
+        return obj.to_list()
+    return str(obj)
+
+
+class LazySCTData(Mapping):
+    """Read-only get_data() view that parses each section on first access"""
+    
+    def __init__(self, parser: SCTParser):
+        self._parser = parser
+        self._values: Dict[str, Any] = {}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._values:
+            if key not in self._parser._DATA_KEY_SECTIONS:
+                raise KeyError(key)
+            self._parser._ensure_data_key(key)
+            self._values[key] = self._parser._build_parsed_value(key)
+        return self._values[key]
+    
+    def __contains__(self, key: object) -> bool:
+        # Membership never triggers parsing
+        return key in self._parser._DATA_KEY_SECTIONS
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._parser._DATA_KEY_SECTIONS)
+    
+    def __len__(self) -> int:
+        return len(self._parser._DATA_KEY_SECTIONS)
+    
+    def is_loaded(self, key: str) -> bool:
+        """Return True if the key has already been parsed"""
+        return key in self._values
+
+
 def parse_sct_file(file_path: str, validate: bool = True) -> Dict[str, Any]:
     parser = SCTParser(file_path)
     result = parser.parse()
@@ -633,4 +1218,4 @@ def quick_parse(file_path: str) -> str:
     return parser.export_summary()
 
 
-__all__ = ['SCTParser', 'parse_sct_file', 'quick_parse', 'SCTSectionType', 'Coordinate', 'Runway', 'Frequency', 'Navaid']
\ No newline at end of file
+__all__ = ['SCTParser', 'LazySCTData', 'parse_sct_file', 'quick_parse', 'SCTSectionType', 'Coordinate', 'Runway', 'Frequency', 'Navaid']
\ No newline at end of file
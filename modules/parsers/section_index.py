@@ -0,0 +1,93 @@
+# section_index.py
+"""Byte-range index of [SECTION] blocks in sector files.
+
+One regex pass over a memory-mapped file records where every section body
+starts and ends, so callers can later read and parse a single section
+without touching the rest of the file.
+"""
+import mmap
+import re
+from typing import Callable, List, Optional, Tuple
+
+_SECTION_HEADER = re.compile(rb'^[ \t]*\[([^\]\r\n]+)\][ \t]*\r?$', re.MULTILINE)
+
+
+def scan_section_ranges(file_path: str) -> List[Tuple[str, int, int]]:
+    """Return (section name, body start, body end) byte ranges in file order"""
+    ranges = []
+    with open(file_path, 'rb') as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return ranges
+
+        try:
+            current_name = None
+            body_start = 0
+            for match in _SECTION_HEADER.finditer(data):
+                if current_name is not None:
+                    ranges.append((current_name, body_start, match.start()))
+                current_name = match.group(1).decode('latin-1')
+                body_start = match.end()
+                # Body starts after the header's line break
+                if data[body_start:body_start + 1] == b'\n':
+                    body_start += 1
+            if current_name is not None:
+                ranges.append((current_name, body_start, len(data)))
+        finally:
+            data.close()
+    return ranges
+
+
+def read_section_text(file_path: str, start: int, end: int, encoding: str = 'latin-1') -> str:
+    """Read the text of one section body"""
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start).decode(encoding)
+
+
+def read_section_lines(file_path: str, start: int, end: int, encoding: str = 'latin-1') -> List[str]:
+    """Read the raw lines of one section body"""
+    return read_section_text(file_path, start, end, encoding).split('\n')
+
+
+def split_section_range(file_path: str, name: str, start: int, end: int, chunk_bytes: int,
+                        is_chunk_start: Optional[Callable[[bytes], bool]] = None) -> List[Tuple[str, int, int]]:
+    """Split one section body into (name, start, end) chunks of about chunk_bytes.
+    
+    Chunks always start at the beginning of a line; with is_chunk_start they
+    only start on a line for which it returns True (e.g. a boundary name).
+    """
+    if chunk_bytes <= 0 or end - start <= chunk_bytes:
+        return [(name, start, end)]
+    
+    chunks = []
+    with open(file_path, 'rb') as f:
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            chunk_start = start
+            while end - chunk_start > chunk_bytes:
+                newline = data.find(b'\n', chunk_start + chunk_bytes, end)
+                if newline < 0:
+                    break
+                split = newline + 1
+                if is_chunk_start is not None:
+                    while split < end:
+                        line_end = data.find(b'\n', split, end)
+                        if line_end < 0:
+                            line_end = end
+                        if is_chunk_start(data[split:line_end]):
+                            break
+                        split = line_end + 1
+                if split >= end:
+                    break
+                chunks.append((name, chunk_start, split))
+                chunk_start = split
+            chunks.append((name, chunk_start, end))
+        finally:
+            data.close()
+    return chunks
+
+
+__all__ = ['scan_section_ranges', 'read_section_text', 'read_section_lines', 'split_section_range']
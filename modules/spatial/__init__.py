@@ -0,0 +1,14 @@
+from .geo import EARTH_RADIUS_NM, haversine_nm, destination_point
+from .lod import BoundaryLOD
+from .point_index import PointIndex, build_navdata_index
+from .sector_locator import SectorLocator
+
+__all__ = [
+    'EARTH_RADIUS_NM',
+    'haversine_nm',
+    'destination_point',
+    'PointIndex',
+    'build_navdata_index',
+    'SectorLocator',
+    'BoundaryLOD'
+]
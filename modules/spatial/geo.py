@@ -0,0 +1,91 @@
+# geo.py
+"""Great-circle, projection and boundary helpers shared by the spatial modules."""
+import math
+from typing import Any, List, Sequence, Tuple
+
+EARTH_RADIUS_NM = 3440.065
+
+# Half the Earth's circumference; no two points are further apart
+MAX_DISTANCE_NM = math.pi * EARTH_RADIUS_NM
+
+# Web Mercator cuts off at this latitude
+MAX_MERCATOR_LAT = 85.05112878
+
+
+def haversine_nm(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance in nautical miles"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_NM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def destination_point(lat: float, lon: float, bearing_deg: float, distance_nm: float) -> Tuple[float, float]:
+    """Point reached from (lat, lon) along a great circle"""
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    theta = math.radians(bearing_deg)
+    delta = distance_nm / EARTH_RADIUS_NM
+
+    phi2 = math.asin(math.sin(phi) * math.cos(delta) + math.cos(phi) * math.sin(delta) * math.cos(theta))
+    lam2 = lam + math.atan2(math.sin(theta) * math.sin(delta) * math.cos(phi),
+                            math.cos(delta) - math.sin(phi) * math.sin(phi2))
+    lon2 = (math.degrees(lam2) + 540) % 360 - 180
+    return math.degrees(phi2), lon2
+
+
+def longitude_span_deg(lat: float, distance_nm: float) -> float:
+    """Largest longitude difference of points within distance_nm (360 if unbounded)"""
+    delta = distance_nm / EARTH_RADIUS_NM
+    cos_lat = math.cos(math.radians(lat))
+    if delta >= math.pi / 2 or math.sin(delta) >= cos_lat:
+        return 360.0
+    return math.degrees(math.asin(math.sin(delta) / cos_lat))
+
+
+
+def mercator_xy(lat: float, lon: float) -> Tuple[float, float]:
+    """Web Mercator position normalized to 0..1 (x east, y south), as map tiles use"""
+    lat = max(-MAX_MERCATOR_LAT, min(MAX_MERCATOR_LAT, lat))
+    phi = math.radians(lat)
+    x = (lon + 180.0) / 360.0
+    y = (1.0 - math.log(math.tan(phi) + 1.0 / math.cos(phi)) / math.pi) / 2.0
+    return x, y
+
+
+def _point(value: Any) -> Tuple[float, float]:
+    if isinstance(value, dict):
+        return float(value['lat']), float(value['lon'])
+    return float(value[0]), float(value[1])
+
+
+def boundary_paths(boundary: Any) -> List[List[Tuple[float, float]]]:
+    """Polylines of a boundary: its 'paths', or its 'segments' chained end to start"""
+    if 'paths' in boundary:
+        return boundary['paths']
+
+    paths = []
+    for segment in boundary.get('segments', []):
+        start = _point(segment['start'])
+        end = _point(segment['end'])
+        if paths and paths[-1][-1] == start:
+            paths[-1].append(end)
+        else:
+            paths.append([start, end])
+    return paths
+
+
+def closed_rings(paths: Sequence[Sequence[Tuple[float, float]]]) -> List[List[Tuple[float, float]]]:
+    """Closed paths as rings without the repeated end point (a lone open path is closed implicitly)"""
+    rings = [list(path[:-1]) for path in paths if len(path) >= 4 and path[0] == path[-1]]
+    if not rings and len(paths) == 1 and len(paths[0]) >= 3:
+        rings.append(list(paths[0]))
+    return rings
+
+
+__all__ = [
+    'EARTH_RADIUS_NM', 'MAX_DISTANCE_NM', 'MAX_MERCATOR_LAT', 'haversine_nm', 'destination_point',
+    'longitude_span_deg', 'mercator_xy', 'boundary_paths', 'closed_rings'
+]
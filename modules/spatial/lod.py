@@ -0,0 +1,146 @@
+# lod.py
+"""Zoom-dependent level-of-detail pyramid for boundary polylines.
+
+Douglas-Peucker is run once per path in Web Mercator space, recording for
+every vertex the largest tolerance at which it survives. A zoom level then
+only needs a threshold filter: its tolerance is a fraction of a pixel at
+that zoom, so each level is as detailed as the screen can show and no more.
+Levels, and their Mercator projections for drawing, are materialized on
+first use and kept.
+"""
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .geo import boundary_paths, mercator_xy
+from .projection import ProjectedPaths
+
+Point = Tuple[float, float]
+
+TILE_SIZE_PX = 256
+# Simplification error allowed on screen
+DEFAULT_TOLERANCE_PX = 0.5
+# Zoom range covered by the pyramid; deeper zooms get the full paths
+MIN_LOD_ZOOM = 0
+MAX_LOD_ZOOM = 14
+
+
+def vertex_significance(path: Sequence[Point]) -> List[float]:
+    """Douglas-Peucker tolerance (normalized Mercator units) below which each vertex is kept.
+
+    End points are always kept. Values are capped by the enclosing split's
+    value, so filtering with `significance > tolerance` gives exactly the
+    Douglas-Peucker result for that tolerance.
+    """
+    count = len(path)
+    significance = [0.0] * count
+    if count == 0:
+        return significance
+    significance[0] = significance[-1] = math.inf
+
+    xy = [mercator_xy(lat, lon) for lat, lon in path]
+    stack = [(0, count - 1, math.inf)]
+    while stack:
+        first, last, cap = stack.pop()
+        if last - first < 2:
+            continue
+
+        x1, y1 = xy[first]
+        x2, y2 = xy[last]
+        dx = x2 - x1
+        dy = y2 - y1
+        length_sq = dx * dx + dy * dy
+
+        best = -1.0
+        best_index = first + 1
+        for i in range(first + 1, last):
+            px, py = xy[i]
+            if length_sq == 0.0:
+                # Closed ring: distance to the shared end point
+                distance_sq = (px - x1) ** 2 + (py - y1) ** 2
+            else:
+                t = max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / length_sq))
+                distance_sq = (px - x1 - t * dx) ** 2 + (py - y1 - t * dy) ** 2
+            if distance_sq > best:
+                best = distance_sq
+                best_index = i
+
+        value = min(math.sqrt(best), cap)
+        significance[best_index] = value
+        stack.append((first, best_index, value))
+        stack.append((best_index, last, value))
+
+    return significance
+
+
+def tolerance_for_zoom(zoom: float, tolerance_px: float = DEFAULT_TOLERANCE_PX) -> float:
+    """Normalized Mercator distance covered by tolerance_px pixels at a zoom level"""
+    return tolerance_px / (TILE_SIZE_PX * 2 ** zoom)
+
+
+class BoundaryLOD:
+    """Simplified copies of a set of polylines, one per zoom level"""
+
+    def __init__(self, paths: Iterable[Sequence[Point]], tolerance_px: float = DEFAULT_TOLERANCE_PX,
+                 min_zoom: int = MIN_LOD_ZOOM, max_zoom: int = MAX_LOD_ZOOM):
+        self.tolerance_px = tolerance_px
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.paths: List[List[Point]] = [list(path) for path in paths if len(path) >= 2]
+        self.significance = [vertex_significance(path) for path in self.paths]
+        self._levels: Dict[int, List[List[Point]]] = {}
+        self._projected: Dict[Tuple[int, Optional[int]], ProjectedPaths] = {}
+
+    @classmethod
+    def from_boundaries(cls, boundaries: Any, **kwargs) -> 'BoundaryLOD':
+        """Build from a BoundaryStore (shared edges merged) or boundary dicts"""
+        if hasattr(boundaries, 'merged_paths'):
+            return cls(boundaries.merged_paths(), **kwargs)
+        return cls((path for boundary in boundaries for path in boundary_paths(boundary)), **kwargs)
+
+    def level_for_zoom(self, zoom: float) -> int:
+        """Pyramid level used at a (possibly fractional) map zoom; max_zoom + 1 means full detail"""
+        return max(self.min_zoom, min(self.max_zoom + 1, int(math.floor(zoom))))
+
+    def paths_for_level(self, level: int) -> List[List[Point]]:
+        """Simplified paths of one level, built on first request"""
+        paths = self._levels.get(level)
+        if paths is not None:
+            return paths
+
+        if level > self.max_zoom:
+            paths = self.paths
+        else:
+            tolerance = tolerance_for_zoom(level, self.tolerance_px)
+            paths = []
+            for path, significance in zip(self.paths, self.significance):
+                simplified = [point for point, value in zip(path, significance) if value > tolerance]
+                # Rings smaller than the tolerance collapse onto their end point
+                if len(simplified) > 2 or simplified[0] != simplified[-1]:
+                    paths.append(simplified)
+        self._levels[level] = paths
+        return paths
+
+    def projected_for_level(self, level: int, chunk_vertices: Optional[int] = None) -> ProjectedPaths:
+        """One level's paths projected to normalized Mercator arrays, built on first request"""
+        key = (level, chunk_vertices)
+        projected = self._projected.get(key)
+        if projected is None:
+            projected = ProjectedPaths(self.paths_for_level(level), chunk_vertices)
+            self._projected[key] = projected
+        return projected
+
+    def paths_for_zoom(self, zoom: float) -> List[List[Point]]:
+        """Simplified paths to draw at a map zoom"""
+        return self.paths_for_level(self.level_for_zoom(zoom))
+
+    def vertex_count(self, level: Optional[int] = None) -> int:
+        """Vertices in one level (the full paths if level is None)"""
+        paths = self.paths if level is None else self.paths_for_level(level)
+        return sum(len(path) for path in paths)
+
+    def __repr__(self) -> str:
+        return f"BoundaryLOD({len(self.paths)} paths, zoom {self.min_zoom}-{self.max_zoom})"
+
+
+__all__ = ['BoundaryLOD', 'vertex_significance', 'tolerance_for_zoom', 'DEFAULT_TOLERANCE_PX',
+           'MIN_LOD_ZOOM', 'MAX_LOD_ZOOM']
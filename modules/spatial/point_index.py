@@ -0,0 +1,158 @@
+# point_index.py
+"""Grid index over lat/lon points for radius, nearest and bounding-box queries.
+
+Points are bucketed into fixed-size lat/lon cells. A radius query only
+visits the cells overlapping the search cap (longitude span widened by
+latitude and wrapped across the antimeridian) and then filters the
+candidates by great-circle distance, so results are exact.
+"""
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .geo import MAX_DISTANCE_NM, haversine_nm, longitude_span_deg
+
+DEFAULT_CELL_SIZE_DEG = 0.5
+
+
+class PointIndex:
+    """Uniform grid of points, each carrying an arbitrary item"""
+
+    def __init__(self, cell_size_deg: float = DEFAULT_CELL_SIZE_DEG):
+        self.cell_size = cell_size_deg
+        self._lat_cells = int(math.ceil(180 / cell_size_deg))
+        self._lon_cells = int(math.ceil(360 / cell_size_deg))
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self.lats: List[float] = []
+        self.lons: List[float] = []
+        self.items: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _lat_cell(self, lat: float) -> int:
+        return min(self._lat_cells - 1, max(0, int((lat + 90) // self.cell_size)))
+
+    def _lon_cell(self, lon: float) -> int:
+        return int(((lon + 180) % 360) // self.cell_size) % self._lon_cells
+
+    def add(self, lat: float, lon: float, item: Any):
+        """Insert one point"""
+        index = len(self.items)
+        self.lats.append(lat)
+        self.lons.append(lon)
+        self.items.append(item)
+        self._cells.setdefault((self._lat_cell(lat), self._lon_cell(lon)), []).append(index)
+
+    def extend(self, points: Iterable[Tuple[float, float, Any]]):
+        """Insert (lat, lon, item) tuples"""
+        for lat, lon, item in points:
+            self.add(lat, lon, item)
+
+    def _candidates(self, min_lat: float, max_lat: float, lon: float, lon_span: float) -> Iterable[int]:
+        """Point indexes in cells covering a latitude band and longitude window"""
+        first_row = self._lat_cell(min_lat)
+        last_row = self._lat_cell(max_lat)
+        if lon_span >= 180:
+            columns = range(self._lon_cells)
+        else:
+            first_col = self._lon_cell(lon - lon_span)
+            width = int(math.ceil(2 * lon_span / self.cell_size)) + 1
+            if width >= self._lon_cells:
+                columns = range(self._lon_cells)
+            else:
+                columns = [(first_col + c) % self._lon_cells for c in range(width)]
+
+        cells = self._cells
+        for row in range(first_row, last_row + 1):
+            for col in columns:
+                bucket = cells.get((row, col))
+                if bucket:
+                    yield from bucket
+
+    def within_radius(self, lat: float, lon: float, radius_nm: float,
+                      accept: Optional[Callable[[Any], bool]] = None) -> List[Tuple[float, Any]]:
+        """(distance_nm, item) pairs within radius_nm, closest first"""
+        radius_deg = radius_nm / 60.0
+        min_lat = lat - radius_deg
+        max_lat = lat + radius_deg
+        if min_lat <= -90 or max_lat >= 90:
+            lon_span = 360.0
+        else:
+            lon_span = longitude_span_deg(lat, radius_nm)
+
+        results = []
+        lats, lons, items = self.lats, self.lons, self.items
+        for i in self._candidates(min_lat, max_lat, lon, lon_span):
+            if accept is not None and not accept(items[i]):
+                continue
+            distance = haversine_nm(lat, lon, lats[i], lons[i])
+            if distance <= radius_nm:
+                results.append((distance, i))
+
+        results.sort()
+        return [(distance, items[i]) for distance, i in results]
+
+    def nearest(self, lat: float, lon: float, k: int = 1, max_distance_nm: Optional[float] = None,
+                accept: Optional[Callable[[Any], bool]] = None) -> List[Tuple[float, Any]]:
+        """The k closest (distance_nm, item) pairs, closest first"""
+        if not self.items or k <= 0:
+            return []
+
+        limit = MAX_DISTANCE_NM if max_distance_nm is None else max_distance_nm
+        radius = min(limit, self.cell_size * 60.0)
+        while True:
+            # Everything within radius has been seen, so the k closest are exact
+            found = self.within_radius(lat, lon, radius, accept)
+            if len(found) >= k or radius >= limit:
+                return found[:k]
+            radius = min(limit, radius * 2)
+
+    def within_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> List[Any]:
+        """Items inside a lat/lon box (min_lon > max_lon wraps the antimeridian)"""
+        wraps = min_lon > max_lon
+        span = (max_lon - min_lon) % 360 if wraps else max_lon - min_lon
+        center = min_lon + span / 2
+
+        results = []
+        lats, lons = self.lats, self.lons
+        for i in self._candidates(min_lat, max_lat, center, span / 2):
+            if not min_lat <= lats[i] <= max_lat:
+                continue
+            point_lon = lons[i]
+            inside = (point_lon >= min_lon or point_lon <= max_lon) if wraps else min_lon <= point_lon <= max_lon
+            if inside:
+                results.append(i)
+
+        results.sort()
+        return [self.items[i] for i in results]
+
+
+def build_navdata_index(data: Dict[str, Any], cell_size_deg: float = DEFAULT_CELL_SIZE_DEG) -> PointIndex:
+    """Index fixes, VORs, NDBs and airports from SCTParser.get_data() output.
+
+    Items are dicts with 'kind', 'name', 'lat', 'lon' and the source 'data'.
+    """
+    index = PointIndex(cell_size_deg)
+    sources = (
+        ('fix', 'fixes', 'name'),
+        ('VOR', 'VOR', 'id'),
+        ('NDB', 'NDB', 'id'),
+        ('airport', 'airports', 'icao'),
+    )
+    for kind, key, name_field in sources:
+        for entry in data.get(key, []):
+            lat = entry.get('latitude')
+            lon = entry.get('longitude')
+            if lat is None or lon is None:
+                continue
+            index.add(lat, lon, {
+                'kind': kind,
+                'name': entry.get(name_field),
+                'lat': lat,
+                'lon': lon,
+                'data': entry
+            })
+    return index
+
+
+__all__ = ['PointIndex', 'build_navdata_index', 'DEFAULT_CELL_SIZE_DEG']
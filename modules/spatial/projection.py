@@ -0,0 +1,161 @@
+# projection.py
+"""Vectorized Web Mercator projection for map drawing.
+
+Positions are projected once into normalized Mercator space (0..1, x east,
+y south, as map tiles use). Placing them on a map view is then a single
+affine transform: a scale by the number of pixels per world width and an
+offset for the scroll position. With NumPy installed both steps work on
+whole arrays at once; without it they fall back to plain Python lists.
+
+ProjectedPaths keeps a whole layer of polylines this way, so static map
+layers are projected once and only transformed when the view changes.
+"""
+import math
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .geo import MAX_MERCATOR_LAT, mercator_xy
+
+HAS_NUMPY = np is not None
+
+
+def mercator_arrays(points: Iterable[Tuple[float, float]]):
+    """(xs, ys) normalized Mercator arrays of (lat, lon) points"""
+    if np is not None:
+        latlon = np.asarray(list(points), dtype=np.float64).reshape(-1, 2)
+        phi = np.radians(np.clip(latlon[:, 0], -MAX_MERCATOR_LAT, MAX_MERCATOR_LAT))
+        xs = (latlon[:, 1] + 180.0) / 360.0
+        ys = (1.0 - np.log(np.tan(phi) + 1.0 / np.cos(phi)) / math.pi) / 2.0
+        return xs, ys
+
+    xs = array('d')
+    ys = array('d')
+    for lat, lon in points:
+        x, y = mercator_xy(lat, lon)
+        xs.append(x)
+        ys.append(y)
+    return xs, ys
+
+
+class ProjectedPaths:
+    """Polylines projected once and stored as one pair of normalized Mercator arrays.
+
+    With chunk_vertices set, long paths are cut into overlapping pieces of
+    at most that many vertices, so culling by path box stays tight.
+    """
+
+    def __init__(self, paths: Iterable[Sequence[Tuple[float, float]]], chunk_vertices: Optional[int] = None):
+        points = []
+        self.starts = [0]  # path i spans points starts[i]:starts[i + 1]
+        for path in paths:
+            if len(path) < 2:
+                continue
+            step = len(path) - 1 if not chunk_vertices else chunk_vertices - 1
+            for start in range(0, len(path) - 1, step):
+                points.extend(path[start:start + step + 1])
+                self.starts.append(len(points))
+        self.xs, self.ys = mercator_arrays(points)
+
+        # Bounding box of every path, for culling
+        if np is not None and points:
+            firsts = np.asarray(self.starts[:-1])
+            self.min_xs = np.minimum.reduceat(self.xs, firsts)
+            self.max_xs = np.maximum.reduceat(self.xs, firsts)
+            self.min_ys = np.minimum.reduceat(self.ys, firsts)
+            self.max_ys = np.maximum.reduceat(self.ys, firsts)
+        else:
+            spans = list(zip(self.starts, self.starts[1:]))
+            self.min_xs = [min(self.xs[a:b]) for a, b in spans]
+            self.max_xs = [max(self.xs[a:b]) for a, b in spans]
+            self.min_ys = [min(self.ys[a:b]) for a, b in spans]
+            self.max_ys = [max(self.ys[a:b]) for a, b in spans]
+
+    def __len__(self) -> int:
+        return len(self.starts) - 1
+
+    @property
+    def vertex_count(self) -> int:
+        return self.starts[-1]
+
+    def visible(self, transform: 'ViewTransform', left: float, top: float, right: float, bottom: float) -> List[int]:
+        """Indices of the paths whose box intersects a canvas rectangle"""
+        # Canvas rectangle in normalized space
+        min_x = (left - transform.offset_x) / transform.scale_x
+        max_x = (right - transform.offset_x) / transform.scale_x
+        min_y = (top - transform.offset_y) / transform.scale_y
+        max_y = (bottom - transform.offset_y) / transform.scale_y
+        if np is not None and len(self):
+            inside = ((self.min_xs <= max_x) & (self.max_xs >= min_x)
+                      & (self.min_ys <= max_y) & (self.max_ys >= min_y))
+            return np.flatnonzero(inside).tolist()
+        return [i for i in range(len(self))
+                if self.min_xs[i] <= max_x and self.max_xs[i] >= min_x
+                and self.min_ys[i] <= max_y and self.max_ys[i] >= min_y]
+
+    def canvas_coords(self, transform: 'ViewTransform'):
+        """Interleaved x, y canvas coordinates of every point"""
+        xs, ys = transform.apply(self.xs, self.ys)
+        if np is not None:
+            flat = np.empty(2 * len(xs))
+            flat[0::2] = xs
+            flat[1::2] = ys
+            return flat
+        return [value for point in zip(xs, ys) for value in point]
+
+    def path_coords(self, flat, index: int) -> List[float]:
+        """Flat canvas coordinate list of one path, as Tk line items take"""
+        coords = flat[2 * self.starts[index]:2 * self.starts[index + 1]]
+        return coords.tolist() if np is not None else coords
+
+
+class ViewTransform:
+    """Affine map from normalized Mercator space to a map widget's canvas pixels"""
+
+    def __init__(self, scale_x: float, scale_y: float, offset_x: float, offset_y: float):
+        self.scale_x = scale_x
+        self.scale_y = scale_y
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+
+    @classmethod
+    def from_map(cls, map_widget) -> 'ViewTransform':
+        """Transform of the view a tkintermapview widget currently shows"""
+        world = 2.0 ** round(map_widget.zoom)
+        left, top = map_widget.upper_left_tile_pos
+        right, bottom = map_widget.lower_right_tile_pos
+        pixels_x = map_widget.width / (right - left)
+        pixels_y = map_widget.height / (bottom - top)
+        return cls(world * pixels_x, world * pixels_y, -left * pixels_x, -top * pixels_y)
+
+    def same_scale(self, other: 'ViewTransform') -> bool:
+        """True if other differs from this one by a pan only"""
+        return (other is not None and math.isclose(self.scale_x, other.scale_x)
+                and math.isclose(self.scale_y, other.scale_y))
+
+    def point(self, x: float, y: float) -> Tuple[float, float]:
+        """Canvas position of one normalized point"""
+        return x * self.scale_x + self.offset_x, y * self.scale_y + self.offset_y
+
+    def apply(self, xs, ys):
+        """Canvas (xs, ys) of normalized arrays"""
+        if np is not None:
+            return (np.asarray(xs) * self.scale_x + self.offset_x,
+                    np.asarray(ys) * self.scale_y + self.offset_y)
+        return ([x * self.scale_x + self.offset_x for x in xs],
+                [y * self.scale_y + self.offset_y for y in ys])
+
+    def __eq__(self, other) -> bool:
+        return (isinstance(other, ViewTransform) and self.same_scale(other)
+                and math.isclose(self.offset_x, other.offset_x, abs_tol=1e-6)
+                and math.isclose(self.offset_y, other.offset_y, abs_tol=1e-6))
+
+    def __repr__(self) -> str:
+        return f"ViewTransform(scale={self.scale_x:.1f}, offset=({self.offset_x:.1f}, {self.offset_y:.1f}))"
+
+
+__all__ = ['HAS_NUMPY', 'mercator_arrays', 'ProjectedPaths', 'ViewTransform']
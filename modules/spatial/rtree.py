@@ -0,0 +1,108 @@
+# rtree.py
+"""Static bounding-box R-tree, bulk-loaded with Sort-Tile-Recursive packing.
+
+Entries are (min_lat, min_lon, max_lat, max_lon) boxes carrying an item.
+The tree is packed once from the full entry list, which gives well-filled
+nodes with little overlap; adding entries afterwards triggers a repack on
+the next query.
+"""
+import math
+from typing import Any, Iterator, List, Optional, Tuple
+
+BBox = Tuple[float, float, float, float]
+
+DEFAULT_NODE_CAPACITY = 16
+
+
+def bbox_union(boxes) -> BBox:
+    """Smallest box covering all boxes"""
+    boxes = list(boxes)
+    return (min(b[0] for b in boxes), min(b[1] for b in boxes),
+            max(b[2] for b in boxes), max(b[3] for b in boxes))
+
+
+def path_bbox(path) -> BBox:
+    """Bounding box of a list of (lat, lon) points"""
+    lats = [point[0] for point in path]
+    lons = [point[1] for point in path]
+    return (min(lats), min(lons), max(lats), max(lons))
+
+
+def _str_pack(entries: List[Tuple[BBox, Any]], capacity: int) -> List[Tuple[BBox, Any]]:
+    """Group (bbox, child) entries into parent nodes, Sort-Tile-Recursive style"""
+    node_count = int(math.ceil(len(entries) / capacity))
+    slice_count = int(math.ceil(math.sqrt(node_count)))
+    slice_size = slice_count * capacity
+
+    # Sort by box centre longitude into vertical slices, then by latitude
+    entries = sorted(entries, key=lambda e: e[0][1] + e[0][3])
+    parents = []
+    for s in range(0, len(entries), slice_size):
+        vertical = sorted(entries[s:s + slice_size], key=lambda e: e[0][0] + e[0][2])
+        for n in range(0, len(vertical), capacity):
+            children = vertical[n:n + capacity]
+            parents.append((bbox_union(c[0] for c in children), children))
+    return parents
+
+
+class _Leaf:
+    __slots__ = ('item',)
+
+    def __init__(self, item: Any):
+        self.item = item
+
+
+class RTree:
+    """Bounding boxes with point and box intersection queries"""
+
+    def __init__(self, node_capacity: int = DEFAULT_NODE_CAPACITY):
+        self.node_capacity = node_capacity
+        self._entries: List[Tuple[BBox, _Leaf]] = []
+        self._root: Optional[List[Tuple[BBox, Any]]] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def insert(self, bbox: BBox, item: Any):
+        """Add one box; the tree is repacked on the next query"""
+        self._entries.append((tuple(bbox), _Leaf(item)))
+        self._root = None
+
+    def bounds(self) -> Optional[BBox]:
+        """Box covering every entry, or None when empty"""
+        if not self._entries:
+            return None
+        return bbox_union(bbox for bbox, _ in self._entries)
+
+    def _build(self):
+        level = list(self._entries)
+        while len(level) > self.node_capacity:
+            level = _str_pack(level, self.node_capacity)
+        self._root = level
+
+    def _search(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> Iterator[Any]:
+        if self._root is None:
+            self._build()
+        stack = [self._root]
+        while stack:
+            for bbox, child in stack.pop():
+                if bbox[0] <= max_lat and bbox[2] >= min_lat and bbox[1] <= max_lon and bbox[3] >= min_lon:
+                    if isinstance(child, _Leaf):
+                        yield child.item
+                    else:
+                        stack.append(child)
+
+    def search_point(self, lat: float, lon: float) -> Iterator[Any]:
+        """Items whose box contains the point"""
+        return self._search(lat, lon, lat, lon)
+
+    def search_bbox(self, min_lat: float, min_lon: float, max_lat: float, max_lon: float) -> Iterator[Any]:
+        """Items whose box intersects the query box (min_lon > max_lon wraps the antimeridian)"""
+        if min_lon > max_lon:
+            yield from self._search(min_lat, min_lon, max_lat, 180.0)
+            yield from self._search(min_lat, -180.0, max_lat, max_lon)
+        else:
+            yield from self._search(min_lat, min_lon, max_lat, max_lon)
+
+
+__all__ = ['RTree', 'BBox', 'bbox_union', 'path_bbox', 'DEFAULT_NODE_CAPACITY']
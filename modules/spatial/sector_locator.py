@@ -0,0 +1,153 @@
+# sector_locator.py
+"""Point-in-sector lookup over ARTCC HIGH/LOW boundary polygons.
+
+Every boundary's closed rings become one polygon (even-odd rule, so holes
+work). Polygon bounding boxes are packed into a Sort-Tile-Recursive
+R-tree; a lookup walks only the nodes whose boxes contain the point and
+runs a ray-casting test on the few polygons left.
+"""
+import random
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .geo import boundary_paths, closed_rings
+from .rtree import DEFAULT_NODE_CAPACITY, RTree, path_bbox
+
+LEVEL_HIGH = 'HIGH'
+LEVEL_LOW = 'LOW'
+
+# Altitude (ft) from which the HIGH layer applies (FL245)
+DEFAULT_HIGH_FLOOR_FT = 24500
+
+
+class _Sector:
+    __slots__ = ('name', 'level', 'rings', 'bbox')
+
+    def __init__(self, name: str, level: str, rings: List[List[Tuple[float, float]]]):
+        self.name = name
+        self.level = level
+        self.rings = rings
+        self.bbox = path_bbox([point for ring in rings for point in ring])
+
+    def contains(self, lat: float, lon: float) -> bool:
+        return rings_contain(self.rings, lat, lon)
+
+
+def rings_contain(rings: Iterable[Sequence[Tuple[float, float]]], lat: float, lon: float) -> bool:
+    """Even-odd ray cast along the latitude line through the point"""
+    inside = False
+    for ring in rings:
+        lat1, lon1 = ring[-1]
+        for lat2, lon2 in ring:
+            if (lat1 > lat) != (lat2 > lat):
+                cross_lon = lon1 + (lat - lat1) * (lon2 - lon1) / (lat2 - lat1)
+                if lon < cross_lon:
+                    inside = not inside
+            lat1, lon1 = lat2, lon2
+    return inside
+
+
+class SectorLocator:
+    """Answers which ARTCC sector(s) contain a position"""
+
+    def __init__(self, high_floor_ft: float = DEFAULT_HIGH_FLOOR_FT, node_capacity: int = DEFAULT_NODE_CAPACITY):
+        self.high_floor_ft = high_floor_ft
+        self.node_capacity = node_capacity
+        self.sectors: List[_Sector] = []
+        self._tree = None
+
+    @classmethod
+    def from_parser(cls, parser, **kwargs) -> 'SectorLocator':
+        """Build from an SCTParser's ARTCC HIGH and LOW layers"""
+        locator = cls(**kwargs)
+        data = parser.get_data()
+        locator.add_layer(LEVEL_HIGH, data.get('ARTCC_HIGH', []))
+        locator.add_layer(LEVEL_LOW, data.get('ARTCC_LOW', []))
+        return locator
+
+    def add_layer(self, level: str, boundaries: Iterable[Any]):
+        """Add every boundary of a layer that forms a polygon"""
+        for boundary in boundaries:
+            rings = closed_rings(boundary_paths(boundary))
+            if rings:
+                self.sectors.append(_Sector(boundary.get('name'), level, rings))
+        self._tree = None
+
+    def __len__(self) -> int:
+        return len(self.sectors)
+
+    def level_for_altitude(self, altitude_ft: Optional[float]) -> Optional[str]:
+        """HIGH at or above high_floor_ft, LOW below, None if unknown"""
+        if altitude_ft is None:
+            return None
+        return LEVEL_HIGH if altitude_ft >= self.high_floor_ft else LEVEL_LOW
+
+    def _build(self):
+        self._tree = RTree(self.node_capacity)
+        for sector in self.sectors:
+            self._tree.insert(sector.bbox, sector)
+
+    def _candidates(self, lat: float, lon: float) -> Iterable[_Sector]:
+        if self._tree is None:
+            self._build()
+        return self._tree.search_point(lat, lon)
+
+    def locate(self, lat: float, lon: float, level: Optional[str] = None,
+               altitude_ft: Optional[float] = None) -> List[Dict[str, str]]:
+        """Sectors containing the point as {'name', 'level'} dicts.
+
+        level restricts the layer; otherwise altitude_ft picks it, and with
+        neither every layer is searched.
+        """
+        if level is None:
+            level = self.level_for_altitude(altitude_ft)
+        matches = []
+        for sector in self._candidates(lat, lon):
+            if (level is None or sector.level == level) and sector.contains(lat, lon):
+                matches.append({'name': sector.name, 'level': sector.level})
+        matches.sort(key=lambda m: (m['level'], m['name'] or ''))
+        return matches
+
+    def locate_first(self, lat: float, lon: float, level: Optional[str] = None,
+                     altitude_ft: Optional[float] = None) -> Optional[Dict[str, str]]:
+        """First matching sector, or None"""
+        matches = self.locate(lat, lon, level, altitude_ft)
+        return matches[0] if matches else None
+
+    def locate_many(self, points: Sequence[Sequence[float]],
+                    level: Optional[str] = None) -> List[List[Dict[str, str]]]:
+        """Classify many (lat, lon) or (lat, lon, altitude_ft) points in one call"""
+        if self._tree is None:
+            self._build()
+        results = []
+        for point in points:
+            altitude = point[2] if len(point) > 2 else None
+            results.append(self.locate(point[0], point[1], level, altitude))
+        return results
+
+    def contains(self, lat: float, lon: float, level: Optional[str] = None) -> bool:
+        """True if any sector (of the given layer) contains the point"""
+        return self.locate_first(lat, lon, level) is not None
+
+    def sector_names(self, level: Optional[str] = None) -> List[str]:
+        """Names of the indexed sectors (of one layer if given)"""
+        return [s.name for s in self.sectors if level is None or s.level == level]
+
+    def sample_point(self, names: Optional[Iterable[str]] = None, level: Optional[str] = None,
+                     attempts: int = 100) -> Optional[Tuple[float, float]]:
+        """Random (lat, lon) inside one of the named sectors, or None if sampling fails"""
+        wanted = None if names is None else set(names)
+        pool = [s for s in self.sectors
+                if (wanted is None or s.name in wanted) and (level is None or s.level == level)]
+        if not pool:
+            return None
+        for _ in range(attempts):
+            sector = random.choice(pool)
+            min_lat, min_lon, max_lat, max_lon = sector.bbox
+            lat = random.uniform(min_lat, max_lat)
+            lon = random.uniform(min_lon, max_lon)
+            if sector.contains(lat, lon):
+                return lat, lon
+        return None
+
+
+__all__ = ['SectorLocator', 'rings_contain', 'LEVEL_HIGH', 'LEVEL_LOW', 'DEFAULT_HIGH_FLOOR_FT']
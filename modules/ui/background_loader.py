@@ -0,0 +1,155 @@
+# background_loader.py
+"""Run slow work (file parsing) off the Tk main thread.
+
+Tk widgets may only be used from the thread running the main loop. A
+BackgroundLoader runs jobs on a small thread pool; workers never call
+into Tk but post their progress, result or error on a queue, which the
+main loop drains with after() and hands to the job's callbacks there.
+
+A job is a function taking its LoadJob. It reports progress with
+job.report(), which also raises LoadCancelled once the job has been
+cancelled, so cancellation takes effect at the next report. Starting a
+job under a name that is still running cancels the older one, and the
+results of cancelled jobs are dropped.
+"""
+import queue
+import threading
+import tkinter as tk
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_WORKERS = 2
+# How often (ms) the main loop checks for worker messages while jobs run
+POLL_MS = 50
+
+
+class LoadCancelled(Exception):
+    """Raised inside a job once it has been cancelled"""
+
+
+class LoadJob:
+    """One piece of background work; the worker side of it"""
+
+    def __init__(self, name, messages):
+        self.name = name
+        self._messages = messages
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def check(self):
+        """Raise LoadCancelled if the job was cancelled"""
+        if self._cancelled.is_set():
+            raise LoadCancelled(self.name)
+
+    def report(self, fraction=None, message=""):
+        """Post progress (fraction 0..1 or None) for the main thread, stopping here if cancelled"""
+        self.check()
+        self._messages.put(('progress', self, (fraction, message)))
+
+
+class BackgroundLoader:
+    """Thread pool for jobs whose callbacks run on the Tk main thread"""
+
+    def __init__(self, widget, workers=DEFAULT_WORKERS, poll_ms=POLL_MS):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="loader")
+        self._messages = queue.Queue()
+        self._jobs = {}  # name -> (job, callbacks) of the current job under that name
+        self._polling = False
+
+    @property
+    def busy(self):
+        return bool(self._jobs)
+
+    def running(self):
+        """Names of the jobs still running"""
+        return list(self._jobs)
+
+    def submit(self, name, work, on_done=None, on_error=None, on_progress=None):
+        """Run work(job) on a worker thread; callbacks get (job, value) on the main thread"""
+        self.cancel(name)
+        job = LoadJob(name, self._messages)
+        self._jobs[name] = (job, {'done': on_done, 'error': on_error, 'progress': on_progress})
+        self._pool.submit(self._run, job, work)
+        self._schedule_poll()
+        return job
+
+    def cancel(self, name=None):
+        """Cancel the job under a name, or every job; their results are dropped"""
+        names = [name] if name is not None else list(self._jobs)
+        for job_name in names:
+            entry = self._jobs.pop(job_name, None)
+            if entry is not None:
+                entry[0].cancel()
+                print(f"DEBUG: Cancelled background job {job_name}")
+
+    def shutdown(self):
+        self.cancel()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job, work):
+        # Worker thread: no Tk calls here, only queue messages
+        try:
+            job.check()
+            result = work(job)
+            job.check()
+            self._messages.put(('done', job, result))
+        except LoadCancelled:
+            pass
+        except Exception as e:
+            traceback.print_exc()
+            self._messages.put(('error', job, e))
+
+    def _call(self, callback, job, value):
+        """Run a callback on the main thread - returns the exception it raised, if any"""
+        try:
+            callback(job, value)
+        except Exception as e:
+            traceback.print_exc()
+            return e
+        return None
+
+    def _schedule_poll(self):
+        if not self._polling:
+            self.widget.after(self.poll_ms, self._poll)
+            self._polling = True
+
+    def _poll(self):
+        self._polling = False
+        while True:
+            try:
+                kind, job, value = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            entry = self._jobs.get(job.name)
+            if entry is None or entry[0] is not job or job.cancelled:
+                # Superseded or cancelled
+                continue
+            if kind != 'progress':
+                del self._jobs[job.name]
+            callback = entry[1][kind]
+            if callback is None:
+                if kind == 'error':
+                    print(f"DEBUG: Background job {job.name} failed: {value}")
+                continue
+            error = self._call(callback, job, value)
+            # A failing result handler is reported like a failed job
+            if error is not None and kind == 'done' and entry[1]['error'] is not None:
+                self._call(entry[1]['error'], job, error)
+
+        if self._jobs:
+            try:
+                self._schedule_poll()
+            except tk.TclError:
+                # Widget destroyed
+                self.shutdown()
+
+
+__all__ = ['BackgroundLoader', 'LoadJob', 'LoadCancelled']
@@ -6,6 +6,8 @@ class ControllerViewer:
         self.parent = parent
         self.ese_parser = ese_parser
         self.positions = ese_parser.get_positions()
+        # The parser's positions, indexed by callsign, type and prefix
+        self.position_table = ese_parser.get_position_table()
         
         self.setup_ui()
     
@@ -197,11 +199,7 @@ class ControllerViewer:
         filter_type = self.filter_var.get()
         search_text = search_text.lower() if search_text else ""
         
-        for position in self.positions:
-            # Apply type filter
-            if filter_type != 'ALL' and position['type'] != filter_type:
-                continue
-            
+        for position in self.filtered_positions(filter_type):
             # Apply search filter
             if search_text:
                 search_fields = [
@@ -236,6 +234,12 @@ class ControllerViewer:
                 coords_display
             ), tags=(item_tag,))
     
+    def filtered_positions(self, filter_type):
+        """Positions of one type ('ALL' for every one), straight from the type index"""
+        if filter_type == 'ALL':
+            return self.positions
+        return self.position_table.positions_of(self.position_table.select(position_type=filter_type))
+    
     def apply_filter(self):
         """Apply the selected filter"""
         self.populate_tree(self.search_var.get())
@@ -286,19 +290,18 @@ class ControllerViewer:
         else:
             # Count specific type
             count = 0
-            for pos in self.positions:
-                if pos['type'] == filter_type:
-                    if search_text:
-                        search_fields = [
-                            pos['callsign'].lower(),
-                            pos['name'].lower(),
-                            pos['frequency'].lower(),
-                            pos['type'].lower(),
-                            pos['identifier'].lower()
-                        ]
-                        if not any(search_text in field for field in search_fields):
-                            continue
-                    count += 1
+            for pos in self.filtered_positions(filter_type):
+                if search_text:
+                    search_fields = [
+                        pos['callsign'].lower(),
+                        pos['name'].lower(),
+                        pos['frequency'].lower(),
+                        pos['type'].lower(),
+                        pos['identifier'].lower()
+                    ]
+                    if not any(search_text in field for field in search_fields):
+                        continue
+                count += 1
             
             if search_text:
                 return f"Showing {count} {filter_type} position(s) matching '{search_text}'"
@@ -0,0 +1,329 @@
+# map_layers.py
+"""Retained-mode layers for the tkintermapview viewers.
+
+Each MapLayer owns the map objects of one kind of data (airports, fixes,
+boundaries, aircraft, ...). Hiding a layer deletes only its own objects
+and showing it draws only what is in view again. sync() diffs a keyed
+feature set against what the layer already holds, so a data change
+patches just the features that were added, changed or removed.
+
+A viewport update can also be rendered progressively: the layers delete
+what left the view at once, then a ProgressiveRenderer creates the new
+map objects layer by layer, in priority order, in after() chunks that
+each stay within a frame's time budget, so the map stays interactive
+while a dense view fills in.
+
+A RedrawScheduler sits in front of all of this: redraw requests only mark
+parts of the map dirty, and everything requested within one event-loop
+turn is flushed as a single incremental update once Tk is idle, so bulk
+operations (adding many aircraft, toggling many layers) redraw once.
+"""
+import time
+import tkinter as tk
+from contextlib import contextmanager
+
+from .viewport import CulledLayer, viewport_bounds
+
+# Time (ms) spent creating map objects per event-loop turn during progressive rendering
+FRAME_BUDGET_MS = 12
+
+
+@contextmanager
+def batched_redraw(map_widget):
+    """Defer the map's marker z-order pass until a batch of changes is done.
+
+    tkintermapview re-raises every marker and path after each marker draw,
+    which makes updating many markers quadratic; within the batch it runs
+    once at the end instead.
+    """
+    manage_z_order = getattr(map_widget, 'manage_z_order', None)
+    if manage_z_order is None or 'manage_z_order' in vars(map_widget):
+        # Not a map widget, or already inside a batch
+        yield
+        return
+
+    map_widget.manage_z_order = lambda: None
+    try:
+        yield
+    finally:
+        del map_widget.manage_z_order
+        manage_z_order()
+
+
+class MapLayer(CulledLayer):
+    """A culled layer with its own visibility"""
+
+    def __init__(self, map_widget, name="", factory=None, updater=None, visible=True, culled=True):
+        super().__init__(map_widget, name, factory, updater)
+        self.visible = visible
+        # Small layers (e.g. aircraft) can skip culling so every feature stays on the map
+        self.culled = culled
+        self._last_viewport = None
+
+    def update(self, viewport):
+        removed = self.begin_update(viewport)
+        return self.draw_pending(), removed
+
+    def begin_update(self, viewport):
+        self._last_viewport = viewport
+        if not self.visible:
+            return 0
+        return super().begin_update(viewport if self.culled else None)
+
+    def draw_pending(self, deadline=None):
+        # Markers re-raise every map object after each draw unless batched
+        with batched_redraw(self.map_widget):
+            return super().draw_pending(deadline)
+
+    def set_visible(self, visible):
+        """Show or hide only this layer"""
+        if visible == self.visible:
+            return
+        self.visible = visible
+        if visible:
+            self.update(self._last_viewport)
+        else:
+            self.clear()
+
+    def sync(self, features):
+        """Make the layer hold exactly {key: (bbox, feature)}, redrawing only what differs"""
+        changed = 0
+        with batched_redraw(self.map_widget):
+            for key in [key for key in self.features if key not in features]:
+                self.remove(key)
+
+            for key, (bbox, feature) in features.items():
+                if key in self.features and self.features[key] == feature and self._bboxes[key] == tuple(bbox):
+                    continue
+                self.add(bbox, feature, key)
+                changed += 1
+        return changed
+
+
+class ProgressiveRenderer:
+    """Creates the map objects of a viewport update over several event-loop turns.
+
+    Layers with begin_update()/draw_pending() are filled a chunk at a
+    time; other layers are updated in one step when their turn comes.
+    Starting a new render cancels the one in progress.
+    """
+
+    def __init__(self, map_widget, budget_ms=FRAME_BUDGET_MS):
+        self.map_widget = map_widget
+        self.budget_ms = budget_ms
+        self.on_done = None
+        self._steps = []  # (layer, queued) still to draw, most important first
+        self._viewport = None
+        self._after_id = None
+        self._added = 0
+        self._removed = 0
+
+    @property
+    def busy(self):
+        return bool(self._steps)
+
+    def start(self, layers, viewport, on_done=None):
+        """Render a viewport update of layers (in priority order); on_done(added, removed) runs when complete"""
+        self.cancel()
+        self._viewport = viewport
+        self.on_done = on_done
+        self._added = 0
+        self._removed = 0
+        # Objects that left the view go at once, so nothing stale stays on screen
+        for layer in layers:
+            queued = hasattr(layer, 'begin_update')
+            if queued:
+                self._removed += layer.begin_update(viewport)
+            self._steps.append((layer, queued))
+        self._step()
+
+    def cancel(self):
+        """Drop the render in progress (the layers keep what was drawn so far)"""
+        if self._after_id is not None:
+            try:
+                self.map_widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+        self._steps = []
+
+    def _step(self):
+        self._after_id = None
+        deadline = time.perf_counter() + self.budget_ms / 1000.0
+        with batched_redraw(self.map_widget):
+            while self._steps and time.perf_counter() < deadline:
+                layer, queued = self._steps[0]
+                if queued:
+                    self._added += layer.draw_pending(deadline)
+                    if layer.pending:
+                        break
+                else:
+                    added, removed = layer.update(self._viewport)
+                    self._added += added
+                    self._removed += removed
+                self._steps.pop(0)
+
+        if self._steps:
+            try:
+                self._after_id = self.map_widget.after(1, self._step)
+            except tk.TclError:
+                # Widget destroyed
+                self._steps = []
+        elif self.on_done is not None:
+            on_done, self.on_done = self.on_done, None
+            on_done(self._added, self._removed)
+
+
+class RedrawScheduler:
+    """Coalesces redraw requests into one update per event-loop turn.
+
+    request() marks parts of the map dirty and schedules a flush with
+    after_idle(); further requests before it runs only add to the dirty
+    set. The flush calls redraw(dirty) once with everything requested.
+    """
+
+    def __init__(self, map_widget, redraw):
+        self.map_widget = map_widget
+        self.redraw = redraw
+        self.dirty = set()
+        self._after_id = None
+
+    @property
+    def pending(self):
+        return bool(self.dirty)
+
+    def request(self, *parts):
+        """Mark parts dirty; the redraw runs when the event loop is next idle"""
+        self.dirty.update(parts)
+        if self._after_id is None:
+            try:
+                self._after_id = self.map_widget.after_idle(self.flush)
+            except tk.TclError:
+                # Widget destroyed
+                self.dirty.clear()
+
+    def flush(self):
+        """Run the pending redraw now (e.g. before reading what is on the map)"""
+        self.cancel_scheduled()
+        if not self.dirty:
+            return
+        dirty, self.dirty = self.dirty, set()
+        self.redraw(dirty)
+
+    def cancel(self):
+        """Forget the pending redraw"""
+        self.cancel_scheduled()
+        self.dirty.clear()
+
+    def cancel_scheduled(self):
+        if self._after_id is not None:
+            try:
+                self.map_widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+
+class LayerManager:
+    """Ordered set of MapLayers sharing one map widget and viewport"""
+
+    def __init__(self, map_widget, priority=()):
+        self.map_widget = map_widget
+        self.layers = {}
+        # Layer names drawn first by progressive updates; other layers follow in creation order
+        self.priority = tuple(priority)
+        self.renderer = ProgressiveRenderer(map_widget)
+        self.viewport = None
+        self._updated = False
+
+    def layer(self, name, **options):
+        """Layer by name, created on first use (options apply on creation)"""
+        layer = self.layers.get(name)
+        if layer is None:
+            layer = MapLayer(self.map_widget, name, **options)
+            self.layers[name] = layer
+            # A layer created after the first viewport update starts out culled like the rest
+            if self._updated:
+                layer.update(self.viewport)
+        return layer
+
+    def add(self, name, layer):
+        """Register a layer of another kind (e.g. a SymbolLayer) under a name"""
+        self.layers[name] = layer
+        if self._updated:
+            layer.update(self.viewport)
+        return layer
+
+    def __contains__(self, name):
+        return name in self.layers
+
+    def values(self):
+        return self.layers.values()
+
+    def set_visible(self, names, visible):
+        """Show or hide some layers without touching the others"""
+        if isinstance(names, str):
+            names = (names,)
+        for name in names:
+            if name in self.layers:
+                self.layers[name].set_visible(visible)
+
+    def ordered_layers(self):
+        """Layers in drawing priority order"""
+        rank = {name: index for index, name in enumerate(self.priority)}
+        names = sorted(self.layers, key=lambda name: rank.get(name, len(rank)))
+        return [self.layers[name] for name in names]
+
+    def update_viewport(self, force=False, progressive=False, on_done=None):
+        """Cull every layer to the visible map area - returns (added, removed) feature counts.
+
+        With progressive=True the new map objects are created over the
+        next event-loop turns instead; on_done(added, removed) is called
+        once they all are. Without a view change nothing happens.
+        """
+        viewport = viewport_bounds(self.map_widget)
+        if not force and viewport == self.viewport:
+            return 0, 0
+        self.viewport = viewport
+        self._updated = True
+
+        # A newer view makes any render still in progress stale
+        self.renderer.cancel()
+        if progressive:
+            self.renderer.start(self.ordered_layers(), viewport, on_done)
+            return 0, 0
+
+        added = removed = 0
+        with batched_redraw(self.map_widget):
+            for layer in self.layers.values():
+                layer_added, layer_removed = layer.update(viewport)
+                added += layer_added
+                removed += layer_removed
+        return added, removed
+
+    def visible_count(self):
+        return sum(layer.visible_count for layer in self.layers.values())
+
+    def feature_count(self):
+        return sum(len(layer) for layer in self.layers.values())
+
+    def bounds(self):
+        """(lat, lon) corners of every layer's extent, for fitting the view"""
+        corners = []
+        for layer in self.layers.values():
+            bounds = layer.bounds()
+            if bounds:
+                corners.append((bounds[0], bounds[1]))
+                corners.append((bounds[2], bounds[3]))
+        return corners
+
+    def clear(self, names=None):
+        """Delete the map objects and features of some (default all) layers"""
+        if names is None:
+            self.renderer.cancel()
+        for name, layer in self.layers.items():
+            if names is None or name in names:
+                layer.reset()
+        if names is None:
+            self.viewport = None
+            self._updated = False
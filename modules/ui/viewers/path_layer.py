@@ -0,0 +1,229 @@
+# path_layer.py
+"""Static polyline layers drawn from cached Mercator projections.
+
+tkintermapview reprojects every CanvasPath point by point in Python on each
+pan and zoom. A PathLayer instead keeps its polylines as ProjectedPaths,
+projected once, and talks to the Tk canvas directly:
+
+- a pan moves every line of the layer with one canvas.move() call;
+- a zoom runs one vectorized transform over the whole layer and updates
+  the lines in view;
+- lines whose box leaves the view (plus a margin) are deleted and created
+  again when they come back; begin_update() only queues the new lines, so
+  a renderer can create them a few at a time with draw_pending().
+
+CanvasLayer is the shared base for layers that draw straight onto the map
+canvas; tkintermapview calls their draw(move) from its path list, and
+LayerManager drives them like MapLayers.
+"""
+import time
+import tkinter as tk
+from abc import ABC, abstractmethod
+
+from tkintermapview.utility_functions import osm_to_decimal
+
+from ...spatial.projection import ProjectedPaths, ViewTransform
+from .viewport import DEFAULT_MARGIN
+
+
+class CanvasLayer(ABC):
+    """Base for layers drawing straight onto the map canvas"""
+
+    def __init__(self, map_widget, name=""):
+        self.map_widget = map_widget
+        self.name = name
+        self.visible = True
+        self.deleted = False
+
+    def _attach(self):
+        path_list = self.map_widget.canvas_path_list
+        if self not in path_list:
+            path_list.append(self)
+
+    def _detach(self):
+        path_list = self.map_widget.canvas_path_list
+        if self in path_list:
+            path_list.remove(self)
+
+    @abstractmethod
+    def draw(self, move=False):
+        """Draw for the current view; move=True when the map was only panned"""
+
+    @abstractmethod
+    def clear(self):
+        """Delete the layer's canvas items"""
+
+    def update(self, viewport=None):
+        """Redraw for the current view (layer manager hook; the layer culls itself to the canvas)"""
+        self.draw()
+        return 0, 0
+
+    def set_visible(self, visible):
+        """Show or hide only this layer"""
+        if visible == self.visible:
+            return
+        self.visible = visible
+        self.draw()
+
+    def delete(self):
+        """Remove the layer from the map (tkintermapview delete hook)"""
+        self.clear()
+        self.deleted = True
+
+
+class _PathGroup:
+    """Projected polylines sharing one line style, and their drawn canvas items"""
+
+    def __init__(self, paths, color, width):
+        self.paths = paths
+        self.color = color
+        self.width = width
+        self.items = {}  # path index -> canvas line item
+        self.coords = None  # (transform, flat canvas coordinates) of the last placement
+
+
+class PathLayer(CanvasLayer):
+    """Polylines of one layer, projected once and moved as a whole"""
+
+    def __init__(self, map_widget, name="", margin=DEFAULT_MARGIN):
+        super().__init__(map_widget, name)
+        self.margin = margin
+        self.groups = []
+        self.tag = f"path_layer_{id(self)}"
+        self._transform = None  # view the items are placed for
+        self._pending = []  # (group, path index) of lines in view still to be created, last first
+
+    def __len__(self):
+        return sum(len(group.paths) for group in self.groups)
+
+    def add_paths(self, paths, color='black', width=1):
+        """Add polylines drawn in one style - paths are (lat, lon) lists or ProjectedPaths"""
+        if not isinstance(paths, ProjectedPaths):
+            paths = ProjectedPaths(paths)
+        self.groups.append(_PathGroup(paths, color, width))
+        if self._transform is not None:
+            self._transform = None
+            self.draw()
+        return len(paths)
+
+    def bounds(self):
+        """(min_lat, min_lon, max_lat, max_lon) of all paths, or None when empty"""
+        boxes = []
+        for group in self.groups:
+            paths = group.paths
+            if len(paths):
+                boxes.append((float(min(paths.min_xs)), float(min(paths.min_ys)),
+                              float(max(paths.max_xs)), float(max(paths.max_ys))))
+        if not boxes:
+            return None
+        # Normalized y grows southwards
+        max_lat, min_lon = osm_to_decimal(min(box[0] for box in boxes), min(box[1] for box in boxes), 0)
+        min_lat, max_lon = osm_to_decimal(max(box[2] for box in boxes), max(box[3] for box in boxes), 0)
+        return (min_lat, min_lon, max_lat, max_lon)
+
+    @property
+    def visible_count(self):
+        return sum(len(group.items) for group in self.groups)
+
+    @property
+    def pending(self):
+        """Number of lines in view not created yet"""
+        return len(self._pending)
+
+    def draw(self, move=False):
+        """Place the layer for the current view (called by the map on pan and zoom)"""
+        self.begin_update()
+        self.draw_pending()
+
+    def update(self, viewport=None):
+        """Redraw for the current view (layer manager hook; the layer culls itself to the canvas)"""
+        removed = self.begin_update(viewport)
+        return self.draw_pending(), removed
+
+    def begin_update(self, viewport=None):
+        """Move, reshape and cull the lines for the current view, queueing new ones - returns the number deleted"""
+        if not self.visible or not self.groups:
+            self.clear()
+            return 0
+        self.deleted = False
+        self._attach()
+
+        transform = ViewTransform.from_map(self.map_widget)
+        if transform == self._transform:
+            return 0
+
+        canvas = self.map_widget.canvas
+        panned = transform.same_scale(self._transform)
+        if panned:
+            # Same zoom: every existing line just shifts
+            canvas.move(self.tag, transform.offset_x - self._transform.offset_x,
+                        transform.offset_y - self._transform.offset_y)
+        self._transform = transform
+
+        width, height = self.map_widget.width, self.map_widget.height
+        pad_x = width * self.margin
+        pad_y = height * self.margin
+        removed = 0
+        self._pending = []
+        for group in self.groups:
+            visible = group.paths.visible(transform, -pad_x, -pad_y, width + pad_x, height + pad_y)
+            visible_set = set(visible)
+            for index in [index for index in group.items if index not in visible_set]:
+                canvas.delete(group.items.pop(index))
+                removed += 1
+
+            # Lines already on the canvas only need new coordinates after a zoom
+            if not panned and group.items:
+                flat = self._group_coords(group)
+                for index, item in group.items.items():
+                    canvas.coords(item, group.paths.path_coords(flat, index))
+            self._pending.extend((group, index) for index in visible if index not in group.items)
+
+        self._pending.reverse()
+        return removed
+
+    def draw_pending(self, deadline=None):
+        """Create queued lines until time.perf_counter() passes deadline - returns the number created"""
+        canvas = self.map_widget.canvas
+        created = 0
+        while self._pending:
+            if deadline is not None and created and time.perf_counter() >= deadline:
+                break
+            group, index = self._pending.pop()
+            if index in group.items:
+                continue
+            coords = group.paths.path_coords(self._group_coords(group), index)
+            group.items[index] = canvas.create_line(coords, fill=group.color, width=group.width,
+                                                    capstyle=tk.ROUND, joinstyle=tk.ROUND,
+                                                    tag=("path", self.tag))
+            created += 1
+
+        if created:
+            self.map_widget.manage_z_order()
+        return created
+
+    def _group_coords(self, group):
+        """Flat canvas coordinates of a group's paths in the placed view, computed once per view"""
+        if group.coords is None or group.coords[0] is not self._transform:
+            group.coords = (self._transform, group.paths.canvas_coords(self._transform))
+        return group.coords[1]
+
+    def clear(self):
+        """Delete the canvas items, keeping the paths"""
+        canvas = self.map_widget.canvas
+        for group in self.groups:
+            for item in group.items.values():
+                canvas.delete(item)
+            group.items = {}
+            group.coords = None
+        self._pending = []
+        self._transform = None
+        self._detach()
+
+    def reset(self):
+        """Delete the canvas items and forget the paths"""
+        self.clear()
+        self.groups = []
+
+
+__all__ = ['CanvasLayer', 'PathLayer']
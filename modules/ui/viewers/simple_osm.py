@@ -1,11 +1,36 @@
 import tkinter as tk
 import os
-import shutil
 import time
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
 from tkintermapview import TkinterMapView
 
+from ...spatial.projection import ProjectedPaths
+from .map_layers import LayerManager, RedrawScheduler
+from .path_layer import PathLayer
+from .symbol_layer import SymbolLayer
+from .tile_overlay import TileOverlay, TileScene
+from .tile_store import OfflineBaseMap, points_bounds
+from .viewport import viewport_bounds
+
 class SimpleOSMViewer:
+    # How often (ms) the view is checked for pans and zooms
+    VIEWPORT_POLL_MS = 250
+    # Boundary paths are culled in pieces of at most this many vertices
+    BOUNDARY_CHUNK_VERTICES = 64
+    # Layer shown or hidden by each checkbox
+    LAYER_TOGGLES = (
+        ('artcc_high_var', 'artcc_high'),
+        ('artcc_low_var', 'artcc_low'),
+        ('airports_var', 'airports'),
+        ('fixes_var', 'fixes'),
+        ('vor_var', 'vor'),
+        ('ndb_var', 'ndb'),
+    )
+    # Static layers drawn as pre-rendered overlay tiles while raster mode is on
+    RASTER_LAYERS = ('artcc_high', 'artcc_low', 'fixes')
+    # Parts of the map a redraw request can mark dirty
+    REDRAW_PARTS = ('visibility', 'viewport')
+    
     def __init__(self, parent, ese_parser, sct_parser=None):
         self.parent = parent
         self.ese_parser = ese_parser
@@ -19,9 +44,6 @@ class SimpleOSMViewer:
         self.vor_points = []
         self.ndb_points = []
         
-        # Store drawn items
-        self.drawn_paths = []
-        self.drawn_markers = []
         
         # Zoom tracking
         self.last_zoom_level = None
@@ -35,8 +57,18 @@ class SimpleOSMViewer:
         # Auto-zoom tracking
         self.auto_zoom_coords = []
         
+        # Raster tiles of the static layers, while raster mode is on
+        self.tile_overlay = None
+        # Base-map tiles come from a local store, fetched upstream only when missing
+        self.base_map = OfflineBaseMap()
+        
         self.setup_ui()
+        # Every kind of data lives in its own layer, drawn only while in view
+        self.layer_manager = LayerManager(self.map_widget)
+        # Redraw requests made in one event-loop turn are flushed as one update
+        self.redraw_scheduler = RedrawScheduler(self.map_widget, self.flush_redraw)
         self.load_data()
+        self.poll_viewport()
     
     def setup_ui(self):
         main_frame = tk.Frame(self.parent, bg='white')
@@ -69,7 +101,7 @@ class SimpleOSMViewer:
         # Map widget
         self.map_widget = TkinterMapView(main_frame, width=800, height=600, corner_radius=0)
         self.map_widget.pack(fill='both', expand=True, padx=10, pady=(0, 10))
-        self.map_widget.set_tile_server("https://a.tile.openstreetmap.org/{z}/{x}/{y}.png", max_zoom=19)
+        self.base_map.install(self.map_widget)
         
         # Controls frame
         controls_frame = tk.Frame(main_frame, bg='white')
@@ -86,27 +118,30 @@ class SimpleOSMViewer:
         self.fixes_var = tk.BooleanVar(value=False)
         self.vor_var = tk.BooleanVar(value=False)
         self.ndb_var = tk.BooleanVar(value=False)
+        self.raster_var = tk.BooleanVar(value=False)
         
         # Checkbuttons in rows
         row1 = tk.Frame(display_frame, bg='white')
         row1.pack(fill='x', pady=2)
         
         tk.Checkbutton(row1, text="ARTCC HIGH", variable=self.artcc_high_var, 
-                      bg='white', font=('Arial', 9), command=self.redraw_all).pack(side='left', padx=5)
+                      bg='white', font=('Arial', 9), command=self.on_layer_toggled).pack(side='left', padx=5)
         tk.Checkbutton(row1, text="ARTCC LOW", variable=self.artcc_low_var,
-                      bg='white', font=('Arial', 9), command=self.redraw_all).pack(side='left', padx=5)
+                      bg='white', font=('Arial', 9), command=self.on_layer_toggled).pack(side='left', padx=5)
         tk.Checkbutton(row1, text="Airports", variable=self.airports_var,
-                      bg='white', font=('Arial', 9), command=self.redraw_all).pack(side='left', padx=5)
+                      bg='white', font=('Arial', 9), command=self.on_layer_toggled).pack(side='left', padx=5)
         
         row2 = tk.Frame(display_frame, bg='white')
         row2.pack(fill='x', pady=2)
         
         tk.Checkbutton(row2, text="Fixes (Black X)", variable=self.fixes_var,
-                      bg='white', font=('Arial', 9), command=self.redraw_all).pack(side='left', padx=5)
+                      bg='white', font=('Arial', 9), command=self.on_layer_toggled).pack(side='left', padx=5)
         tk.Checkbutton(row2, text="VOR (△)", variable=self.vor_var,
-                      bg='white', font=('Arial', 9), command=self.redraw_all).pack(side='left', padx=5)
+                      bg='white', font=('Arial', 9), command=self.on_layer_toggled).pack(side='left', padx=5)
         tk.Checkbutton(row2, text="NDB (□)", variable=self.ndb_var,
-                      bg='white', font=('Arial', 9), command=self.redraw_all).pack(side='left', padx=5)
+                      bg='white', font=('Arial', 9), command=self.on_layer_toggled).pack(side='left', padx=5)
+        tk.Checkbutton(row2, text="Raster tiles", variable=self.raster_var,
+                      bg='white', font=('Arial', 9), command=self.on_layer_toggled).pack(side='left', padx=5)
         
         # Action buttons
         action_frame = tk.Frame(controls_frame, bg='white')
@@ -122,6 +157,8 @@ class SimpleOSMViewer:
         # Cache control button
         tk.Button(action_frame, text="Clear Cache", font=('Arial', 9), bg='#e67e22', fg='white',
                  command=self.clear_cache).pack(side='left', padx=2)
+        tk.Button(action_frame, text="Seed Tiles", font=('Arial', 9), bg='#8e44ad', fg='white',
+                 command=self.seed_base_map).pack(side='left', padx=2)
         
         # Boundary info label
         self.boundary_info_label = tk.Label(
@@ -135,19 +172,17 @@ class SimpleOSMViewer:
         self.boundary_info_label.pack(pady=(5, 0))
     
     def clear_cache(self):
-        """Clear the cache directory"""
+        """Clear the parse cache files; the offline base map and rendered overlay tiles are kept"""
         cache_dir = "cache"
         if os.path.exists(cache_dir):
             try:
-                # Count files before deletion
-                cache_files = [f for f in os.listdir(cache_dir) if f.endswith('.json')]
+                # Only the parse cache (.bin/.json); basemap.mbtiles and tiles/ live alongside it
+                cache_files = [f for f in os.listdir(cache_dir) if f.endswith(('.bin', '.json'))
+                               and os.path.isfile(os.path.join(cache_dir, f))]
                 file_count = len(cache_files)
                 
-                # Delete the cache directory
-                shutil.rmtree(cache_dir)
-                
-                # Recreate empty directory
-                os.makedirs(cache_dir)
+                for f in cache_files:
+                    os.remove(os.path.join(cache_dir, f))
                 
                 # Show confirmation message
                 messagebox.showinfo("Cache Cleared", 
@@ -162,6 +197,23 @@ class SimpleOSMViewer:
         else:
             messagebox.showinfo("Cache", "Cache directory does not exist.")
     
+    def seed_base_map(self):
+        """Fill the offline tile store from a {z}/{x}/{y} tile directory, for the loaded sector"""
+        directory = filedialog.askdirectory(title="Select a tile directory ({z}/{x}/{y}.png)")
+        if not directory:
+            return
+        bounds = points_bounds(self.layer_manager.bounds())
+        try:
+            count = self.base_map.store.seed_from_directory(directory, bounds)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to seed tiles:\n{str(e)}")
+            return
+        # Reload the map tiles from the store
+        self.base_map.install(self.map_widget)
+        area = "the sector area" if bounds else "all areas"
+        messagebox.showinfo("Tiles Seeded", f"Stored {count} tiles for {area}.")
+        self.perf_label.config(text=f"Seeded {count} tiles")
+    
     def load_data(self):
         start_time = time.time()
         
@@ -226,22 +278,12 @@ class SimpleOSMViewer:
         
         # Add boundary coordinates for auto-zoom
         for boundary in self.artcc_high_boundaries:
-            for segment in boundary.get('segments', []):
-                start = segment.get('start')
-                end = segment.get('end')
-                if start:
-                    self.auto_zoom_coords.append(start)
-                if end:
-                    self.auto_zoom_coords.append(end)
+            for path in self.get_boundary_paths(boundary):
+                self.auto_zoom_coords.extend(path)
         
         for boundary in self.artcc_low_boundaries:
-            for segment in boundary.get('segments', []):
-                start = segment.get('start')
-                end = segment.get('end')
-                if start:
-                    self.auto_zoom_coords.append(start)
-                if end:
-                    self.auto_zoom_coords.append(end)
+            for path in self.get_boundary_paths(boundary):
+                self.auto_zoom_coords.extend(path)
         
         # Update boundary info
         total_high = len(self.artcc_high_boundaries)
@@ -260,8 +302,8 @@ class SimpleOSMViewer:
         # Auto-zoom to fit all data
         self.auto_zoom()
         
-        # Draw initial data
-        self.redraw_all()
+        # Register every layer once; toggles only show or hide them
+        self.build_layers()
     
     def auto_zoom(self):
         """Auto-zoom to fit all loaded data"""
@@ -312,255 +354,217 @@ class SimpleOSMViewer:
         # Update performance label
         self.perf_label.config(text=f"Zoom: {zoom} | Load: {self.load_time:.2f}s | Draw: {self.draw_time:.2f}s")
     
-    def redraw_all(self):
-        """Redraw everything based on current visibility settings"""
+    def build_layers(self):
+        """Register all loaded data with the layers and draw what is in view"""
         draw_start_time = time.time()
         self.clear_all_drawn_items()
         
         # Check current zoom level
         current_zoom = self.map_widget.zoom if hasattr(self.map_widget, 'zoom') else 10
         
-        # OPTIMIZATION: Draw boundaries in batches
-        if (self.artcc_high_var.get() or self.artcc_low_var.get()):
-            self.draw_boundaries_optimized()
-        
-        # Always draw points regardless of zoom
-        # Draw airports
-        if self.airport_points and self.airports_var.get():
-            self.draw_airports()
+        self.draw_boundaries_optimized()
+        self.draw_airports()
+        # Fixes as BLACK X only (no name)
+        self.draw_fixes()
+        # VOR as magenta triangle with name above
+        self.draw_vors()
+        # NDB as yellow square with name above
+        self.draw_ndbs()
         
-        # Draw fixes as BLACK X only (no name)
-        if self.fix_points and self.fixes_var.get():
-            self.draw_fixes()
+        # Only features of visible layers inside the current view become canvas items
+        self.update_viewport(force=True)
         
-        # Draw VOR as magenta triangle with name above
-        if self.vor_points and self.vor_var.get():
-            self.draw_vors()
+        self.draw_time = time.time() - draw_start_time
         
-        # Draw NDB as yellow square with name above
-        if self.ndb_points and self.ndb_var.get():
-            self.draw_ndbs()
+        # Update performance label
+        self.update_perf_label(current_zoom)
         
+        # The static data changed, so the raster tiles did too
+        self.update_raster_overlay()
+    
+    def apply_layer_visibility(self):
+        """Show or hide just the layers whose checkbox changed"""
+        draw_start_time = time.time()
+        for var_name, layer_name in self.LAYER_TOGGLES:
+            self.layer_manager.set_visible(layer_name, self.is_layer_enabled(layer_name))
+        self.update_raster_overlay()
         self.draw_time = time.time() - draw_start_time
+        self.update_perf_label(self.map_widget.zoom)
+    
+    def on_layer_toggled(self):
+        self.request_redraw('visibility')
+    
+    def is_rastered(self, name):
+        """Whether a layer is drawn by the raster tile overlay instead of canvas items"""
+        return self.raster_var.get() and name in self.RASTER_LAYERS
+    
+    def build_tile_scene(self):
+        """Scene of the ticked static layers, reusing their projected geometry"""
+        scene = TileScene()
+        for name in self.RASTER_LAYERS:
+            if name not in self.layer_manager or not self.is_layer_enabled(name, rastered=True):
+                continue
+            layer = self.layer_manager.layer(name)
+            if isinstance(layer, PathLayer):
+                for group in layer.groups:
+                    scene.add_paths(group.paths, group.color, group.width)
+            elif isinstance(layer, SymbolLayer):
+                scene.add_symbols(layer.points, *layer.style)
+        return scene
+    
+    def update_raster_overlay(self):
+        """Start, switch or stop the overlay tiles to match raster mode and the ticked layers"""
+        scene = self.build_tile_scene() if self.raster_var.get() else None
+        if scene is not None and not len(scene):
+            scene = None
+        if scene is not None and self.tile_overlay is not None and self.tile_overlay.key == scene.content_hash():
+            return
         
-        # Update performance label
-        self.perf_label.config(text=f"Zoom: {current_zoom} | Load: {self.load_time:.2f}s | Draw: {self.draw_time:.2f}s")
+        if self.tile_overlay is not None:
+            self.tile_overlay.stop()
+            self.tile_overlay = None
+        elif scene is None:
+            return
+        if scene is not None:
+            self.tile_overlay = TileOverlay(scene)
+            self.tile_overlay.start()
+        # The base map draws the overlay into the tiles it serves; reload them
+        self.base_map.set_overlay(self.tile_overlay)
+        self.base_map.install(self.map_widget)
     
-    def draw_boundaries_optimized(self):
-        """Optimized boundary drawing - batch similar boundaries"""
+    def redraw_all(self):
+        """Redraw everything based on current visibility settings"""
+        self.request_redraw()
+    
+    def request_redraw(self, *parts):
+        """Mark parts of the map dirty (default all of REDRAW_PARTS); they are redrawn together once idle"""
+        self.redraw_scheduler.request(*(parts or self.REDRAW_PARTS))
+    
+    def flush_redraw(self, dirty):
+        """Redraw everything marked dirty since the last flush, as one incremental update"""
+        if 'visibility' in dirty:
+            # One overlay rebuild however many checkboxes changed
+            self.apply_layer_visibility()
+        if 'viewport' in dirty:
+            self.update_viewport()
+    
+    def update_perf_label(self, zoom):
+        visible = self.layer_manager.visible_count()
+        total = self.layer_manager.feature_count()
+        self.perf_label.config(text=f"Zoom: {zoom} | Load: {self.load_time:.2f}s | Draw: {self.draw_time:.2f}s | "
+                                    f"Visible: {visible}/{total}")
+    
+    def is_layer_enabled(self, name, rastered=False):
+        """Whether a layer's checkbox is ticked (and, unless rastered, it is drawn on the canvas)"""
+        var_name = next(var for var, layer_name in self.LAYER_TOGGLES if layer_name == name)
+        return getattr(self, var_name).get() and (rastered or not self.is_rastered(name))
+    
+    def get_layer(self, name):
+        """Map layer by name, created on first use with its checkbox's visibility"""
+        if name not in self.layer_manager:
+            return self.layer_manager.layer(name, visible=self.is_layer_enabled(name))
+        return self.layer_manager.layer(name)
+    
+    def get_path_layer(self, name):
+        """Projected polyline layer by name, created on first use with its checkbox's visibility"""
+        if name not in self.layer_manager:
+            layer = PathLayer(self.map_widget, name)
+            layer.visible = self.is_layer_enabled(name)
+            return self.layer_manager.add(name, layer)
+        return self.layer_manager.layer(name)
+    
+    def get_symbol_layer(self, name, **style):
+        """Batched symbol layer by name, created on first use with its checkbox's visibility"""
+        if name not in self.layer_manager:
+            layer = SymbolLayer(self.map_widget, name, **style)
+            layer.visible = self.is_layer_enabled(name)
+            return self.layer_manager.add(name, layer)
+        return self.layer_manager.layer(name)
+    
+    def update_viewport(self, force=False):
+        """Create features that scrolled into view and delete those that left it"""
+        self.layer_manager.update_viewport(force)
+    
+    def poll_viewport(self):
+        """Follow pans and zooms; tkintermapview has no callback for either"""
         try:
-            # Group HIGH boundaries
-            if self.artcc_high_var.get():
-                high_coords = []
-                for boundary in self.artcc_high_boundaries:
-                    segments = boundary.get('segments', [])
-                    for segment in segments:
-                        start = segment.get('start')
-                        end = segment.get('end')
-                        if start and end:
-                            high_coords.extend([start, end])
-                
-                # Draw all HIGH boundaries as one path if we have coordinates
-                if high_coords:
-                    # Create a continuous path (even though segments are separate, this is faster)
-                    path = self.map_widget.set_path(
-                        high_coords,
-                        color='#ff0000',
-                        width=2,
-                        name="ARTCC_HIGH_ALL"
-                    )
-                    if path:
-                        self.drawn_paths.append(path)
-            
-            # Group LOW boundaries
-            if self.artcc_low_var.get():
-                low_coords = []
-                for boundary in self.artcc_low_boundaries:
-                    segments = boundary.get('segments', [])
-                    for segment in segments:
-                        start = segment.get('start')
-                        end = segment.get('end')
-                        if start and end:
-                            low_coords.extend([start, end])
-                
-                # Draw all LOW boundaries as one path
-                if low_coords:
-                    path = self.map_widget.set_path(
-                        low_coords,
-                        color='#00aa00',
-                        width=1,
-                        name="ARTCC_LOW_ALL"
-                    )
-                    if path:
-                        self.drawn_paths.append(path)
-                        
-        except Exception as e:
-            print(f"Error drawing optimized boundaries: {e}")
-            # Fall back to individual segment drawing
-            self.draw_boundaries_individual()
-    
-    def draw_boundaries_individual(self):
-        """Fallback: Draw boundaries as individual segments"""
-        # Draw ARTCC HIGH boundaries
-        if self.artcc_high_var.get():
-            for boundary_idx, boundary in enumerate(self.artcc_high_boundaries):
-                segments = boundary.get('segments', [])
-                for segment_idx, segment in enumerate(segments):
-                    start = segment.get('start')
-                    end = segment.get('end')
-                    if start and end:
-                        try:
-                            path = self.map_widget.set_path(
-                                [start, end],
-                                color='#ff0000',
-                                width=2,
-                                name=f"ARTCC_HIGH_{boundary_idx}_{segment_idx}"
-                            )
-                            if path:
-                                self.drawn_paths.append(path)
-                        except Exception:
-                            pass
-        
-        # Draw ARTCC LOW boundaries
-        if self.artcc_low_var.get():
-            for boundary_idx, boundary in enumerate(self.artcc_low_boundaries):
-                segments = boundary.get('segments', [])
-                for segment_idx, segment in enumerate(segments):
-                    start = segment.get('start')
-                    end = segment.get('end')
-                    if start and end:
-                        try:
-                            path = self.map_widget.set_path(
-                                [start, end],
-                                color='#00aa00',
-                                width=1,
-                                name=f"ARTCC_LOW_{boundary_idx}_{segment_idx}"
-                            )
-                            if path:
-                                self.drawn_paths.append(path)
-                        except Exception:
-                            pass
+            if viewport_bounds(self.map_widget) != self.layer_manager.viewport:
+                start_time = time.time()
+                self.update_viewport()
+                self.draw_time = time.time() - start_time
+                self.update_perf_label(self.map_widget.zoom)
+            self.map_widget.after(self.VIEWPORT_POLL_MS, self.poll_viewport)
+        except tk.TclError:
+            # Widget destroyed
+            pass
+    
+    def get_boundary_paths(self, boundary):
+        """Return a boundary's polylines as lists of (lat, lon) tuples"""
+        if 'paths' in boundary:
+            return boundary['paths']
+        
+        # Older boundary dicts only carry segments
+        paths = []
+        for segment in boundary.get('segments', []):
+            start = segment.get('start')
+            end = segment.get('end')
+            if start and end:
+                paths.append([(start['lat'], start['lon']), (end['lat'], end['lon'])])
+        return paths
+    
+    def get_layer_paths(self, boundaries):
+        """Return polylines for a whole boundary layer, shared edges drawn once"""
+        if hasattr(boundaries, 'merged_paths'):
+            return boundaries.merged_paths()
+        return [path for boundary in boundaries for path in self.get_boundary_paths(boundary)]
+    
+    def draw_boundaries_optimized(self):
+        """Project each layer's polylines once, in short pieces so only pieces in view get drawn"""
+        for layer_name, boundaries, options in (
+            ('artcc_high', self.artcc_high_boundaries, {'color': '#ff0000', 'width': 2}),
+            ('artcc_low', self.artcc_low_boundaries, {'color': '#00aa00', 'width': 1}),
+        ):
+            paths = ProjectedPaths(self.get_layer_paths(boundaries), self.BOUNDARY_CHUNK_VERTICES)
+            self.get_path_layer(layer_name).add_paths(paths, **options)
     
     def draw_airports(self):
         """Draw airports"""
+        layer = self.get_layer('airports')
         for point in self.airport_points:
-            try:
-                marker = self.map_widget.set_marker(
-                    point['lat'], point['lon'],
-                    text=point['name'][:10],
-                    marker_color_outside='#0088ff',
-                    marker_color_circle='white',
-                    text_color='black',
-                    font=('Arial', 8, 'bold')
-                )
-                if marker:
-                    self.drawn_markers.append(marker)
-            except Exception:
-                pass
+            layer.add_point(point['lat'], point['lon'], [('marker', (point['lat'], point['lon']), {
+                'text': point['name'][:10],
+                'marker_color_outside': '#0088ff',
+                'marker_color_circle': 'white',
+                'text_color': 'black',
+                'font': ('Arial', 8, 'bold')
+            })])
     
     def draw_fixes(self):
         """Draw fixes as BLACK X only (no name)"""
-        # OPTIMIZATION: Draw fixes in batches
-        fix_paths = []
-        offset = 0.001
-        
-        for point in self.fix_points:
-            # First diagonal
-            fix_paths.append([
-                (point['lat'] - offset, point['lon'] - offset),
-                (point['lat'] + offset, point['lon'] + offset)
-            ])
-            # Second diagonal
-            fix_paths.append([
-                (point['lat'] - offset, point['lon'] + offset),
-                (point['lat'] + offset, point['lon'] - offset)
-            ])
-        
-        # Draw all fix X's at once
-        for path_coords in fix_paths:
-            try:
-                path = self.map_widget.set_path(path_coords, color='black', width=1)
-                if path:
-                    self.drawn_paths.append(path)
-            except Exception:
-                pass
+        layer = self.get_symbol_layer('fixes', shape='x', color='black', size=6, width=1)
+        layer.set_points((point['lat'], point['lon']) for point in self.fix_points)
     
     def draw_vors(self):
         """Draw VOR as magenta triangle with name above"""
-        for point in self.vor_points:
-            try:
-                offset = 0.0015
-                # Draw triangle
-                path1 = self.map_widget.set_path([
-                    (point['lat'], point['lon'] + offset),
-                    (point['lat'] - offset, point['lon'] - offset),
-                    (point['lat'] + offset, point['lon'] - offset),
-                    (point['lat'], point['lon'] + offset)
-                ], color='#ff00ff', width=2)
-                if path1:
-                    self.drawn_paths.append(path1)
-                
-                # Add name above
-                marker = self.map_widget.set_marker(
-                    point['lat'] - offset - 0.001, point['lon'],
-                    text=point['name'],
-                    text_color='#ff00ff',
-                    font=('Arial', 8, 'bold'),
-                    marker_color_circle='white',
-                    marker_color_outside='white'
-                )
-                if marker:
-                    self.drawn_markers.append(marker)
-            except Exception:
-                pass
+        layer = self.get_symbol_layer('vor', shape='triangle', color='#ff00ff', size=10, width=2)
+        layer.set_points(
+            ((point['lat'], point['lon']) for point in self.vor_points),
+            labels=[point['name'] for point in self.vor_points],
+            color='#ff00ff'
+        )
     
     def draw_ndbs(self):
         """Draw NDB as yellow square with name above"""
-        for point in self.ndb_points:
-            try:
-                offset = 0.001
-                # Draw square
-                path1 = self.map_widget.set_path([
-                    (point['lat'] - offset, point['lon'] - offset),
-                    (point['lat'] - offset, point['lon'] + offset),
-                    (point['lat'] + offset, point['lon'] + offset),
-                    (point['lat'] + offset, point['lon'] - offset),
-                    (point['lat'] - offset, point['lon'] - offset)
-                ], color='#ffaa00', width=2)
-                if path1:
-                    self.drawn_paths.append(path1)
-                
-                # Add name above
-                marker = self.map_widget.set_marker(
-                    point['lat'] - offset - 0.001, point['lon'],
-                    text=point['name'],
-                    text_color='#ffaa00',
-                    font=('Arial', 8, 'bold'),
-                    marker_color_circle='white',
-                    marker_color_outside='white'
-                )
-                if marker:
-                    self.drawn_markers.append(marker)
-            except Exception:
-                pass
+        layer = self.get_symbol_layer('ndb', shape='square', color='#ffaa00', size=8, width=2)
+        layer.set_points(
+            ((point['lat'], point['lon']) for point in self.ndb_points),
+            labels=[point['name'] for point in self.ndb_points],
+            color='#ffaa00'
+        )
     
     def clear_all_drawn_items(self):
-        """Clear all drawn paths and markers"""
-        # Clear paths
-        for path in self.drawn_paths:
-            try:
-                path.delete()
-            except:
-                pass
-        self.drawn_paths = []
-        
-        # Clear markers
-        for marker in self.drawn_markers:
-            try:
-                marker.delete()
-            except:
-                pass
-        self.drawn_markers = []
+        """Clear all drawn paths and markers, and forget the registered features"""
+        self.layer_manager.clear()
     
     def show_all(self):
         """Show all data"""
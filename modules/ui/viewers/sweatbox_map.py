@@ -1,11 +1,37 @@
 # sweatbox_map.py
 import tkinter as tk
-from tkinter import ttk
+from tkinter import filedialog, messagebox, ttk
 import tkintermapview
 import re
 import math
 
+from ...spatial import BoundaryLOD, haversine_nm
+from .map_layers import LayerManager, RedrawScheduler, batched_redraw
+from .path_layer import PathLayer
+from .tile_store import OfflineBaseMap, points_bounds
+
 class SweatboxMapViewer:
+    # Radius used to detect entry fixes around the selected airport
+    ENTRY_FIX_RADIUS_NM = 100
+    # How often (ms) the view is checked for pans and zooms
+    VIEWPORT_POLL_MS = 250
+    # Boundary paths are culled in pieces of at most this many vertices
+    BOUNDARY_CHUNK_VERTICES = 64
+    # Layers shown or hidden by each "Show:" checkbox
+    LAYER_TOGGLES = (
+        ('show_airports_var', ('airports',)),
+        ('show_fixes_var', ('fixes', 'VOR', 'NDB')),
+        ('show_runways_var', ('runways',)),
+        ('show_runway_extensions_var', ('extensions',)),
+        ('show_boundaries_var', ('boundaries',)),
+        ('show_aircraft_var', ('aircraft',)),
+    )
+    # Layers drawn first when a view fills in progressively, most important first
+    LAYER_PRIORITY = ('aircraft', 'airports', 'runways', 'extensions', 'boundaries',
+                      'fixes', 'VOR', 'NDB', 'ese')
+    # Parts of the map a redraw request can mark dirty
+    REDRAW_PARTS = ('visibility', 'aircraft', 'viewport')
+    
     def __init__(self, parent, ese_parser=None, sct_parser=None, rwy_parser=None):
         self.parent = parent
         self.ese_parser = ese_parser
@@ -16,20 +42,25 @@ class SweatboxMapViewer:
         self.aircraft_points = []
         self.entry_fixes = []
         self.selected_airport = None
-        self.map_markers = []
-        self.map_paths = []
-        self.aircraft_markers = []
-        self.runway_extensions = []  # Store runway extension lines
         self.loaded_airports = []  # List of airport ICAOs
         self.aircraft_data = []  # Store aircraft data for redraw
+        self.aircraft_index = {}  # callsign -> entry of aircraft_data
+        
+        # Boundary layers drawn from level-of-detail pyramids
+        self.boundary_layers = []  # (lod, color, width) per drawn layer
+        self.boundary_lod_level = None
         
         # Aircraft selection
         self.selected_aircraft = None
         self.aircraft_click_bind_id = None
         
-        # Initialize map
+        # Initialize map; every kind of data lives in its own layer
         self.setup_ui()
+        self.layer_manager = LayerManager(self.map_widget, priority=self.LAYER_PRIORITY)
+        # Redraw requests made in one event-loop turn are flushed as one update
+        self.redraw_scheduler = RedrawScheduler(self.map_widget, self.flush_redraw)
         self.load_data()
+        self.poll_viewport()
     
     def setup_ui(self):
         """Setup the map interface"""
@@ -58,6 +89,9 @@ class SweatboxMapViewer:
         # Reload data button
         tk.Button(control_frame, text="Reload Data", command=self.force_reload_data).pack(side=tk.LEFT, padx=5)
         
+        # Offline tiles button
+        tk.Button(control_frame, text="Seed Tiles", command=self.seed_base_map).pack(side=tk.LEFT, padx=5)
+        
         # Aircraft control label
         tk.Label(control_frame, text="| Aircraft:", bg='#f0f0f0').pack(side=tk.LEFT, padx=(20, 5))
         
@@ -79,17 +113,17 @@ class SweatboxMapViewer:
         self.show_runway_extensions_var = tk.BooleanVar(value=True)
         
         tk.Checkbutton(control_frame, text="Airports", variable=self.show_airports_var,
-                      command=self.redraw_all, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
+                      command=self.on_layer_toggled, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
         tk.Checkbutton(control_frame, text="Fixes", variable=self.show_fixes_var,
-                      command=self.redraw_all, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
+                      command=self.on_layer_toggled, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
         tk.Checkbutton(control_frame, text="Runways", variable=self.show_runways_var,
-                      command=self.redraw_all, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
+                      command=self.on_layer_toggled, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
         tk.Checkbutton(control_frame, text="RWY Extensions", variable=self.show_runway_extensions_var,
-                      command=self.redraw_all, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
+                      command=self.on_layer_toggled, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
         tk.Checkbutton(control_frame, text="Boundaries", variable=self.show_boundaries_var,
-                      command=self.redraw_all, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
+                      command=self.on_layer_toggled, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
         tk.Checkbutton(control_frame, text="Aircraft", variable=self.show_aircraft_var,
-                      command=self.redraw_all, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
+                      command=self.on_layer_toggled, bg='#f0f0f0').pack(side=tk.LEFT, padx=2)
         
         # Create map widget BELOW controls
         self.map_widget = tkintermapview.TkinterMapView(main_frame, width=800, height=600, corner_radius=0)
@@ -99,8 +133,9 @@ class SweatboxMapViewer:
         self.map_widget.set_position(0.0, 0.0)
         self.map_widget.set_zoom(3)
         
-        # Set tile server to OpenStreetMap
-        self.map_widget.set_tile_server("https://a.tile.openstreetmap.org/{z}/{x}/{y}.png")
+        # Serve OpenStreetMap tiles from the offline store, fetching only missing ones
+        self.base_map = OfflineBaseMap()
+        self.base_map.install(self.map_widget)
         
         # Bind double-click for aircraft movement
         self.map_widget.canvas.bind("<Double-Button-1>", self.on_map_double_click)
@@ -114,7 +149,7 @@ class SweatboxMapViewer:
             self.selected_airport = airports[0]
     
     def load_data(self):
-        """Load data from parsers and display on map"""
+        """Load data from parsers and register it with the culled map layers"""
         print("=" * 50)
         print("DEBUG: Loading data to map...")
         
@@ -159,15 +194,14 @@ class SweatboxMapViewer:
                 traceback.print_exc()
         
         # Draw runway extensions
-        if self.show_runway_extensions_var.get():
-            items_drawn += self.draw_runway_extensions()
+        items_drawn += self.draw_runway_extensions()
         
         # Redraw aircraft if we have any
-        if self.aircraft_data and self.show_aircraft_var.get():
+        if self.aircraft_data:
             items_drawn += len(self.aircraft_data)
             self.draw_aircraft()
         
-        print(f"DEBUG: Total items drawn: {items_drawn}")
+        print(f"DEBUG: Total items registered: {items_drawn}")
         
         # Auto-fit to data if we have any
         if items_drawn > 0:
@@ -178,450 +212,346 @@ class SweatboxMapViewer:
             self.map_widget.set_position(0.0, 0.0)
             self.map_widget.set_zoom(3)
         
+        # Only now that the view is settled, create the visible features (over the next few frames)
+        self.update_viewport(force=True)
+        
         print("=" * 50)
     
+    def get_layer(self, name):
+        """Map layer by name, created on first use with its checkbox's visibility"""
+        if name not in self.layer_manager:
+            options = {'visible': self.is_layer_enabled(name)}
+            if name == 'aircraft':
+                # Keep every aircraft on the map so it can be found and selected
+                options.update(factory=self.create_aircraft_marker, updater=self.update_aircraft_marker,
+                               culled=False)
+            return self.layer_manager.layer(name, **options)
+        return self.layer_manager.layer(name)
+    
+    def get_path_layer(self, name):
+        """Projected polyline layer by name, created on first use with its checkbox's visibility"""
+        if name not in self.layer_manager:
+            layer = PathLayer(self.map_widget, name)
+            layer.visible = self.is_layer_enabled(name)
+            return self.layer_manager.add(name, layer)
+        return self.layer_manager.layer(name)
+    
+    def is_layer_enabled(self, name):
+        """Whether the checkbox controlling a layer is ticked (layers without one are always on)"""
+        for var_name, names in self.LAYER_TOGGLES:
+            if name in names:
+                return getattr(self, var_name).get()
+        return True
+    
+    def apply_layer_visibility(self):
+        """Show or hide just the layers whose checkbox changed"""
+        for var_name, names in self.LAYER_TOGGLES:
+            self.layer_manager.set_visible(names, getattr(self, var_name).get())
+    
+    def on_layer_toggled(self):
+        self.request_redraw('visibility')
+    
+    def add_marker_feature(self, layer_name, lat, lon, **options):
+        """Register a marker with a culled layer - returns 1 if the position is valid"""
+        if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+            return 0
+        self.get_layer(layer_name).add_point(lat, lon, [('marker', (lat, lon), options)])
+        return 1
+    
+    def update_viewport(self, force=False):
+        """Bring every culled layer in line with the visible map area, filling it in over a few frames"""
+        if self.update_boundary_lod():
+            force = True
+        
+        self.layer_manager.update_viewport(force, progressive=True, on_done=self.on_viewport_drawn)
+    
+    def on_viewport_drawn(self, added, removed):
+        if added or removed:
+            print(f"DEBUG: Viewport update: +{added} / -{removed} features, "
+                  f"{self.layer_manager.visible_count()} visible")
+    
+    def poll_viewport(self):
+        """Follow pans and zooms; tkintermapview has no callback for either"""
+        try:
+            self.update_viewport()
+            self.map_widget.after(self.VIEWPORT_POLL_MS, self.poll_viewport)
+        except tk.TclError:
+            # Widget destroyed
+            pass
+    
+    def parse_coordinate(self, coord):
+        """(lat, lon) from a Coordinate, dict or sequence, or None if invalid"""
+        if hasattr(coord, 'lat') and hasattr(coord, 'lon'):
+            lat, lon = float(coord.lat), float(coord.lon)
+        elif isinstance(coord, dict) and 'lat' in coord and 'lon' in coord:
+            lat, lon = float(coord['lat']), float(coord['lon'])
+        elif isinstance(coord, (list, tuple)) and len(coord) >= 2:
+            lat, lon = float(coord[0]), float(coord[1])
+        else:
+            return None
+        if -90 <= lat <= 90 and -180 <= lon <= 180:
+            return (lat, lon)
+        return None
+    
+    def get_runway_coords(self, runway):
+        """Valid (lat, lon) points of a runway entry"""
+        coords = []
+        for coord in runway.get('coordinates') or []:
+            point = self.parse_coordinate(coord)
+            if point:
+                coords.append(point)
+        return coords
+    
     def draw_sct_data(self, data):
-        """Draw SCT data on map - returns count of items drawn"""
+        """Register SCT data with the map layers - returns count of features"""
         items_drawn = 0
         
-        # Draw airports - FIXED VERSION
-        if 'airports' in data and data['airports'] and self.show_airports_var.get():
-            print(f"DEBUG: Drawing {len(data['airports'])} airports")
-            for airport in data['airports'][:50]:  # Limit for performance
+        # Airports
+        if 'airports' in data and data['airports']:
+            print(f"DEBUG: Registering {len(data['airports'])} airports")
+            for airport in data['airports']:
                 try:
                     # SCTParser returns airports as dicts
-                    if isinstance(airport, dict):
-                        lat = float(airport.get('latitude', 0))
-                        lon = float(airport.get('longitude', 0))
-                        icao = airport.get('icao', 'N/A')
-                    else:
-                        # Fallback for other formats
+                    if not isinstance(airport, dict):
                         continue
-                    
-                    # Validate coordinates
-                    if -90 <= lat <= 90 and -180 <= lon <= 180 and lat != 0 and lon != 0:
-                        marker = self.map_widget.set_marker(
-                            lat, lon,
-                            text=icao,
-                            marker_color_circle="red",
-                            marker_color_outside="pink",
-                            text_color="red",
-                            font=("Arial", 10, "bold")
-                        )
-                        if marker:
-                            self.map_markers.append(marker)
-                            items_drawn += 1
-                            print(f"  ✓ Airport {icao}: {lat:.4f}, {lon:.4f}")
-                    else:
-                        print(f"  ✗ Invalid coordinates for airport {icao}: {lat}, {lon}")
+                    lat = float(airport.get('latitude', 0))
+                    lon = float(airport.get('longitude', 0))
+                    if lat == 0 and lon == 0:
+                        continue
+                    items_drawn += self.add_marker_feature(
+                        'airports', lat, lon,
+                        text=airport.get('icao', 'N/A'),
+                        marker_color_circle="red",
+                        marker_color_outside="pink",
+                        text_color="red",
+                        font=("Arial", 10, "bold")
+                    )
                 except (ValueError, TypeError) as e:
-                    print(f"  ✗ Error drawing airport {airport.get('icao', 'Unknown')}: {e}")
-        
-        # Draw VORs
-        if 'VOR' in data and data['VOR'] and self.show_fixes_var.get():
-            for vor in data['VOR'][:50]:  # Limit for performance
-                if 'latitude' in vor and 'longitude' in vor:
-                    try:
-                        lat = float(vor['latitude'])
-                        lon = float(vor['longitude'])
-                        vor_id = vor.get('id', 'UNK')
-                        
-                        if -90 <= lat <= 90 and -180 <= lon <= 180:
-                            marker = self.map_widget.set_marker(
-                                lat, lon,
-                                text=f"VOR:{vor_id}",
-                                marker_color_circle="blue",
-                                marker_color_outside="lightblue",
-                                font=("Arial", 8)
-                            )
-                            if marker:
-                                self.map_markers.append(marker)
-                                items_drawn += 1
-                    except (ValueError, TypeError) as e:
-                        pass
+                    print(f"  ✗ Error with airport {airport.get('icao', 'Unknown')}: {e}")
         
-        # Draw NDBs
-        if 'NDB' in data and data['NDB'] and self.show_fixes_var.get():
-            for ndb in data['NDB'][:50]:  # Limit for performance
-                if 'latitude' in ndb and 'longitude' in ndb:
+        # VORs and NDBs
+        for key, circle, outside in (('VOR', "blue", "lightblue"), ('NDB', "purple", "lavender")):
+            for navaid in data.get(key) or []:
+                if 'latitude' in navaid and 'longitude' in navaid:
                     try:
-                        lat = float(ndb['latitude'])
-                        lon = float(ndb['longitude'])
-                        ndb_id = ndb.get('id', 'UNK')
-                        
-                        if -90 <= lat <= 90 and -180 <= lon <= 180:
-                            marker = self.map_widget.set_marker(
-                                lat, lon,
-                                text=f"NDB:{ndb_id}",
-                                marker_color_circle="purple",
-                                marker_color_outside="lavender",
-                                font=("Arial", 8)
-                            )
-                            if marker:
-                                self.map_markers.append(marker)
-                                items_drawn += 1
-                    except (ValueError, TypeError) as e:
+                        items_drawn += self.add_marker_feature(
+                            key, float(navaid['latitude']), float(navaid['longitude']),
+                            text=f"{key}:{navaid.get('id', 'UNK')}",
+                            marker_color_circle=circle,
+                            marker_color_outside=outside,
+                            font=("Arial", 8)
+                        )
+                    except (ValueError, TypeError):
                         pass
         
-        # Draw fixes
-        if 'fixes' in data and data['fixes'] and self.show_fixes_var.get():
-            for fix in data['fixes'][:100]:  # Limit to first 100 fixes for performance
+        # Fixes
+        if 'fixes' in data and data['fixes']:
+            for fix in data['fixes']:
                 if 'latitude' in fix and 'longitude' in fix and 'name' in fix:
                     try:
-                        lat = float(fix['latitude'])
-                        lon = float(fix['longitude'])
-                        name = fix['name']
-                        
-                        if -90 <= lat <= 90 and -180 <= lon <= 180:
-                            marker = self.map_widget.set_marker(
-                                lat, lon,
-                                text=name,
-                                marker_color_circle="green",
-                                marker_color_outside="lightgreen",
-                                font=("Arial", 7)
-                            )
-                            if marker:
-                                self.map_markers.append(marker)
-                                items_drawn += 1
-                    except (ValueError, TypeError) as e:
+                        items_drawn += self.add_marker_feature(
+                            'fixes', float(fix['latitude']), float(fix['longitude']),
+                            text=fix['name'],
+                            marker_color_circle="green",
+                            marker_color_outside="lightgreen",
+                            font=("Arial", 7)
+                        )
+                    except (ValueError, TypeError):
                         pass
         
-        # Draw runways from SCT
-        if 'runways' in data and data['runways'] and self.show_runways_var.get():
-            print(f"DEBUG: Drawing {len(data['runways'])} runways from SCT")
+        # Runways from SCT
+        if 'runways' in data and data['runways']:
+            print(f"DEBUG: Registering {len(data['runways'])} runways from SCT")
+            layer = self.get_layer('runways')
             for runway in data['runways']:
-                if 'coordinates' in runway and runway['coordinates']:
-                    coords = []
-                    try:
-                        for coord in runway['coordinates']:
-                            if hasattr(coord, 'lat') and hasattr(coord, 'lon'):
-                                lat = float(coord.lat)
-                                lon = float(coord.lon)
-                            elif isinstance(coord, dict) and 'lat' in coord and 'lon' in coord:
-                                lat = float(coord['lat'])
-                                lon = float(coord['lon'])
-                            elif isinstance(coord, (list, tuple)) and len(coord) >= 2:
-                                lat = float(coord[0])
-                                lon = float(coord[1])
-                            else:
-                                continue
-                            
-                            if -90 <= lat <= 90 and -180 <= lon <= 180:
-                                coords.append((lat, lon))
-                        
-                        if len(coords) >= 2:
-                            path = self.map_widget.set_path(coords, color="gray", width=3)
-                            if path:
-                                self.map_paths.append(path)
-                                items_drawn += 1
-                    except (ValueError, TypeError) as e:
-                        print(f"  ✗ Error drawing runway: {e}")
-        
-        # Draw ARTCC boundaries (AIRSPACE) - FIXED VERSION
-        if self.show_boundaries_var.get():
-            # High boundaries
-            if 'ARTCC_HIGH' in data and data['ARTCC_HIGH']:
-                print(f"DEBUG: Drawing {len(data['ARTCC_HIGH'])} ARTCC HIGH boundaries")
-                items_drawn += self.draw_boundaries_fixed(data['ARTCC_HIGH'], "red", width=2, name="ARTCC_HIGH")
-            
-            # Low boundaries
-            if 'ARTCC_LOW' in data and data['ARTCC_LOW']:
-                print(f"DEBUG: Drawing {len(data['ARTCC_LOW'])} ARTCC LOW boundaries")
-                items_drawn += self.draw_boundaries_fixed(data['ARTCC_LOW'], "blue", width=1, name="ARTCC_LOW")
-            
-            # Also check for regular ARTCC
-            if 'ARTCC' in data and data['ARTCC']:
-                print(f"DEBUG: Drawing {len(data['ARTCC'])} ARTCC boundaries")
-                items_drawn += self.draw_boundaries_fixed(data['ARTCC'], "orange", width=1, name="ARTCC")
+                try:
+                    coords = self.get_runway_coords(runway)
+                except (ValueError, TypeError) as e:
+                    print(f"  ✗ Error with runway: {e}")
+                    continue
+                if len(coords) >= 2:
+                    layer.add_path(coords, [('path', coords, {'color': "gray", 'width': 3})])
+                    items_drawn += 1
+        
+        # Draw ARTCC boundaries (AIRSPACE)
+        # High boundaries
+        if 'ARTCC_HIGH' in data and data['ARTCC_HIGH']:
+            print(f"DEBUG: Drawing {len(data['ARTCC_HIGH'])} ARTCC HIGH boundaries")
+            items_drawn += self.draw_boundaries_fixed(data['ARTCC_HIGH'], "red", width=2, name="ARTCC_HIGH")
+        
+        # Low boundaries
+        if 'ARTCC_LOW' in data and data['ARTCC_LOW']:
+            print(f"DEBUG: Drawing {len(data['ARTCC_LOW'])} ARTCC LOW boundaries")
+            items_drawn += self.draw_boundaries_fixed(data['ARTCC_LOW'], "blue", width=1, name="ARTCC_LOW")
+        
+        # Also check for regular ARTCC
+        if 'ARTCC' in data and data['ARTCC']:
+            print(f"DEBUG: Drawing {len(data['ARTCC'])} ARTCC boundaries")
+            items_drawn += self.draw_boundaries_fixed(data['ARTCC'], "orange", width=1, name="ARTCC")
         
         return items_drawn
     
     def draw_boundaries_fixed(self, boundaries, color, width=1, name="BOUNDARY"):
-        """Draw boundary lines on map - FIXED VERSION - returns count of items drawn"""
-        items_drawn = 0
+        """Register a boundary layer at the current zoom's level of detail - returns count of features"""
         if not boundaries:
-            return items_drawn
-            
-        print(f"DEBUG: Drawing boundaries for {name}")
-        
-        # DEBUG: Show sample boundary structure
-        if boundaries and len(boundaries) > 0:
-            sample = boundaries[0]
-            print(f"DEBUG: Sample boundary structure - keys: {list(sample.keys())}")
-            if 'segments' in sample and sample['segments']:
-                sample_seg = sample['segments'][0]
-                print(f"DEBUG: Sample segment structure - type: {type(sample_seg)}, keys: {list(sample_seg.keys())}")
-                print(f"DEBUG: Sample start: {sample_seg.get('start')}")
-                print(f"DEBUG: Sample end: {sample_seg.get('end')}")
-        
-        for boundary_idx, boundary in enumerate(boundaries[:20]):  # Limit to first 20 boundaries
-            if 'segments' in boundary and boundary['segments']:
-                print(f"  Boundary '{boundary.get('name', f'#{boundary_idx}')}': {len(boundary['segments'])} segments")
-                
-                for segment_idx, segment in enumerate(boundary['segments'][:200]):  # Limit segments
-                    try:
-                        # Handle the SCTParser format
-                        if 'start' in segment and 'end' in segment:
-                            start = segment['start']
-                            end = segment['end']
-                            
-                            # Extract coordinates from SCTParser's dict format
-                            if isinstance(start, dict):
-                                # SCTParser format: {'lat': 12.34, 'lon': 56.78}
-                                lat1 = float(start.get('lat', 0))
-                                lon1 = float(start.get('lon', 0))
-                            elif isinstance(start, (list, tuple)) and len(start) >= 2:
-                                lat1 = float(start[0])
-                                lon1 = float(start[1])
-                            else:
-                                print(f"    ✗ Invalid start format: {type(start)}")
-                                continue
-                                
-                            if isinstance(end, dict):
-                                # SCTParser format: {'lat': 12.35, 'lon': 56.79}
-                                lat2 = float(end.get('lat', 0))
-                                lon2 = float(end.get('lon', 0))
-                            elif isinstance(end, (list, tuple)) and len(end) >= 2:
-                                lat2 = float(end[0])
-                                lon2 = float(end[1])
-                            else:
-                                print(f"    ✗ Invalid end format: {type(end)}")
-                                continue
-                            
-                            # Validate coordinates
-                            if (-90 <= lat1 <= 90 and -180 <= lon1 <= 180 and 
-                                -90 <= lat2 <= 90 and -180 <= lon2 <= 180 and
-                                (lat1 != 0 or lon1 != 0) and (lat2 != 0 or lon2 != 0)):
-                                
-                                # Draw the segment
-                                path = self.map_widget.set_path(
-                                    [(lat1, lon1), (lat2, lon2)],
-                                    color=color,
-                                    width=width
-                                )
-                                if path:
-                                    self.map_paths.append(path)
-                                    items_drawn += 1
-                                    
-                                    # Debug first few segments
-                                    if segment_idx < 3:
-                                        print(f"    Segment {segment_idx}: ({lat1:.4f}, {lon1:.4f}) to ({lat2:.4f}, {lon2:.4f})")
-                    except (ValueError, TypeError, KeyError) as e:
-                        print(f"    ✗ Error in segment {segment_idx}: {e}")
-                        continue
+            return 0
         
-        print(f"  ✓ Drawn {items_drawn} boundary segments for {name}")
+        lod = self.get_boundary_lod(boundaries, name)
+        self.boundary_layers.append((lod, color, width))
+        
+        level = lod.level_for_zoom(self.map_widget.zoom)
+        if level != self.boundary_lod_level:
+            # Keep every boundary layer on the same level
+            self.boundary_lod_level = None
+            self.update_boundary_lod()
+            items_drawn = len(self.get_path_layer('boundaries'))
+        else:
+            items_drawn = self.add_boundary_features(lod, level, color, width)
+        
+        print(f"  ✓ {lod.vertex_count(level)} of {lod.vertex_count()} vertices for {name} at LOD {level}")
         return items_drawn
     
+    def get_boundary_lod(self, boundaries, name):
+        """Level-of-detail pyramid for a boundary layer, cached by the parser when possible"""
+        if self.sct_parser and hasattr(self.sct_parser, 'get_boundary_lod'):
+            try:
+                return self.sct_parser.get_boundary_lod(name)
+            except KeyError:
+                pass
+        return BoundaryLOD.from_boundaries(boundaries)
+    
+    def add_boundary_features(self, lod, level, color, width):
+        """Add one layer's simplified paths, projected once per level and cut into short pieces"""
+        paths = lod.projected_for_level(level, self.BOUNDARY_CHUNK_VERTICES)
+        return self.get_path_layer('boundaries').add_paths(paths, color, width)
+    
+    def update_boundary_lod(self):
+        """Re-register boundaries when the zoom crosses a pyramid level - returns True if it did"""
+        if not self.boundary_layers:
+            return False
+        level = self.boundary_layers[0][0].level_for_zoom(self.map_widget.zoom)
+        if level == self.boundary_lod_level:
+            return False
+        
+        print(f"DEBUG: Boundary LOD {self.boundary_lod_level} -> {level}")
+        self.get_path_layer('boundaries').reset()
+        for lod, color, width in self.boundary_layers:
+            self.add_boundary_features(lod, level, color, width)
+        self.boundary_lod_level = level
+        return True
+    
     def draw_rwy_data(self, data):
-        """Draw RWY data on map - returns count of items drawn"""
+        """Register RWY data with the map layers - returns count of features"""
         items_drawn = 0
+        layer = self.get_layer('runways')
         
-        # Draw runways
-        if 'runways' in data and data['runways'] and self.show_runways_var.get():
-            print(f"DEBUG: Drawing {len(data['runways'])} runways from RWY")
+        # Runways
+        if 'runways' in data and data['runways']:
+            print(f"DEBUG: Registering {len(data['runways'])} runways from RWY")
             for runway in data['runways']:
-                if 'coordinates' in runway and runway['coordinates']:
-                    coords = []
-                    try:
-                        for coord in runway['coordinates']:
-                            if isinstance(coord, (list, tuple)) and len(coord) >= 2:
-                                lat = float(coord[0])
-                                lon = float(coord[1])
-                                if -90 <= lat <= 90 and -180 <= lon <= 180:
-                                    coords.append((lat, lon))
-                        
-                        if len(coords) >= 2:
-                            path = self.map_widget.set_path(coords, color="orange", width=3)
-                            if path:
-                                self.map_paths.append(path)
-                                items_drawn += 1
-                    except (ValueError, TypeError) as e:
-                        print(f"  ✗ Error drawing RWY runway: {e}")
+                try:
+                    coords = self.get_runway_coords(runway)
+                except (ValueError, TypeError) as e:
+                    print(f"  ✗ Error with RWY runway: {e}")
+                    continue
+                if len(coords) >= 2:
+                    layer.add_path(coords, [('path', coords, {'color': "orange", 'width': 3})])
+                    items_drawn += 1
         
-        # Draw ILS
-        if 'ils_data' in data and data['ils_data'] and self.show_runways_var.get():
-            print(f"DEBUG: Drawing {len(data['ils_data'])} ILS")
+        # ILS localizer lines with a marker at the localizer
+        if 'ils_data' in data and data['ils_data']:
+            print(f"DEBUG: Registering {len(data['ils_data'])} ILS")
             for ils in data['ils_data']:
                 if 'localizer' in ils and 'glideslope' in ils:
-                    localizer = ils['localizer']
-                    glideslope = ils['glideslope']
-                    if len(localizer) >= 2 and len(glideslope) >= 2:
-                        try:
-                            lat1 = float(localizer[0])
-                            lon1 = float(localizer[1])
-                            lat2 = float(glideslope[0])
-                            lon2 = float(glideslope[1])
-                            
-                            if (-90 <= lat1 <= 90 and -180 <= lon1 <= 180 and 
-                                -90 <= lat2 <= 90 and -180 <= lon2 <= 180):
-                                # Draw ILS localizer line
-                                path = self.map_widget.set_path(
-                                    [(lat1, lon1), (lat2, lon2)],
-                                    color="magenta",
-                                    width=2
-                                )
-                                if path:
-                                    self.map_paths.append(path)
-                                    items_drawn += 1
-                                
-                                # Mark ILS position
-                                marker = self.map_widget.set_marker(
-                                    lat1, lon1,
-                                    text=f"ILS:{ils.get('name', '')}",
-                                    marker_color_circle="magenta",
-                                    font=("Arial", 8)
-                                )
-                                if marker:
-                                    self.map_markers.append(marker)
-                                    items_drawn += 1
-                        except (ValueError, TypeError) as e:
-                            print(f"  ✗ Error drawing ILS {ils.get('name', 'Unknown')}: {e}")
+                    try:
+                        localizer = self.parse_coordinate(ils['localizer'])
+                        glideslope = self.parse_coordinate(ils['glideslope'])
+                    except (ValueError, TypeError) as e:
+                        print(f"  ✗ Error with ILS {ils.get('name', 'Unknown')}: {e}")
+                        continue
+                    if localizer and glideslope:
+                        layer.add_path([localizer, glideslope], [
+                            ('path', [localizer, glideslope], {'color': "magenta", 'width': 2}),
+                            ('marker', localizer, {
+                                'text': f"ILS:{ils.get('name', '')}",
+                                'marker_color_circle': "magenta",
+                                'font': ("Arial", 8)
+                            })
+                        ])
+                        items_drawn += 1
         
         return items_drawn
     
     def draw_ese_data(self, coordinates):
-        """Draw ESE data on map - returns count of items drawn"""
+        """Register ESE positions with the map layers - returns count of features"""
         items_drawn = 0
         if not coordinates:
             return items_drawn
-            
-        print(f"DEBUG: Drawing {len(coordinates)} ESE coordinates")
-        for coord in coordinates[:100]:  # Limit to first 100
+        
+        print(f"DEBUG: Registering {len(coordinates)} ESE coordinates")
+        for coord in coordinates:
             if 'lat' in coord and 'lon' in coord:
                 try:
-                    lat = float(coord['lat'])
-                    lon = float(coord['lon'])
-                    name = coord.get('name', 'POS')
-                    
-                    if -90 <= lat <= 90 and -180 <= lon <= 180:
-                        marker = self.map_widget.set_marker(
-                            lat, lon,
-                            text=name,
-                            marker_color_circle="yellow",
-                            marker_color_outside="orange",
-                            font=("Arial", 8)
-                        )
-                        if marker:
-                            self.map_markers.append(marker)
-                            items_drawn += 1
-                except (ValueError, TypeError) as e:
+                    items_drawn += self.add_marker_feature(
+                        'ese', float(coord['lat']), float(coord['lon']),
+                        text=coord.get('name', 'POS'),
+                        marker_color_circle="yellow",
+                        marker_color_outside="orange",
+                        font=("Arial", 8)
+                    )
+                except (ValueError, TypeError):
                     pass
         
         return items_drawn
     
     def draw_runway_extensions(self):
-        """Draw 20NM extensions on both ends of runways - returns count of items drawn"""
+        """Register 20NM extensions on both ends of runways - returns count of features"""
         items_drawn = 0
-        
-        # Clear existing extensions
-        for extension in self.runway_extensions:
-            try:
-                extension.delete()
-            except:
-                pass
-        self.runway_extensions = []
+        layer = self.get_layer('extensions')
+        layer.reset()
         
         # Get runways from SCT parser
         if self.sct_parser and hasattr(self.sct_parser, 'get_data'):
             try:
                 data = self.sct_parser.get_data()
                 if 'runways' in data and data['runways']:
-                    print(f"DEBUG: Drawing extensions for {len(data['runways'])} runways")
+                    print(f"DEBUG: Registering extensions for {len(data['runways'])} runways")
+                    
+                    extension_distance = 20 * 1852  # 20NM in meters
+                    line = {'color': "darkgray", 'width': 1, 'dash': (5, 2)}
+                    label = {'text': "20NM", 'marker_color_circle': "lightgray", 'font': ("Arial", 6)}
                     
-                    for runway in data['runways'][:20]:  # Limit to first 20 for performance
-                        if 'coordinates' in runway and runway['coordinates']:
-                            try:
-                                # Get runway coordinates
-                                coords = []
-                                for coord in runway['coordinates']:
-                                    if hasattr(coord, 'lat') and hasattr(coord, 'lon'):
-                                        lat = float(coord.lat)
-                                        lon = float(coord.lon)
-                                    elif isinstance(coord, dict) and 'lat' in coord and 'lon' in coord:
-                                        lat = float(coord['lat'])
-                                        lon = float(coord['lon'])
-                                    elif isinstance(coord, (list, tuple)) and len(coord) >= 2:
-                                        lat = float(coord[0])
-                                        lon = float(coord[1])
-                                    else:
-                                        continue
-                                    
-                                    if -90 <= lat <= 90 and -180 <= lon <= 180:
-                                        coords.append((lat, lon))
-                                
-                                if len(coords) >= 2:
-                                    # Calculate runway direction vector
-                                    start_lat, start_lon = coords[0]
-                                    end_lat, end_lon = coords[-1]
-                                    
-                                    # Calculate bearing
-                                    bearing = self.calculate_bearing(start_lat, start_lon, end_lat, end_lon)
-                                    reverse_bearing = (bearing + 180) % 360
-                                    
-                                    # Calculate extension points (20NM = ~37km)
-                                    extension_distance = 20 * 1852  # Convert NM to meters
-                                    
-                                    # Extension from start point (opposite direction)
-                                    ext_start = self.calculate_destination_point(
-                                        start_lat, start_lon, reverse_bearing, extension_distance
-                                    )
-                                    
-                                    # Extension from end point
-                                    ext_end = self.calculate_destination_point(
-                                        end_lat, end_lon, bearing, extension_distance
-                                    )
-                                    
-                                    # Draw extension lines
-                                    if ext_start and ext_end:
-                                        # Draw extension from start
-                                        path1 = self.map_widget.set_path(
-                                            [coords[0], ext_start],
-                                            color="darkgray",
-                                            width=1,
-                                            dash=(5, 2)  # Dashed line
-                                        )
-                                        if path1:
-                                            self.runway_extensions.append(path1)
-                                            items_drawn += 1
-                                        
-                                        # Draw extension from end
-                                        path2 = self.map_widget.set_path(
-                                            [coords[-1], ext_end],
-                                            color="darkgray",
-                                            width=1,
-                                            dash=(5, 2)  # Dashed line
-                                        )
-                                        if path2:
-                                            self.runway_extensions.append(path2)
-                                            items_drawn += 1
-                                        
-                                        # Mark extension points
-                                        marker1 = self.map_widget.set_marker(
-                                            ext_start[0], ext_start[1],
-                                            text="20NM",
-                                            marker_color_circle="lightgray",
-                                            font=("Arial", 6)
-                                        )
-                                        if marker1:
-                                            self.map_markers.append(marker1)
-                                        
-                                        marker2 = self.map_widget.set_marker(
-                                            ext_end[0], ext_end[1],
-                                            text="20NM",
-                                            marker_color_circle="lightgray",
-                                            font=("Arial", 6)
-                                        )
-                                        if marker2:
-                                            self.map_markers.append(marker2)
-                                        
-                            except Exception as e:
-                                print(f"  ✗ Error drawing runway extension: {e}")
+                    for runway in data['runways']:
+                        try:
+                            coords = self.get_runway_coords(runway)
+                            if len(coords) < 2:
+                                continue
+                            
+                            # Extend outwards from both runway ends
+                            start_lat, start_lon = coords[0]
+                            end_lat, end_lon = coords[-1]
+                            bearing = self.calculate_bearing(start_lat, start_lon, end_lat, end_lon)
+                            reverse_bearing = (bearing + 180) % 360
+                            ext_start = self.calculate_destination_point(
+                                start_lat, start_lon, reverse_bearing, extension_distance
+                            )
+                            ext_end = self.calculate_destination_point(
+                                end_lat, end_lon, bearing, extension_distance
+                            )
+                            
+                            for end_point, ext_point in ((coords[0], ext_start), (coords[-1], ext_end)):
+                                layer.add_path([end_point, ext_point], [
+                                    ('path', [end_point, ext_point], line),
+                                    ('marker', ext_point, label)
+                                ])
+                                items_drawn += 1
+                        except Exception as e:
+                            print(f"  ✗ Error with runway extension: {e}")
             except Exception as e:
-                print(f"ERROR drawing runway extensions: {e}")
+                print(f"ERROR registering runway extensions: {e}")
         
         return items_drawn
-    
+
     def calculate_bearing(self, lat1, lon1, lat2, lon2):
         """Calculate bearing between two points in degrees"""
         lat1_rad = math.radians(lat1)
@@ -660,23 +590,36 @@ class SweatboxMapViewer:
         print(f"DEBUG: Selected airport: {self.selected_airport}")
         
         # Find and center on selected airport
-        if self.sct_parser and hasattr(self.sct_parser, 'get_data'):
-            data = self.sct_parser.get_data()
-            if 'airports' in data:
-                for airport in data['airports']:
-                    if airport.get('icao') == self.selected_airport:
-                        try:
-                            lat = float(airport['latitude'])
-                            lon = float(airport['longitude'])
-                            if -90 <= lat <= 90 and -180 <= lon <= 180:
-                                self.map_widget.set_position(lat, lon)
-                                self.map_widget.set_zoom(10)
-                                print(f"  ✓ Centered on {self.selected_airport} at {lat}, {lon}")
-                                break
-                            else:
-                                print(f"  ✗ Invalid coordinates for {self.selected_airport}: {lat}, {lon}")
-                        except (ValueError, TypeError) as e:
-                            print(f"  ✗ Error centering on airport: {e}")
+        airport = self.find_airport(self.selected_airport)
+        if airport:
+            try:
+                lat = float(airport['latitude'])
+                lon = float(airport['longitude'])
+                if -90 <= lat <= 90 and -180 <= lon <= 180:
+                    self.map_widget.set_position(lat, lon)
+                    self.map_widget.set_zoom(10)
+                    # Fill the new view in now rather than at the next poll
+                    self.request_redraw('viewport')
+                    print(f"  ✓ Centered on {self.selected_airport} at {lat}, {lon}")
+                else:
+                    print(f"  ✗ Invalid coordinates for {self.selected_airport}: {lat}, {lon}")
+            except (ValueError, TypeError) as e:
+                print(f"  ✗ Error centering on airport: {e}")
+    
+    def find_airport(self, icao):
+        """Look up an airport by ICAO code, using the parser index when available"""
+        if not self.sct_parser or not icao:
+            return None
+        
+        if hasattr(self.sct_parser, 'get_airport'):
+            return self.sct_parser.get_airport(icao)
+        
+        # Parsers without an index (e.g. fallbacks) only provide get_data()
+        if hasattr(self.sct_parser, 'get_data'):
+            for airport in self.sct_parser.get_data().get('airports', []):
+                if airport.get('icao') == icao:
+                    return airport
+        return None
     
     def force_reload_data(self):
         """Force reload all data - useful for debugging"""
@@ -685,10 +628,6 @@ class SweatboxMapViewer:
         # Clear all stored data
         self.aircraft_points = []
         self.entry_fixes = []
-        self.map_markers = []
-        self.map_paths = []
-        self.aircraft_markers = []
-        self.runway_extensions = []
         self.aircraft_data = []
         
         # Clear the map
@@ -713,129 +652,159 @@ class SweatboxMapViewer:
     
     def clear_map(self):
         """Clear all map markers and paths"""
-        # Clear markers
-        for marker in self.map_markers:
-            try:
-                marker.delete()
-            except:
-                pass
-        self.map_markers = []
-        
-        # Clear paths
-        for path in self.map_paths:
-            try:
-                path.delete()
-            except:
-                pass
-        self.map_paths = []
-        
-        # Clear aircraft markers (but keep aircraft data)
-        for aircraft_marker in self.aircraft_markers:
-            try:
-                aircraft_marker.delete()
-            except:
-                pass
-        self.aircraft_markers = []
-        
-        # Clear runway extensions
-        for extension in self.runway_extensions:
-            try:
-                extension.delete()
-            except:
-                pass
-        self.runway_extensions = []
+        # Every layer (markers, paths, runway extensions, boundaries, aircraft); aircraft data is kept
+        self.layer_manager.clear()
+        self.boundary_layers = []
+        self.boundary_lod_level = None
     
     def clear_aircraft(self):
         """Clear only aircraft markers and data"""
-        for aircraft_marker in self.aircraft_markers:
-            try:
-                aircraft_marker.delete()
-            except:
-                pass
-        self.aircraft_markers = []
         self.aircraft_data = []
+        self.aircraft_index = {}
         self.clear_aircraft_selection()
+        self.get_layer('aircraft').reset()
     
     def add_aircraft(self, aircraft_data):
         """Add aircraft to map and store data"""
-        # Store aircraft data for redraw
+        # Store aircraft data; aircraft added in one go are drawn by a single redraw
         self.aircraft_data.append(aircraft_data)
+        self.aircraft_index[aircraft_data.get('callsign', '')] = aircraft_data
         
-        # Draw if aircraft visibility is on
-        if self.show_aircraft_var.get():
-            items_drawn = self.draw_single_aircraft(aircraft_data)
-            if items_drawn > 0:
-                print(f"✓ Added aircraft {aircraft_data.get('callsign', 'Unknown')}")
+        self.request_redraw('aircraft')
+        print(f"✓ Added aircraft {aircraft_data.get('callsign', 'Unknown')}")
     
-    def draw_single_aircraft(self, aircraft_data):
-        """Draw a single aircraft on map - returns 1 if drawn, 0 if not"""
+    def set_aircraft(self, aircraft_list):
+        """Replace all aircraft, redrawing only those that were added, moved or changed"""
+        self.aircraft_data = list(aircraft_list)
+        self.aircraft_index = {aircraft.get('callsign', ''): aircraft for aircraft in self.aircraft_data}
+        if self.selected_aircraft and self.selected_aircraft not in self.aircraft_index:
+            self.selected_aircraft = None
+            self.clear_aircraft_selection()
+        self.request_redraw('aircraft')
+    
+    def get_aircraft_position(self, aircraft_data):
+        """(lat, lon) of an aircraft from its position string, or None"""
         position = aircraft_data.get('position', '')
         callsign = aircraft_data.get('callsign', '')
-        heading = aircraft_data.get('heading', '000')
-        
-        # Parse heading
-        try:
-            heading_deg = float(heading) % 360
-        except:
-            heading_deg = 0
         
-        # Parse position string
-        try:
-            if ',' in position:
-                lat_str, lon_str = position.split(',')
-                lat = float(lat_str.strip())
-                lon = float(lon_str.strip())
+        if ',' in position:
+            lat_str, lon_str = position.split(',')
+            lat = float(lat_str.strip())
+            lon = float(lon_str.strip())
+        else:
+            # Try to extract from other formats
+            coords = re.findall(r'[-+]?\d*\.\d+|\d+', position)
+            if len(coords) >= 2:
+                lat = float(coords[0])
+                lon = float(coords[1])
             else:
-                # Try to extract from other formats
-                coords = re.findall(r'[-+]?\d*\.\d+|\d+', position)
-                if len(coords) >= 2:
-                    lat = float(coords[0])
-                    lon = float(coords[1])
+                # Try to get from SCT airports if available
+                airport = None
+                if callsign[:4] in self.loaded_airports:
+                    airport = self.find_airport(callsign[:4])
+                if airport:
+                    lat = float(airport['latitude'])
+                    lon = float(airport['longitude'])
                 else:
-                    # Try to get from SCT airports if available
-                    if self.sct_parser and callsign[:4] in self.loaded_airports:
-                        data = self.sct_parser.get_data()
-                        if 'airports' in data:
-                            for airport in data['airports']:
-                                if airport.get('icao') == callsign[:4]:
-                                    lat = float(airport['latitude'])
-                                    lon = float(airport['longitude'])
-                                    break
-                            else:
-                                lat, lon = 0, 0  # Default
-                    else:
-                        lat, lon = 0, 0  # Default
-            
-            # Validate coordinates
-            if -90 <= lat <= 90 and -180 <= lon <= 180:
-                # Create aircraft marker
-                marker = self.map_widget.set_marker(
-                    lat, lon,
-                    text=callsign,
-                    marker_color_circle="cyan",
-                    marker_color_outside="darkblue",
-                    text_color="black",
-                    font=("Arial", 9, "bold")
-                )
-                if marker:
-                    # Store aircraft data with the marker
-                    marker.aircraft_data = aircraft_data
-                    marker.callsign = callsign
-                    
-                    # Bind click event for selection
-                    marker.bind("<Button-1>", lambda e, m=marker: self.on_aircraft_click(e, m))
-                    
-                    self.aircraft_markers.append(marker)
-                    return 1
-                else:
-                    print(f"  ✗ Failed to create marker for {callsign}")
-            else:
-                print(f"  ✗ Invalid coordinates for aircraft {callsign}: {lat}, {lon}")
-            
+                    lat, lon = 0, 0  # Default
+        
+        if -90 <= lat <= 90 and -180 <= lon <= 180:
+            return (lat, lon)
+        print(f"  ✗ Invalid coordinates for aircraft {callsign}: {lat}, {lon}")
+        return None
+    
+    def aircraft_feature(self, aircraft_data):
+        """(bbox, feature) for the aircraft layer, or None if the position is invalid.
+        
+        The feature holds everything the marker shows, so the layer can tell
+        when an aircraft actually needs redrawing.
+        """
+        callsign = aircraft_data.get('callsign', '')
+        try:
+            position = self.get_aircraft_position(aircraft_data)
         except (ValueError, AttributeError, TypeError) as e:
             print(f"  ✗ Error adding aircraft {callsign}: {e}")
-        
-        return 0
+            return None
+        if position is None:
+            return None
+        lat, lon = position
+        return (lat, lon, lat, lon), (lat, lon, callsign, callsign == self.selected_aircraft)
+    
+    def aircraft_colors(self, selected):
+        """(circle, outside, text) marker colours of a selected or unselected aircraft"""
+        if selected:
+            return "red", "darkred", "white"
+        return "cyan", "darkblue", "black"
+    
+    def create_aircraft_marker(self, feature):
+        """Draw one aircraft marker (aircraft layer factory)"""
+        lat, lon, callsign, selected = feature
+        circle, outside, text = self.aircraft_colors(selected)
+        marker = self.map_widget.set_marker(
+            lat, lon,
+            text=callsign,
+            marker_color_circle=circle,
+            marker_color_outside=outside,
+            text_color=text,
+            font=("Arial", 9, "bold")
+        )
+        if marker:
+            marker.callsign = callsign
+            
+            # Bind click event for selection
+            marker.bind("<Button-1>", lambda e, m=marker: self.on_aircraft_click(e, m))
+        else:
+            print(f"  ✗ Failed to create marker for {callsign}")
+        return marker
+    
+    def update_aircraft_marker(self, items, feature):
+        """Move, recolour and relabel a drawn aircraft marker in place (aircraft layer updater)"""
+        if not items:
+            return False
+        marker = items[0]
+        lat, lon, callsign, selected = feature
+        circle, outside, text = self.aircraft_colors(selected)
+        
+        if (circle, outside, text) != (marker.marker_color_circle, marker.marker_color_outside, marker.text_color):
+            marker.marker_color_circle = circle
+            marker.marker_color_outside = outside
+            marker.text_color = text
+            canvas = self.map_widget.canvas
+            if marker.polygon is not None:
+                canvas.itemconfig(marker.polygon, fill=outside, outline=outside)
+            if marker.big_circle is not None:
+                canvas.itemconfig(marker.big_circle, fill=circle, outline=outside)
+            if marker.canvas_text is not None:
+                canvas.itemconfig(marker.canvas_text, fill=text)
+        
+        marker.callsign = callsign
+        marker.text = callsign
+        # Moves the canvas items and updates the label text
+        marker.set_position(lat, lon)
+        return True
+    
+    def refresh_aircraft(self, *callsigns):
+        """Update the markers of some aircraft from their stored data"""
+        with batched_redraw(self.map_widget):
+            for callsign in callsigns:
+                aircraft = self.aircraft_index.get(callsign)
+                if aircraft is not None:
+                    self.draw_single_aircraft(aircraft)
+    
+    def draw_single_aircraft(self, aircraft_data):
+        """Draw a single aircraft on map - returns 1 if drawn, 0 if not"""
+        entry = self.aircraft_feature(aircraft_data)
+        if entry is None:
+            return 0
+        bbox, feature = entry
+        self.get_layer('aircraft').add(bbox, feature, key=aircraft_data.get('callsign', ''))
+        return 1
+    
+    def get_aircraft_marker(self, callsign):
+        """Marker currently drawn for a callsign, or None"""
+        self.redraw_scheduler.flush()
+        items = self.get_layer('aircraft').drawn_items(callsign)
+        return items[0] if items else None
     
     def on_aircraft_click(self, event, marker):
         """Handle aircraft click for selection"""
@@ -845,61 +814,36 @@ class SweatboxMapViewer:
     
     def select_aircraft(self, callsign, marker=None):
         """Select an aircraft on the map"""
-        # Clear previous selection
-        self.clear_aircraft_selection()
+        # Aircraft added this turn must be on the layer before they can be selected
+        self.redraw_scheduler.flush()
+        layer = self.get_layer('aircraft')
+        if callsign not in layer:
+            return False
         
-        # Find the marker if not provided
-        if not marker:
-            for m in self.aircraft_markers:
-                if hasattr(m, 'callsign') and m.callsign == callsign:
-                    marker = m
-                    break
+        # Recolour just the previously and the newly selected markers
+        previous = self.selected_aircraft
+        self.selected_aircraft = callsign
+        self.refresh_aircraft(previous, callsign)
         
-        if marker:
-            # Highlight the selected aircraft
-            marker.marker_color_circle = "red"
-            marker.marker_color_outside = "darkred"
-            marker.text_color = "white"
-            
-            # Update the marker appearance
-            try:
-                marker.draw()
-            except:
-                pass
-            
-            self.selected_aircraft = callsign
-            self.selected_aircraft_label.config(
-                text=f"Selected: {callsign}",
-                fg="red",
-                font=("Arial", 9, "bold")
-            )
-            
-            # Center map on selected aircraft
-            if hasattr(marker, 'position'):
-                self.map_widget.set_position(marker.position[0], marker.position[1])
-                self.map_widget.set_zoom(12)
-            
-            return True
+        self.selected_aircraft_label.config(
+            text=f"Selected: {callsign}",
+            fg="red",
+            font=("Arial", 9, "bold")
+        )
         
-        return False
+        # Center map on selected aircraft
+        lat, lon, _, _ = layer.features[callsign]
+        self.map_widget.set_position(lat, lon)
+        self.map_widget.set_zoom(12)
+        return True
     
     def clear_aircraft_selection(self):
         """Clear aircraft selection"""
         if self.selected_aircraft:
-            # Find and restore the previously selected aircraft
-            for marker in self.aircraft_markers:
-                if hasattr(marker, 'callsign') and marker.callsign == self.selected_aircraft:
-                    # Restore original colors
-                    marker.marker_color_circle = "cyan"
-                    marker.marker_color_outside = "darkblue"
-                    marker.text_color = "black"
-                    
-                    # Update the marker appearance
-                    try:
-                        marker.draw()
-                    except:
-                        pass
-                    break
+            # Restore the previously selected marker's colours
+            previous = self.selected_aircraft
+            self.selected_aircraft = None
+            self.refresh_aircraft(previous)
         
         self.selected_aircraft = None
         self.selected_aircraft_label.config(
@@ -915,62 +859,43 @@ class SweatboxMapViewer:
             return
         
         # Convert canvas coordinates to map coordinates
-        canvas_x = event.x
-        canvas_y = event.y
-        
-        # Get map coordinates
-        map_position = self.map_widget.convert_canvas_coords_to_decimal_coords(canvas_x, canvas_y)
+        map_position = self.map_widget.convert_canvas_coords_to_decimal_coords(event.x, event.y)
         
         if map_position:
             lat, lon = map_position
             print(f"✓ Moving aircraft {self.selected_aircraft} to {lat:.4f}, {lon:.4f}")
             
-            # Find and update the aircraft marker
-            for marker in self.aircraft_markers:
-                if hasattr(marker, 'callsign') and marker.callsign == self.selected_aircraft:
-                    # Update marker position
-                    marker.set_position(lat, lon)
-                    
-                    # Update aircraft data
-                    for i, aircraft in enumerate(self.aircraft_data):
-                        if aircraft.get('callsign') == self.selected_aircraft:
-                            self.aircraft_data[i]['position'] = f"{lat:.6f}, {lon:.6f}"
-                            break
-                    
-                    # Notify parent (home_page) about position update
-                    if hasattr(self.parent, 'on_aircraft_position_update'):
-                        try:
-                            # Get the parent of parent (HomePage)
-                            home_page = self.parent.master.master.master
-                            if hasattr(home_page, 'on_aircraft_position_update'):
-                                home_page.on_aircraft_position_update(self.selected_aircraft, f"{lat:.6f}, {lon:.6f}")
-                        except:
-                            pass
-                    
-                    # Recenter on new position
-                    self.map_widget.set_position(lat, lon)
-                    break
+            # Update aircraft data and move only this aircraft's marker
+            aircraft = self.aircraft_index.get(self.selected_aircraft)
+            if aircraft is None:
+                return
+            aircraft['position'] = f"{lat:.6f}, {lon:.6f}"
+            self.draw_single_aircraft(aircraft)
+            
+            # Notify parent (home_page) about position update
+            if hasattr(self.parent, 'on_aircraft_position_update'):
+                try:
+                    # Get the parent of parent (HomePage)
+                    home_page = self.parent.master.master.master
+                    if hasattr(home_page, 'on_aircraft_position_update'):
+                        home_page.on_aircraft_position_update(self.selected_aircraft, f"{lat:.6f}, {lon:.6f}")
+                except:
+                    pass
+            
+            # Recenter on new position
+            self.map_widget.set_position(lat, lon)
     
     def draw_aircraft(self):
-        """Draw all stored aircraft"""
-        print(f"DEBUG: Drawing {len(self.aircraft_data)} aircraft")
-        # Clear existing aircraft markers
-        for aircraft_marker in self.aircraft_markers:
-            try:
-                aircraft_marker.delete()
-            except:
-                pass
-        self.aircraft_markers = []
-        
-        # Clear selection
-        self.clear_aircraft_selection()
-        
-        # Draw all aircraft
-        drawn_count = 0
+        """Bring the aircraft layer in line with the stored aircraft, redrawing only what changed"""
+        features = {}
         for aircraft in self.aircraft_data:
-            drawn_count += self.draw_single_aircraft(aircraft)
+            entry = self.aircraft_feature(aircraft)
+            if entry:
+                features[aircraft.get('callsign', '')] = entry
         
-        print(f"✓ Successfully drew {drawn_count} out of {len(self.aircraft_data)} aircraft")
+        changed = self.get_layer('aircraft').sync(features)
+        if changed:
+            print(f"DEBUG: Redrew {changed} of {len(features)} aircraft")
     
     def zoom_in(self):
         """Zoom in on map"""
@@ -985,6 +910,21 @@ class SweatboxMapViewer:
         self.map_widget.set_zoom(new_zoom)
         print(f"DEBUG: Zoomed out to {new_zoom}")
     
+    def seed_base_map(self):
+        """Fill the offline tile store from a {z}/{x}/{y} tile directory, for the loaded data's area"""
+        directory = filedialog.askdirectory(title="Select a tile directory ({z}/{x}/{y}.png)")
+        if not directory:
+            return
+        bounds = points_bounds(self.layer_manager.bounds())
+        try:
+            count = self.base_map.store.seed_from_directory(directory, bounds)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to seed tiles:\n{str(e)}")
+            return
+        # Reload the map tiles from the store
+        self.base_map.install(self.map_widget)
+        messagebox.showinfo("Tiles Seeded", f"Stored {count} tiles.")
+    
     def fit_to_data(self):
         """Fit map view to show all data"""
         print("DEBUG: Fitting map to data...")
@@ -992,20 +932,8 @@ class SweatboxMapViewer:
         # Collect all coordinates
         all_coords = []
         
-        # Get coordinates from markers
-        for marker in self.map_markers:
-            if hasattr(marker, 'position') and marker.position:
-                all_coords.append(marker.position)
-        
-        # Get coordinates from paths
-        for path in self.map_paths:
-            if hasattr(path, 'position_list') and path.position_list:
-                all_coords.extend(path.position_list)
-        
-        # Get coordinates from aircraft
-        for aircraft in self.aircraft_markers:
-            if hasattr(aircraft, 'position') and aircraft.position:
-                all_coords.append(aircraft.position)
+        # Get the extent of every layer (aircraft included), drawn or not
+        all_coords.extend(self.layer_manager.bounds())
         
         # Also check aircraft data for coordinates
         for aircraft in self.aircraft_data:
@@ -1086,53 +1014,72 @@ class SweatboxMapViewer:
             self.map_widget.set_zoom(3)
     
     def redraw_all(self):
-        """Redraw all data with current visibility settings"""
-        print("DEBUG: Redrawing all data with current visibility settings")
-        # Store current aircraft data and selection
-        current_aircraft = self.aircraft_data.copy()
-        selected = self.selected_aircraft
-        
-        # Clear and reload all data
-        self.load_data()
-        
-        # Restore aircraft data
-        self.aircraft_data = current_aircraft
-        if self.show_aircraft_var.get():
-            self.draw_aircraft()
-            
-            # Restore selection if it existed
-            if selected:
-                self.select_aircraft(selected)
+        """Bring the map in line with the visibility settings and aircraft data, touching only what changed"""
+        self.request_redraw()
+    
+    def request_redraw(self, *parts):
+        """Mark parts of the map dirty (default all of REDRAW_PARTS); they are redrawn together once idle"""
+        self.redraw_scheduler.request(*(parts or self.REDRAW_PARTS))
+    
+    def flush_redraw(self, dirty):
+        """Redraw everything marked dirty since the last flush, as one incremental update"""
+        with batched_redraw(self.map_widget):
+            if 'visibility' in dirty:
+                self.apply_layer_visibility()
+            if 'aircraft' in dirty:
+                self.draw_aircraft()
+        # Also picks up a view change; without one this costs nothing
+        self.update_viewport()
     
     def get_entry_fixes(self):
-        """Get entry fixes for selected airport"""
+        """Get fixes within ENTRY_FIX_RADIUS_NM of the selected airport, closest first"""
         entry_fixes = []
         
         if self.sct_parser and hasattr(self.sct_parser, 'get_data'):
-            data = self.sct_parser.get_data()
-            if 'fixes' in data:
-                for fix in data['fixes'][:20]:  # First 20 fixes
+            airport = self.find_airport(self.selected_airport)
+            if airport and 'latitude' in airport and 'longitude' in airport:
+                airport_lat = float(airport['latitude'])
+                airport_lon = float(airport['longitude'])
+                
+                if hasattr(self.sct_parser, 'get_spatial_index'):
+                    index = self.sct_parser.get_spatial_index()
+                    hits = [
+                        (distance, item['data'])
+                        for distance, item in index.within_radius(
+                            airport_lat, airport_lon, self.ENTRY_FIX_RADIUS_NM,
+                            accept=lambda item: item['kind'] == 'fix')
+                    ]
+                else:
+                    # Parsers without an index: scan every fix
+                    hits = []
+                    for fix in self.sct_parser.get_data().get('fixes', []):
+                        try:
+                            distance = haversine_nm(airport_lat, airport_lon,
+                                                    float(fix['latitude']), float(fix['longitude']))
+                        except (KeyError, ValueError, TypeError):
+                            continue
+                        if distance <= self.ENTRY_FIX_RADIUS_NM:
+                            hits.append((distance, fix))
+                    hits.sort(key=lambda hit: hit[0])
+                
+                for distance, fix in hits:
+                    if 'name' in fix:
+                        entry_fixes.append({
+                            'name': fix['name'],
+                            'lat': float(fix['latitude']),
+                            'lon': float(fix['longitude']),
+                            'distance_nm': int(round(distance))
+                        })
+            else:
+                # No airport selected: no reference point for distances
+                data = self.sct_parser.get_data()
+                for fix in data.get('fixes', [])[:20]:  # First 20 fixes
                     if 'latitude' in fix and 'longitude' in fix and 'name' in fix:
-                        # Calculate distance from selected airport if available
-                        distance = 50  # Default
-                        if self.selected_airport and 'airports' in data:
-                            for airport in data['airports']:
-                                if airport.get('icao') == self.selected_airport:
-                                    if 'latitude' in airport and 'longitude' in airport:
-                                        # Simple distance calculation
-                                        try:
-                                            lat_diff = abs(float(fix['latitude']) - float(airport['latitude']))
-                                            lon_diff = abs(float(fix['longitude']) - float(airport['longitude']))
-                                            distance = int((lat_diff + lon_diff) * 60)  # Approximate NM
-                                        except:
-                                            pass
-                                        break
-                        
                         entry_fixes.append({
                             'name': fix['name'],
                             'lat': float(fix['latitude']),
                             'lon': float(fix['longitude']),
-                            'distance_nm': distance
+                            'distance_nm': 50  # Default
                         })
         
         print(f"DEBUG: Found {len(entry_fixes)} entry fixes")
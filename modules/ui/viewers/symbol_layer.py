@@ -0,0 +1,259 @@
+# symbol_layer.py
+"""Batched symbol layers for point navdata (fixes, VORs, NDBs).
+
+A SymbolLayer draws every symbol of one kind as a single canvas image.
+Positions are projected to normalized Mercator arrays once; each view
+change is one vectorized affine transform, after which a pre-drawn sprite
+is stamped at every position in view. The image covers the canvas plus a
+margin, so panning just moves the image until the margin runs out.
+
+Labels are a separate SymbolLabels layer of plain canvas text items,
+drawn only while few enough of them are in view to be readable.
+
+Both are CanvasLayers: tkintermapview's path list calls their draw(move)
+on every pan and zoom like it does for its own paths.
+"""
+import tkinter as tk
+
+from PIL import Image, ImageDraw, ImageTk
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from ...spatial.projection import ViewTransform, mercator_arrays
+from .path_layer import CanvasLayer
+
+# Extra image area drawn around the canvas, as a fraction of its size
+RENDER_MARGIN = 0.5
+# Labels are hidden while more than this many are in view
+MAX_LABELS = 300
+
+
+def symbol_sprite(shape, color, size=8, width=1):
+    """RGBA image of one symbol ('x', 'triangle' or 'square'), centred"""
+    extent = size + 2 * width
+    sprite = Image.new('RGBA', (extent + 1, extent + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    low, high = width, width + size
+    middle = extent / 2
+    if shape == 'x':
+        draw.line([(low, low), (high, high)], fill=color, width=width)
+        draw.line([(low, high), (high, low)], fill=color, width=width)
+    elif shape == 'triangle':
+        draw.line([(middle, low), (high, high), (low, high), (middle, low)], fill=color, width=width, joint='curve')
+    elif shape == 'square':
+        draw.line([(low, low), (high, low), (high, high), (low, high), (low, low)], fill=color, width=width, joint='curve')
+    else:
+        raise ValueError(f"Unknown symbol shape: {shape}")
+    return sprite
+
+
+def stamp_symbols(sprite, xs, ys, transform, left, top, width, height):
+    """(image, count): the area (left, top, width, height) of a view with the sprite stamped at every point"""
+    sprite_width, sprite_height = sprite.size
+    xs, ys = transform.apply(xs, ys)
+
+    if np is None:
+        image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        count = 0
+        for x, y in zip(xs, ys):
+            x = int(round(x)) - left - sprite_width // 2
+            y = int(round(y)) - top - sprite_height // 2
+            if -sprite_width < x < width and -sprite_height < y < height:
+                image.paste(sprite, (x, y), sprite)
+                count += 1
+        return image, count
+
+    # Keep the symbols overlapping the image
+    xs = np.rint(xs).astype(np.int64) - (left + sprite_width // 2)
+    ys = np.rint(ys).astype(np.int64) - (top + sprite_height // 2)
+    inside = (xs > -sprite_width) & (xs < width) & (ys > -sprite_height) & (ys < height)
+    xs = xs[inside]
+    ys = ys[inside]
+
+    # Stamp every opaque sprite pixel at every symbol position in one pass
+    pixels = np.asarray(sprite)
+    sprite_ys, sprite_xs = np.nonzero(pixels[:, :, 3])
+    colors = pixels[sprite_ys, sprite_xs]
+    pixel_xs = (xs[:, None] + sprite_xs[None, :]).ravel()
+    pixel_ys = (ys[:, None] + sprite_ys[None, :]).ravel()
+    pixel_colors = np.broadcast_to(colors, (len(xs),) + colors.shape).reshape(-1, 4)
+    keep = (pixel_xs >= 0) & (pixel_xs < width) & (pixel_ys >= 0) & (pixel_ys < height)
+
+    image = np.zeros((height, width, 4), dtype=np.uint8)
+    image[pixel_ys[keep], pixel_xs[keep]] = pixel_colors[keep]
+    return Image.fromarray(image, 'RGBA'), len(xs)
+
+
+class SymbolLayer(CanvasLayer):
+    """All symbols of one kind, drawn as one canvas image"""
+
+    def __init__(self, map_widget, name="", shape='x', color='black', size=8, width=1):
+        super().__init__(map_widget, name)
+        self.style = (shape, color, size, width)
+        self.sprite = symbol_sprite(shape, color, size, width)
+        self.labels = None
+        self.points = []
+        self.xs, self.ys = mercator_arrays([])
+        self._item = None
+        self._photo = None
+        self._transform = None  # view the image was rendered for
+        self._origin = (0.0, 0.0)  # normalized position of the image's top-left corner
+        self._drawn = 0
+
+    def __len__(self):
+        return len(self.points)
+
+    def set_points(self, points, labels=None, **label_options):
+        """Replace the symbols with (lat, lon) points; labels gives one text per point"""
+        self.points = [(float(lat), float(lon)) for lat, lon in points]
+        self.xs, self.ys = mercator_arrays(self.points)
+        if self.labels is not None:
+            self.labels.delete()
+            self.labels = None
+        if labels is not None:
+            self.labels = SymbolLabels(self, labels, **label_options)
+        self._transform = None
+        self.draw()
+
+    def bounds(self):
+        """(min_lat, min_lon, max_lat, max_lon) of the symbols, or None when empty"""
+        if not self.points:
+            return None
+        lats = [point[0] for point in self.points]
+        lons = [point[1] for point in self.points]
+        return (min(lats), min(lons), max(lats), max(lons))
+
+    @property
+    def visible_count(self):
+        return self._drawn
+
+    def draw(self, move=False):
+        """Place the layer for the current view (called by the map on pan and zoom)"""
+        if not self.visible or not self.points:
+            self.clear()
+            return
+        self.deleted = False
+        self._attach()
+
+        transform = ViewTransform.from_map(self.map_widget)
+        if not self._covers(transform):
+            self._render(transform)
+        left, top = transform.point(*self._origin)
+        self.map_widget.canvas.coords(self._item, left, top)
+
+        if self.labels is not None:
+            self.labels.draw(transform)
+
+    def _covers(self, transform):
+        """True if the rendered image still fills the canvas in this view"""
+        if self._item is None or not transform.same_scale(self._transform):
+            return False
+        left, top = transform.point(*self._origin)
+        image_width, image_height = self._photo.width(), self._photo.height()
+        return (left <= 0 and top <= 0 and left + image_width >= self.map_widget.width
+                and top + image_height >= self.map_widget.height)
+
+    def _render(self, transform):
+        width, height = self.map_widget.width, self.map_widget.height
+        margin_x = int(width * RENDER_MARGIN)
+        margin_y = int(height * RENDER_MARGIN)
+        image = self.render_image(transform, -margin_x, -margin_y,
+                                  width + 2 * margin_x, height + 2 * margin_y)
+
+        self._transform = transform
+        self._origin = ((-margin_x - transform.offset_x) / transform.scale_x,
+                        (-margin_y - transform.offset_y) / transform.scale_y)
+        self._photo = ImageTk.PhotoImage(image)
+        canvas = self.map_widget.canvas
+        if self._item is None:
+            self._item = canvas.create_image(0, 0, anchor=tk.NW, image=self._photo, tag="path")
+            self.map_widget.manage_z_order()
+        else:
+            canvas.itemconfig(self._item, image=self._photo)
+
+    def render_image(self, transform, left, top, width, height):
+        """RGBA image of the canvas area (left, top, width, height) with every symbol stamped in"""
+        image, self._drawn = stamp_symbols(self.sprite, self.xs, self.ys, transform, left, top, width, height)
+        return image
+
+    def clear(self):
+        """Delete the canvas items, keeping the points"""
+        if self._item is not None:
+            self.map_widget.canvas.delete(self._item)
+        if self.labels is not None:
+            self.labels.clear()
+        self._item = None
+        self._photo = None
+        self._transform = None
+        self._drawn = 0
+        self._detach()
+
+    def reset(self):
+        """Delete the canvas items and forget the points"""
+        self.clear()
+        self.points = []
+        self.xs, self.ys = mercator_arrays([])
+        self.labels = None
+
+
+class SymbolLabels:
+    """Text labels of a SymbolLayer's points, as individual canvas text items"""
+
+    def __init__(self, layer, texts, color='black', font=('Arial', 8, 'bold'),
+                 offset_y=-8, max_labels=MAX_LABELS):
+        self.layer = layer
+        self.texts = list(texts)
+        self.color = color
+        self.font = font
+        self.offset_y = offset_y
+        self.max_labels = max_labels
+        self._items = {}  # point index -> canvas text item
+
+    @property
+    def visible_count(self):
+        return len(self._items)
+
+    def draw(self, transform):
+        """Label the points on the canvas, unless there are too many to read"""
+        map_widget = self.layer.map_widget
+        xs, ys = transform.apply(self.layer.xs, self.layer.ys)
+        if np is not None:
+            inside = (xs >= 0) & (xs < map_widget.width) & (ys >= 0) & (ys < map_widget.height)
+            indices = np.flatnonzero(inside).tolist()
+        else:
+            indices = [i for i, (x, y) in enumerate(zip(xs, ys))
+                       if 0 <= x < map_widget.width and 0 <= y < map_widget.height]
+
+        if len(indices) > self.max_labels:
+            self.clear()
+            return
+
+        canvas = map_widget.canvas
+        visible = set(indices)
+        for index in [index for index in self._items if index not in visible]:
+            canvas.delete(self._items.pop(index))
+        for index in indices:
+            x = float(xs[index])
+            y = float(ys[index]) + self.offset_y
+            item = self._items.get(index)
+            if item is None:
+                self._items[index] = canvas.create_text(x, y, anchor=tk.S, text=self.texts[index],
+                                                        fill=self.color, font=self.font, tag="path")
+            else:
+                canvas.coords(item, x, y)
+
+    def clear(self):
+        """Delete the label items"""
+        canvas = self.layer.map_widget.canvas
+        for item in self._items.values():
+            canvas.delete(item)
+        self._items = {}
+
+    def delete(self):
+        self.clear()
+
+
+__all__ = ['SymbolLayer', 'SymbolLabels', 'symbol_sprite', 'stamp_symbols', 'RENDER_MARGIN', 'MAX_LABELS']
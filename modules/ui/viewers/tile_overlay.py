@@ -0,0 +1,211 @@
+# tile_overlay.py
+"""Pre-rendered raster tiles for static map layers.
+
+Instead of thousands of canvas items, static geometry (boundaries, fixes,
+...) can be rasterized into 256px XYZ tiles with Pillow and drawn onto the
+base-map tiles:
+
+- a TileScene holds the projected geometry and its styles; its content
+  hash names the tile set, so tiles are reused across runs until the
+  sector data or styles change;
+- tiles are stored on disk under cache/tiles/<hash>/<z>/<x>/<y>.png;
+- missing tiles are rendered in a background process pool, each worker
+  holding its own copy of the scene;
+- an OfflineBaseMap composites a TileOverlay's tiles onto the base tiles
+  it serves, so the map loads one tile per position. (TkinterMapView's
+  own overlay tile layer resizes with Image.ANTIALIAS, which current
+  Pillow no longer has, and silently shows blank tiles.)
+"""
+import hashlib
+import io
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from PIL import Image, ImageDraw
+
+from ...spatial.projection import ProjectedPaths, ViewTransform, mercator_arrays
+from .symbol_layer import stamp_symbols, symbol_sprite
+
+TILE_SIZE = 256
+# Bump when the drawing code changes, so tiles rendered by older code are not reused
+RENDER_VERSION = 1
+TILE_CACHE_DIR = os.path.join("cache", "tiles")
+DEFAULT_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+# Extra pixels around a tile in which geometry is still drawn, so wide lines and symbols are not cut
+TILE_PADDING = 16
+
+
+def tile_transform(zoom, x, y):
+    """ViewTransform placing normalized Mercator positions on tile (zoom, x, y)"""
+    scale = TILE_SIZE * 2.0 ** zoom
+    return ViewTransform(scale, scale, -x * TILE_SIZE, -y * TILE_SIZE)
+
+
+def encode_png(image):
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG', optimize=False)
+    return buffer.getvalue()
+
+
+class TileScene:
+    """Projected static geometry and its styles, rendered tile by tile"""
+
+    def __init__(self):
+        self.paths = []  # (ProjectedPaths, color, width)
+        self.symbols = []  # (xs, ys, (shape, color, size, width))
+
+    def __len__(self):
+        return len(self.paths) + len(self.symbols)
+
+    def add_paths(self, paths, color='black', width=1):
+        """Add polylines in one style - (lat, lon) lists or ProjectedPaths"""
+        if not isinstance(paths, ProjectedPaths):
+            paths = ProjectedPaths(paths)
+        if len(paths):
+            self.paths.append((paths, color, width))
+
+    def add_symbols(self, points, shape='x', color='black', size=8, width=1):
+        """Add point symbols in one style"""
+        xs, ys = mercator_arrays(points)
+        if len(xs):
+            self.symbols.append((xs, ys, (shape, color, size, width)))
+
+    def content_hash(self):
+        """Hex digest of the geometry and styles, naming this scene's tile set"""
+        digest = hashlib.sha1(f"tiles-v{RENDER_VERSION}".encode())
+        for paths, color, width in self.paths:
+            digest.update(repr(('paths', color, width, paths.starts)).encode())
+            digest.update(bytes(memoryview(paths.xs)))
+            digest.update(bytes(memoryview(paths.ys)))
+        for xs, ys, style in self.symbols:
+            digest.update(repr(('symbols', style)).encode())
+            digest.update(bytes(memoryview(xs)))
+            digest.update(bytes(memoryview(ys)))
+        return digest.hexdigest()[:16]
+
+    def render_tile(self, zoom, x, y):
+        """RGBA image of one tile, or None if no geometry touches it"""
+        transform = tile_transform(zoom, x, y)
+        image = None
+
+        for paths, color, width in self.paths:
+            visible = paths.visible(transform, -TILE_PADDING, -TILE_PADDING,
+                                    TILE_SIZE + TILE_PADDING, TILE_SIZE + TILE_PADDING)
+            if not visible:
+                continue
+            if image is None:
+                image = Image.new('RGBA', (TILE_SIZE, TILE_SIZE), (0, 0, 0, 0))
+                draw = ImageDraw.Draw(image)
+            flat = paths.canvas_coords(transform)
+            for index in visible:
+                draw.line(paths.path_coords(flat, index), fill=color, width=width, joint='curve')
+
+        for xs, ys, style in self.symbols:
+            stamped, count = stamp_symbols(symbol_sprite(*style), xs, ys, transform, 0, 0, TILE_SIZE, TILE_SIZE)
+            if not count:
+                continue
+            image = stamped if image is None else Image.alpha_composite(image, stamped)
+
+        return image
+
+
+# Scene of a worker process, set once when the pool starts
+_worker_scene = None
+
+
+def _init_worker(scene):
+    global _worker_scene
+    _worker_scene = scene
+
+
+def _render_in_worker(zoom, x, y):
+    image = _worker_scene.render_tile(zoom, x, y)
+    return encode_png(image) if image is not None else b''
+
+
+class TileOverlay:
+    """Disk cache and render pool for one scene's tiles"""
+
+    def __init__(self, scene, cache_dir=TILE_CACHE_DIR, workers=DEFAULT_WORKERS):
+        self.scene = scene
+        self.key = scene.content_hash()
+        self.directory = os.path.join(cache_dir, self.key)
+        self.workers = workers
+        self._pool = None
+        self._started = False
+        self._pending = {}  # (zoom, x, y) -> Future of a tile being rendered
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Start the render pool"""
+        if self._started:
+            return
+        self._started = True
+        try:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                             initargs=(self.scene,))
+        except (OSError, NotImplementedError) as e:
+            # No process support: render on the server threads instead
+            print(f"DEBUG: Tile render pool unavailable, rendering in threads: {e}")
+            self._pool = None
+
+    def stop(self):
+        """Drop tiles still waiting to be rendered"""
+        self._started = False
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def tile_path(self, zoom, x, y):
+        return os.path.join(self.directory, str(zoom), str(x), f"{y}.png")
+
+    def tile(self, zoom, x, y):
+        """PNG bytes of a tile (b'' when empty), from disk or rendered on first request"""
+        path = self.tile_path(zoom, x, y)
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            pass
+
+        # Concurrent requests for the same tile share one render
+        key = (zoom, x, y)
+        with self._lock:
+            future = self._pending.get(key)
+            if future is None and self._pool is not None:
+                try:
+                    future = self._pool.submit(_render_in_worker, zoom, x, y)
+                    self._pending[key] = future
+                except RuntimeError:
+                    # Pool shut down
+                    return b''
+        try:
+            if future is not None:
+                data = future.result()
+            else:
+                image = self.scene.render_tile(zoom, x, y)
+                data = encode_png(image) if image is not None else b''
+        except Exception as e:
+            print(f"DEBUG: Could not render tile {zoom}/{x}/{y}: {e}")
+            return b''
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+        self._store(path, data)
+        return data
+
+    def _store(self, path, data):
+        """Write a tile atomically, so readers never see half a file"""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"DEBUG: Could not cache tile {path}: {e}")
+
+
+__all__ = ['TileScene', 'TileOverlay', 'tile_transform', 'TILE_SIZE', 'TILE_CACHE_DIR', 'RENDER_VERSION']
@@ -0,0 +1,82 @@
+# tile_server.py
+"""Local HTTP tile server for TkinterMapView.
+
+TkinterMapView only loads tiles through HTTP URLs, so locally produced
+tiles (rendered overlays, an offline tile store) are served from a small
+threaded server on 127.0.0.1. Each request is answered on its own thread
+by a tile function returning PNG bytes.
+"""
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Deepest zoom level served
+MAX_TILE_ZOOM = 22
+
+
+class LocalTileServer:
+    """Serves /<name>/{z}/{x}/{y}.png from tile_func(zoom, x, y) -> PNG bytes (or None for 404)"""
+
+    def __init__(self, tile_func, name):
+        self.tile_func = tile_func
+        self.name = name
+        self._server = None
+
+    @property
+    def running(self):
+        return self._server is not None
+
+    @property
+    def url(self):
+        """Tile URL template for TkinterMapView"""
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/{self.name}/{{z}}/{{x}}/{{y}}.png"
+
+    def start(self):
+        """Start serving on a free port - returns the tile URL template"""
+        if self._server is not None:
+            return self.url
+
+        tile_server = self
+
+        class TileRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                tile = tile_server.parse_path(self.path)
+                data = tile_server.tile_func(*tile) if tile is not None else None
+                if not data:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', 'image/png')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), TileRequestHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self.url
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def parse_path(self, path):
+        """(zoom, x, y) of a request path for this server, or None"""
+        parts = path.split('?')[0].strip('/').split('/')
+        if len(parts) != 4 or parts[0] != self.name or not parts[3].endswith('.png'):
+            return None
+        try:
+            zoom, x, y = int(parts[1]), int(parts[2]), int(parts[3][:-4])
+        except ValueError:
+            return None
+        if not (0 <= zoom <= MAX_TILE_ZOOM and 0 <= x < 2 ** zoom and 0 <= y < 2 ** zoom):
+            return None
+        return zoom, x, y
+
+
+__all__ = ['LocalTileServer', 'MAX_TILE_ZOOM']
@@ -0,0 +1,355 @@
+# tile_store.py
+"""Offline base-map tiles for the map viewers.
+
+TkinterMapView normally fetches every base-map tile from the OSM servers,
+so a cold start or a pan waits on the network and a room without internet
+shows a blank map. Here the base map is read from a local store instead:
+
+- an MBTilesStore keeps tiles in one SQLite file (MBTiles layout), and can
+  be pre-seeded from a directory of {z}/{x}/{y}.png tiles for the sector's
+  bounding box;
+- an OfflineBaseMap serves the store to the map through a LocalTileServer,
+  whose threads read the store in parallel; tiles missing from the store
+  are fetched upstream once, when online, and written through; the tiles
+  of a raster TileOverlay are composited onto the base tiles there, so the
+  map loads a single tile source;
+- a TileImageCache replaces the map's unbounded image dict with an LRU of
+  decoded tile images, so memory stays bounded over long sessions.
+"""
+import io
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+from tkintermapview.utility_functions import decimal_to_osm
+
+from .tile_overlay import TILE_SIZE, encode_png
+from .tile_server import LocalTileServer
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+BASEMAP_PATH = os.path.join("cache", "basemap.mbtiles")
+UPSTREAM_TILE_SERVER = "https://a.tile.openstreetmap.org/{z}/{x}/{y}.png"
+# Decoded tile images kept in memory (about 260 KB each)
+MEMORY_TILES = 512
+# Deepest zoom level seeded by default
+SEED_MAX_ZOOM = 12
+SEED_WORKERS = 8
+# Tiles written per transaction while seeding
+SEED_BATCH = 500
+UPSTREAM_TIMEOUT = 5
+# Seconds to stay offline after an upstream fetch fails
+OFFLINE_RETRY = 60
+# Tile shown where neither the store nor the network has one
+BACKGROUND_COLOR = (190, 190, 190)
+TILE_EXTENSIONS = ('.png', '.jpg', '.jpeg')
+
+
+def tile_range(bounds, zoom):
+    """(min_x, min_y, max_x, max_y) of the tiles covering (min_lat, min_lon, max_lat, max_lon) at a zoom"""
+    min_lat, min_lon, max_lat, max_lon = bounds
+    left, top = decimal_to_osm(max_lat, min_lon, zoom)
+    right, bottom = decimal_to_osm(min_lat, max_lon, zoom)
+    last = 2 ** zoom - 1
+    return (max(0, int(left)), max(0, int(top)), min(last, int(right)), min(last, int(bottom)))
+
+
+def points_bounds(points):
+    """(min_lat, min_lon, max_lat, max_lon) of (lat, lon) points, or None when empty"""
+    if not points:
+        return None
+    lats = [point[0] for point in points]
+    lons = [point[1] for point in points]
+    return (min(lats), min(lons), max(lats), max(lons))
+
+
+def composite_tile(base, overlay):
+    """PNG bytes of an overlay tile drawn over a base tile (both encoded images)"""
+    with Image.open(io.BytesIO(base)) as image:
+        image = image.convert('RGBA')
+    with Image.open(io.BytesIO(overlay)) as top:
+        top = top.convert('RGBA')
+    if top.size != image.size:
+        top = top.resize(image.size)
+    return encode_png(Image.alpha_composite(image, top))
+
+
+class MBTilesStore:
+    """Map tiles in one SQLite file, in the MBTiles layout (rows counted from the south)"""
+
+    def __init__(self, path=BASEMAP_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._connections = []
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        """This thread's connection - SQLite connections must not be shared between threads"""
+        local = self._local
+        if getattr(local, 'generation', None) != self._generation:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS metadata (name TEXT, value TEXT)")
+            connection.execute("CREATE TABLE IF NOT EXISTS tiles "
+                               "(zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB)")
+            connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS tile_index "
+                               "ON tiles (zoom_level, tile_column, tile_row)")
+            connection.commit()
+            with self._lock:
+                self._connections.append(connection)
+            local.connection = connection
+            local.generation = self._generation
+        return local.connection
+
+    def get(self, zoom, x, y):
+        """Image bytes of XYZ tile (zoom, x, y), or None if not stored"""
+        row = self._connection().execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level=? AND tile_column=? AND tile_row=?",
+            (zoom, x, 2 ** zoom - 1 - y)).fetchone()
+        return row[0] if row is not None else None
+
+    def put(self, zoom, x, y, data):
+        self.put_many([(zoom, x, y, data)])
+
+    def put_many(self, tiles):
+        """Store (zoom, x, y, data) XYZ tiles in one transaction"""
+        rows = [(zoom, x, 2 ** zoom - 1 - y, sqlite3.Binary(data)) for zoom, x, y, data in tiles]
+        if not rows:
+            return
+        connection = self._connection()
+        with connection:
+            connection.executemany("INSERT OR REPLACE INTO tiles (zoom_level, tile_column, tile_row, tile_data) "
+                                   "VALUES (?, ?, ?, ?)", rows)
+
+    def count(self):
+        return self._connection().execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+
+    def set_metadata(self, **values):
+        connection = self._connection()
+        with connection:
+            for name, value in values.items():
+                connection.execute("DELETE FROM metadata WHERE name=?", (name,))
+                connection.execute("INSERT INTO metadata (name, value) VALUES (?, ?)", (name, str(value)))
+
+    def seed_from_directory(self, directory, bounds=None, min_zoom=0, max_zoom=SEED_MAX_ZOOM,
+                            workers=SEED_WORKERS):
+        """Copy {z}/{x}/{y}.png tiles from a directory into the store - returns the number stored.
+
+        With bounds (min_lat, min_lon, max_lat, max_lon) only the tiles
+        covering that box are read. Files are read on a thread pool and
+        written in batches.
+        """
+        def wanted_tiles():
+            for zoom in range(min_zoom, max_zoom + 1):
+                zoom_dir = os.path.join(directory, str(zoom))
+                if not os.path.isdir(zoom_dir):
+                    continue
+                if bounds is not None:
+                    min_x, min_y, max_x, max_y = tile_range(bounds, zoom)
+                    for x in range(min_x, max_x + 1):
+                        for y in range(min_y, max_y + 1):
+                            yield zoom, x, y
+                else:
+                    for x_name in os.listdir(zoom_dir):
+                        if not x_name.isdigit():
+                            continue
+                        for file_name in os.listdir(os.path.join(zoom_dir, x_name)):
+                            y_name, extension = os.path.splitext(file_name)
+                            if y_name.isdigit() and extension.lower() in TILE_EXTENSIONS:
+                                yield zoom, int(x_name), int(y_name)
+
+        def read_tile(tile):
+            zoom, x, y = tile
+            for extension in TILE_EXTENSIONS:
+                path = os.path.join(directory, str(zoom), str(x), f"{y}{extension}")
+                try:
+                    with open(path, 'rb') as f:
+                        return zoom, x, y, f.read()
+                except OSError:
+                    continue
+            return None
+
+        stored = 0
+        batch = []
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for tile in pool.map(read_tile, wanted_tiles()):
+                if tile is None:
+                    continue
+                batch.append(tile)
+                if len(batch) >= SEED_BATCH:
+                    self.put_many(batch)
+                    stored += len(batch)
+                    batch = []
+        self.put_many(batch)
+        stored += len(batch)
+
+        if bounds is not None:
+            self.set_metadata(bounds=",".join(f"{value:.6f}" for value in
+                                              (bounds[1], bounds[0], bounds[3], bounds[2])),
+                              minzoom=min_zoom, maxzoom=max_zoom)
+        print(f"DEBUG: Seeded {stored} tiles into {self.path} from {directory}")
+        return stored
+
+    def close(self):
+        """Close every thread's connection; the next access reopens the file"""
+        with self._lock:
+            self._generation += 1
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
+
+
+class TileImageCache:
+    """Size-bounded LRU of decoded tile images, usable as TkinterMapView.tile_image_cache.
+
+    The map reads and fills its tile cache from several loader threads,
+    so every access takes a lock.
+    """
+
+    def __init__(self, max_tiles=MEMORY_TILES):
+        self.max_tiles = max_tiles
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._images)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._images
+
+    def __getitem__(self, key):
+        with self._lock:
+            image = self._images[key]
+            self._images.move_to_end(key)
+            return image
+
+    def __setitem__(self, key, image):
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_tiles:
+                self._images.popitem(last=False)
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._images.pop(key, None)
+
+    def get(self, key, default=None):
+        with self._lock:
+            return self._images.get(key, default)
+
+    def keys(self):
+        # A copy, so the map's own trimming can iterate while loaders add tiles
+        with self._lock:
+            return list(self._images)
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+
+
+class OfflineBaseMap:
+    """Base-map tiles served from an MBTilesStore, filled from upstream while online"""
+
+    def __init__(self, store_path=BASEMAP_PATH, upstream=UPSTREAM_TILE_SERVER, memory_tiles=MEMORY_TILES):
+        self.store = MBTilesStore(store_path)
+        self.upstream = upstream
+        self.memory_tiles = memory_tiles
+        self.background_tile = encode_png(Image.new('RGB', (TILE_SIZE, TILE_SIZE), BACKGROUND_COLOR))
+        self.overlay = None
+        self._server = LocalTileServer(self.tile, "base")
+        self._offline_until = 0.0
+
+    @property
+    def online(self):
+        return requests is not None and time.time() >= self._offline_until
+
+    def start(self):
+        """Start serving - returns the tile URL template"""
+        return self._server.start()
+
+    def install(self, map_widget, max_zoom=19):
+        """Point a map at the local tiles, with a bounded image cache"""
+        try:
+            url = self.start()
+        except OSError as e:
+            print(f"DEBUG: Offline tile server unavailable, using {self.upstream}: {e}")
+            url = self.upstream
+        map_widget.set_tile_server(url, max_zoom=max_zoom)
+        map_widget.tile_image_cache = TileImageCache(self.memory_tiles)
+
+    def set_overlay(self, overlay):
+        """Draw a TileOverlay's tiles over the base tiles served from now on (None for none)"""
+        self.overlay = overlay
+
+    def stop(self):
+        self._server.stop()
+        self.store.close()
+
+    def tile(self, zoom, x, y):
+        """Image bytes of a base tile, with the overlay tile (if any) drawn on top"""
+        data = self.base_tile(zoom, x, y)
+        overlay = self.overlay
+        if overlay is None:
+            return data
+        overlay_data = overlay.tile(zoom, x, y)
+        if not overlay_data:
+            return data
+        try:
+            return composite_tile(data, overlay_data)
+        except OSError as e:
+            print(f"DEBUG: Could not draw the overlay on tile {zoom}/{x}/{y}: {e}")
+            return data
+
+    def base_tile(self, zoom, x, y):
+        """Image bytes of a base tile: the store first, then upstream, then a plain background"""
+        try:
+            data = self.store.get(zoom, x, y)
+        except sqlite3.Error as e:
+            print(f"DEBUG: Could not read tile {zoom}/{x}/{y} from {self.store.path}: {e}")
+            data = None
+        if data is not None:
+            return data
+
+        data = self.fetch_upstream(zoom, x, y)
+        if data is None:
+            # Still answered with an image, so the overlay is drawn on top of it
+            return self.background_tile
+        try:
+            self.store.put(zoom, x, y, data)
+        except sqlite3.Error as e:
+            print(f"DEBUG: Could not store tile {zoom}/{x}/{y}: {e}")
+        return data
+
+    def fetch_upstream(self, zoom, x, y):
+        if not self.online:
+            return None
+        url = self.upstream.replace("{x}", str(x)).replace("{y}", str(y)).replace("{z}", str(zoom))
+        try:
+            response = requests.get(url, headers={"User-Agent": "TkinterMapView"}, timeout=UPSTREAM_TIMEOUT)
+        except requests.RequestException as e:
+            print(f"DEBUG: Tile server unreachable, using offline tiles for {OFFLINE_RETRY}s: {e}")
+            self._offline_until = time.time() + OFFLINE_RETRY
+            return None
+        if response.status_code != 200 or not response.content:
+            return None
+        return response.content
+
+
+__all__ = ['MBTilesStore', 'TileImageCache', 'OfflineBaseMap', 'composite_tile', 'tile_range', 'points_bounds',
+           'BASEMAP_PATH', 'UPSTREAM_TILE_SERVER', 'MEMORY_TILES']
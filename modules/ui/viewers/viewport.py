@@ -0,0 +1,258 @@
+# viewport.py
+"""Viewport culling for tkintermapview layers.
+
+A CulledLayer keeps every feature of a layer in an R-tree by bounding box
+and only turns the ones intersecting the visible map area (plus a margin)
+into canvas objects. Calling update() with a new viewport creates the
+features that scrolled in and deletes the ones that scrolled out, so draw
+time follows what is on screen rather than the size of the data.
+
+By default a feature is a list of drawing specs:
+
+    ('marker', (lat, lon), set_marker options)
+    ('path', [(lat, lon), ...], set_path options)
+"""
+import time
+
+from tkintermapview.utility_functions import osm_to_decimal
+
+from ...spatial.rtree import RTree, bbox_union, path_bbox
+
+# Extra area drawn around the visible map, as a fraction of its size
+DEFAULT_MARGIN = 0.25
+
+
+def viewport_bounds(map_widget, margin=DEFAULT_MARGIN):
+    """(min_lat, min_lon, max_lat, max_lon) of the visible map plus a margin"""
+    zoom = round(map_widget.zoom)
+    left, top = map_widget.upper_left_tile_pos
+    right, bottom = map_widget.lower_right_tile_pos
+    if right <= left or bottom <= top:
+        return None
+
+    pad_x = (right - left) * margin
+    pad_y = (bottom - top) * margin
+    world = 2.0 ** zoom
+    left = max(0.0, left - pad_x)
+    right = min(world, right + pad_x)
+    top = max(0.0, top - pad_y)
+    bottom = min(world, bottom + pad_y)
+
+    max_lat, min_lon = osm_to_decimal(left, top, zoom)
+    min_lat, max_lon = osm_to_decimal(right, bottom, zoom)
+    # The map does not wrap, but the top and bottom tile rows reach the poles
+    if top == 0.0:
+        max_lat = 90.0
+    if bottom == world:
+        min_lat = -90.0
+    return (min_lat, min_lon, max_lat, max_lon)
+
+
+def draw_specs(map_widget, specs):
+    """Create the map objects described by a feature's drawing specs"""
+    objects = []
+    for kind, position, options in specs:
+        if kind == 'marker':
+            objects.append(map_widget.set_marker(position[0], position[1], **options))
+        else:
+            objects.append(map_widget.set_path(position, **options))
+    return objects
+
+
+class CulledLayer:
+    """Features of one map layer, drawn only while they are in the viewport"""
+
+    def __init__(self, map_widget, name="", factory=None, updater=None):
+        self.map_widget = map_widget
+        self.name = name
+        # factory(feature) returns the map object(s) drawn for a feature
+        self.factory = factory or (lambda specs: draw_specs(map_widget, specs))
+        # updater(items, feature) changes drawn objects in place, returning False if it can't
+        self.updater = updater
+        self.features = {}  # key -> feature, in insertion order
+        self._bboxes = {}
+        self._order = {}  # key -> insertion sequence, used as drawing order
+        self._next_key = 0
+        self._sequence = 0
+        self._tree = None  # repacked after changes
+        self._items = {}  # key -> drawn map objects
+        self._pending = []  # keys in view still to be drawn, last drawn first
+        self._viewport = None
+        self._updated = False
+
+    def __len__(self):
+        return len(self.features)
+
+    def __contains__(self, key):
+        return key in self.features
+
+    def add(self, bbox, feature, key=None):
+        """Register a feature covering a (min_lat, min_lon, max_lat, max_lon) box - returns its key.
+
+        Re-using a key replaces that feature; if it was on the map it is
+        updated in place (with an updater) or redrawn straight away,
+        nothing else is touched.
+        """
+        if key is None:
+            key = self._next_key
+            self._next_key += 1
+        elif key in self.features:
+            if key in self._items and self._update_in_place(key, bbox, feature):
+                return key
+            self.remove(key)
+
+        self.features[key] = feature
+        self._bboxes[key] = tuple(bbox)
+        self._order[key] = self._sequence
+        self._sequence += 1
+        self._tree = None
+
+        if self._updated and self._in_view(self._bboxes[key]):
+            self._draw(key)
+        return key
+
+    def add_point(self, lat, lon, feature, key=None):
+        return self.add((lat, lon, lat, lon), feature, key)
+
+    def add_path(self, coords, feature, key=None):
+        return self.add(path_bbox(coords), feature, key)
+
+    def _update_in_place(self, key, bbox, feature):
+        bbox = tuple(bbox)
+        if self.updater is None or not self._in_view(bbox):
+            return False
+        try:
+            if self.updater(self._items[key], feature) is False:
+                return False
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"DEBUG: Could not update {self.name} feature in place: {e}")
+            return False
+
+        self.features[key] = feature
+        if bbox != self._bboxes[key]:
+            self._bboxes[key] = bbox
+            self._tree = None
+        return True
+
+    def remove(self, key):
+        """Forget a feature and delete its map objects"""
+        if key not in self.features:
+            return
+        del self.features[key]
+        del self._bboxes[key]
+        del self._order[key]
+        self._tree = None
+        if key in self._items:
+            self._delete(self._items.pop(key))
+
+    def bounds(self):
+        """Box covering every feature, or None when empty"""
+        if not self._bboxes:
+            return None
+        return bbox_union(self._bboxes.values())
+
+    @property
+    def visible_count(self):
+        return len(self._items)
+
+    @property
+    def pending(self):
+        """Number of features in view not drawn yet"""
+        return len(self._pending)
+
+    def drawn_items(self, key=None):
+        """Map objects currently on the canvas (of one feature if key is given)"""
+        if key is not None:
+            return self._items.get(key, [])
+        return [item for items in self._items.values() for item in items]
+
+    def _in_view(self, bbox):
+        viewport = self._viewport
+        if viewport is None:
+            return True
+        min_lat, min_lon, max_lat, max_lon = viewport
+        if bbox[0] > max_lat or bbox[2] < min_lat:
+            return False
+        if min_lon > max_lon:
+            return bbox[3] >= min_lon or bbox[1] <= max_lon
+        return bbox[1] <= max_lon and bbox[3] >= min_lon
+
+    def _visible_keys(self, viewport):
+        if viewport is None:
+            return set(self.features)
+        if self._tree is None:
+            self._tree = RTree()
+            for key, bbox in self._bboxes.items():
+                self._tree.insert(bbox, key)
+        return set(self._tree.search_bbox(*viewport))
+
+    def _draw(self, key):
+        try:
+            items = self.factory(self.features[key])
+        except (ValueError, TypeError) as e:
+            print(f"DEBUG: Could not draw {self.name} feature: {e}")
+            items = None
+        if items is None:
+            items = []
+        elif not isinstance(items, (list, tuple)):
+            items = [items]
+        self._items[key] = [item for item in items if item]
+
+    def update(self, viewport):
+        """Draw features entering the viewport and delete those leaving it (None = everything)"""
+        removed = self.begin_update(viewport)
+        return self.draw_pending(), removed
+
+    def begin_update(self, viewport):
+        """Delete features leaving the viewport and queue those entering it - returns the number deleted.
+
+        The queued features are drawn by draw_pending(); a new update
+        replaces whatever is still queued.
+        """
+        self._viewport = viewport
+        self._updated = True
+        visible = self._visible_keys(viewport)
+
+        removed = [key for key in self._items if key not in visible]
+        for key in removed:
+            self._delete(self._items.pop(key))
+
+        self._pending = sorted(visible.difference(self._items), key=self._order.get, reverse=True)
+        return len(removed)
+
+    def draw_pending(self, deadline=None):
+        """Draw queued features in order until time.perf_counter() passes deadline - returns the number drawn"""
+        drawn = 0
+        while self._pending:
+            if deadline is not None and drawn and time.perf_counter() >= deadline:
+                break
+            key = self._pending.pop()
+            # Removed or already drawn since it was queued
+            if key not in self.features or key in self._items:
+                continue
+            self._draw(key)
+            drawn += 1
+        return drawn
+
+    def _delete(self, items):
+        for item in items:
+            try:
+                item.delete()
+            except:
+                pass
+
+    def clear(self):
+        """Delete every drawn object, keeping the features"""
+        for items in self._items.values():
+            self._delete(items)
+        self._items = {}
+        self._pending = []
+        self._updated = False
+
+    def reset(self):
+        """Delete drawn objects and forget the features"""
+        self.clear()
+        self.features = {}
+        self._bboxes = {}
+        self._order = {}
+        self._tree = None
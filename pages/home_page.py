@@ -27,6 +27,7 @@ class HomePage:
             from modules.generators.random_generator import RandomScenarioGenerator
             from modules.exporters.sweatbox_exporter import SweatboxExporter
             from modules.ui.viewers.sweatbox_map import SweatboxMapViewer
+            from modules.ui.background_loader import BackgroundLoader
             
             self.ESEParser = ESEParser
             self.SCTParser = SCTParser
@@ -34,6 +35,7 @@ class HomePage:
             self.RandomScenarioGenerator = RandomScenarioGenerator
             self.SweatboxExporter = SweatboxExporter
             self.SweatboxMapViewer = SweatboxMapViewer
+            self.BackgroundLoader = BackgroundLoader
             
         except ImportError as e:
             print(f"Import error: {e}")
@@ -49,7 +51,7 @@ class HomePage:
             class FallbackSCTParser:
                 def __init__(self, *args): 
                     self.data = {}
-                def parse(self): 
+                def parse(self, progress=None): 
                     pass
                 def get_data(self): 
                     return {}
@@ -58,13 +60,13 @@ class HomePage:
                 def __init__(self, *args): 
                     self.runways = []
                     self.ils_data = []
-                def parse(self): 
+                def parse(self, progress=None): 
                     pass
                 def get_data(self): 
                     return {'runways': [], 'ils_data': []}
             
             class FallbackRandomScenarioGenerator:
-                def __init__(self, creator): 
+                def __init__(self, creator, training_sectors=None): 
                     self.creator = creator
                 def generate_random_scenario(self): 
                     messagebox.showinfo("Info", "Random generator not available")
@@ -102,14 +104,49 @@ class HomePage:
                     label = tk.Label(frame, text="Map viewer not available", bg='white')
                     label.pack(pady=50)
             
+            class FallbackLoadJob:
+                def __init__(self, name):
+                    self.name = name
+                def report(self, fraction=None, message=""):
+                    pass
+            
+            class FallbackBackgroundLoader:
+                # Runs loads in place, so file loading still works without the modules
+                def __init__(self, widget):
+                    self.busy = False
+                def running(self):
+                    return []
+                def submit(self, name, work, on_done=None, on_error=None, on_progress=None):
+                    job = FallbackLoadJob(name)
+                    try:
+                        result = work(job)
+                    except Exception as e:
+                        if on_error:
+                            on_error(job, e)
+                        return job
+                    if on_done:
+                        on_done(job, result)
+                    return job
+                def cancel(self, name=None):
+                    pass
+                def shutdown(self):
+                    pass
+            
             self.ESEParser = FallbackESEParser
             self.SCTParser = FallbackSCTParser
             self.RWYParser = FallbackRWYParser
             self.RandomScenarioGenerator = FallbackRandomScenarioGenerator
             self.SweatboxExporter = FallbackSweatboxExporter
             self.SweatboxMapViewer = FallbackSweatboxMapViewer
+            self.BackgroundLoader = FallbackBackgroundLoader
+        
+        # File parsing runs on worker threads, reporting back through the Tk main loop
+        self.loader = self.BackgroundLoader(parent)
+        # Stop running loads with the window, so no worker outlives it
+        self.parent.winfo_toplevel().protocol("WM_DELETE_WINDOW", self.on_close)
         
         self.setup_ui()
+        self.update_load_controls()
     
     def setup_ui(self):
         # Main container
@@ -149,6 +186,11 @@ class HomePage:
         tk.Button(file_frame, text="Load RWY File", command=self.load_rwy_file,
                  bg='#e74c3c', fg='white').pack(fill=tk.X, pady=5)
         
+        # Cancel button for file loads still running
+        self.cancel_load_button = tk.Button(file_frame, text="Cancel Loading", command=self.cancel_loading,
+                                            state=tk.DISABLED)
+        self.cancel_load_button.pack(fill=tk.X, pady=5)
+        
         # Master controller input
         tk.Label(file_frame, text="Master Controller:").pack(anchor=tk.W, pady=(10, 0))
         self.master_controller_entry = tk.Entry(file_frame)
@@ -167,6 +209,10 @@ class HomePage:
         scenario_frame = tk.LabelFrame(parent, text="Scenario Generation", padx=10, pady=10)
         scenario_frame.pack(fill=tk.X, padx=10, pady=10)
         
+        tk.Label(scenario_frame, text="Training Sectors (comma separated, blank = any):").pack(anchor=tk.W)
+        self.training_sectors_entry = tk.Entry(scenario_frame)
+        self.training_sectors_entry.pack(fill=tk.X, pady=(0, 5))
+        
         tk.Button(scenario_frame, text="Generate Random Scenario", 
                  command=self.generate_random_scenario,
                  bg='#1abc9c', fg='white').pack(fill=tk.X, pady=5)
@@ -329,49 +375,56 @@ class HomePage:
             filetypes=[("ESE files", "*.ese"), ("All files", "*.*")]
         )
         if file_path:
-            try:
-                self.ese_parser = self.ESEParser(file_path)
+            # Parse on a worker thread; the results are shown in on_ese_loaded
+            def parse_ese(job):
+                job.report(None, f"Parsing {os.path.basename(file_path)}...")
+                parser = self.ESEParser(file_path)
                 
-                # Extract airports from controller positions
+                # The parser reads the file on first access, so that happens here off the main thread
                 positions = []
-                if hasattr(self.ese_parser, 'get_positions'):
-                    positions = self.ese_parser.get_positions()
+                if hasattr(parser, 'get_positions'):
+                    positions = parser.get_positions()
                 
+                # Extract airports from controller positions
+                job.report(0.9, "Extracting airports...")
                 # Extract airports (everything before underscore)
                 airports = self.extract_airports_from_controllers(positions)
-                
-                # Update map viewer with extracted airports
-                if self.map_viewer and hasattr(self.map_viewer, 'update_airports'):
-                    self.map_viewer.update_airports(airports)
-                
-                # Clear existing controllers
-                if self.controller_tree:
-                    for item in self.controller_tree.get_children():
-                        self.controller_tree.delete(item)
-                
-                # Add controllers to tree - DEFAULT TO ✗ (OFF)
-                for pos in positions:
-                    # Skip _FSS and some _CTR positions if needed
-                    if '_FSS' in pos.get('callsign', ''):
-                        continue
-                    
-                    self.controller_tree.insert('', 'end', values=(
-                        pos.get('callsign', ''),
-                        pos.get('frequency', ''),
-                        pos.get('type', ''),
-                        '✗'  # DEFAULT TO OFF (not simulated)
-                    ))
-                
-                messagebox.showinfo("Success", 
-                    f"Loaded ESE file: {file_path}\n"
-                    f"Positions found: {len(positions)}\n"
-                    f"Airports extracted: {len(airports)}\n"
-                    f"Airports: {', '.join(airports[:10])}{'...' if len(airports) > 10 else ''}"
-                )
-                self.status_label.config(text=f"Loaded ESE: {os.path.basename(file_path)} - {len(positions)} positions, {len(airports)} airports")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load ESE file: {str(e)}")
+                return file_path, parser, positions, airports
+            
+            self.start_load('ESE', parse_ese, self.on_ese_loaded)
+    
+    def on_ese_loaded(self, job, result):
+        file_path, self.ese_parser, positions, airports = result
+        
+        # Update map viewer with extracted airports
+        if self.map_viewer and hasattr(self.map_viewer, 'update_airports'):
+            self.map_viewer.update_airports(airports)
+        
+        # Clear existing controllers
+        if self.controller_tree:
+            for item in self.controller_tree.get_children():
+                self.controller_tree.delete(item)
+        
+        # Add controllers to tree - DEFAULT TO ✗ (OFF)
+        for pos in positions:
+            # Skip _FSS and some _CTR positions if needed
+            if '_FSS' in pos.get('callsign', ''):
+                continue
+            
+            self.controller_tree.insert('', 'end', values=(
+                pos.get('callsign', ''),
+                pos.get('frequency', ''),
+                pos.get('type', ''),
+                '✗'  # DEFAULT TO OFF (not simulated)
+            ))
+        
+        self.status_label.config(text=f"Loaded ESE: {os.path.basename(file_path)} - {len(positions)} positions, {len(airports)} airports")
+        messagebox.showinfo("Success",
+            f"Loaded ESE file: {file_path}\n"
+            f"Positions found: {len(positions)}\n"
+            f"Airports extracted: {len(airports)}\n"
+            f"Airports: {', '.join(airports[:10])}{'...' if len(airports) > 10 else ''}"
+        )
     
     def load_sct_file(self):
         file_path = filedialog.askopenfilename(
@@ -379,39 +432,44 @@ class HomePage:
             filetypes=[("SCT files", "*.sct"), ("All files", "*.*")]
         )
         if file_path:
-            try:
-                self.sct_parser = self.SCTParser(file_path)
-                data = self.sct_parser.parse()
-                
-                # Show detailed info about what was loaded
-                airports_count = len(data.get('airports', []))
-                fixes_count = len(data.get('fixes', []))
-                runways_count = len(data.get('runways', []))
-                vor_count = len(data.get('VOR', []))
-                ndb_count = len(data.get('NDB', []))
-                artcc_high_count = len(data.get('ARTCC_HIGH', []))
-                artcc_low_count = len(data.get('ARTCC_LOW', []))
-                
-                messagebox.showinfo("Success", 
-                    f"Loaded SCT file: {file_path}\n"
-                    f"Airports: {airports_count}\n"
-                    f"Fixes: {fixes_count}\n"
-                    f"Runways: {runways_count}\n"
-                    f"VORs: {vor_count}\n"
-                    f"NDBs: {ndb_count}\n"
-                    f"ARTCC High: {artcc_high_count} boundaries\n"
-                    f"ARTCC Low: {artcc_low_count} boundaries"
-                )
-                
-                # Update map viewer - LOAD DATA IMMEDIATELY
-                if self.map_viewer:
-                    self.map_viewer.sct_parser = self.sct_parser
-                    self.map_viewer.load_data()  # This should draw data to map
-                
-                self.status_label.config(text=f"Loaded SCT: {os.path.basename(file_path)} - {airports_count} airports, {fixes_count} fixes")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load SCT file: {str(e)}")
+            # Parse on a worker thread; the map is drawn in on_sct_loaded
+            def parse_sct(job):
+                job.report(None, f"Parsing {os.path.basename(file_path)}...")
+                parser = self.SCTParser(file_path)
+                # Report every step; a cancel stops the parse before the cache is written
+                data = parser.parse(progress=lambda fraction: job.report(fraction, "Parsing sections..."))
+                return file_path, parser, data
+            
+            self.start_load('SCT', parse_sct, self.on_sct_loaded)
+    
+    def on_sct_loaded(self, job, result):
+        file_path, self.sct_parser, data = result
+        
+        # Show detailed info about what was loaded
+        airports_count = len(data.get('airports', []))
+        fixes_count = len(data.get('fixes', []))
+        runways_count = len(data.get('runways', []))
+        vor_count = len(data.get('VOR', []))
+        ndb_count = len(data.get('NDB', []))
+        artcc_high_count = len(data.get('ARTCC_HIGH', []))
+        artcc_low_count = len(data.get('ARTCC_LOW', []))
+        
+        # Update map viewer - LOAD DATA IMMEDIATELY
+        if self.map_viewer:
+            self.map_viewer.sct_parser = self.sct_parser
+            self.map_viewer.load_data()  # This should draw data to map
+        
+        self.status_label.config(text=f"Loaded SCT: {os.path.basename(file_path)} - {airports_count} airports, {fixes_count} fixes")
+        messagebox.showinfo("Success",
+            f"Loaded SCT file: {file_path}\n"
+            f"Airports: {airports_count}\n"
+            f"Fixes: {fixes_count}\n"
+            f"Runways: {runways_count}\n"
+            f"VORs: {vor_count}\n"
+            f"NDBs: {ndb_count}\n"
+            f"ARTCC High: {artcc_high_count} boundaries\n"
+            f"ARTCC Low: {artcc_low_count} boundaries"
+        )
     
     def load_rwy_file(self):
         file_path = filedialog.askopenfilename(
@@ -419,40 +477,84 @@ class HomePage:
             filetypes=[("RWY files", "*.rwy"), ("All files", "*.*")]
         )
         if file_path:
-            try:
-                self.rwy_parser = self.RWYParser(file_path)
-                data = self.rwy_parser.parse()
-                
-                # Check if data was parsed
-                runways_count = len(data.get('runways', []))
-                ils_count = len(data.get('ils_data', []))
-                centerlines_count = len(data.get('centerlines', []))
-                
-                messagebox.showinfo("Success", 
-                    f"Loaded RWY file: {file_path}\n"
-                    f"Runways: {runways_count}\n"
-                    f"ILS Data: {ils_count}\n"
-                    f"Centerlines: {centerlines_count}"
-                )
-                
-                # Update map viewer - LOAD DATA IMMEDIATELY
-                if self.map_viewer:
-                    self.map_viewer.rwy_parser = self.rwy_parser
-                    self.map_viewer.load_data()  # This should draw data to map
-                
-                self.status_label.config(text=f"Loaded RWY: {os.path.basename(file_path)} - {runways_count} runways, {ils_count} ILS")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load RWY file: {str(e)}")
+            # Parse on a worker thread; the map is drawn in on_rwy_loaded
+            def parse_rwy(job):
+                job.report(None, f"Parsing {os.path.basename(file_path)}...")
+                parser = self.RWYParser(file_path)
+                data = parser.parse(progress=lambda fraction: job.report(fraction, "Parsing runways..."))
+                return file_path, parser, data
+            
+            self.start_load('RWY', parse_rwy, self.on_rwy_loaded)
+    
+    def on_rwy_loaded(self, job, result):
+        file_path, self.rwy_parser, data = result
+        
+        # Check if data was parsed
+        runways_count = len(data.get('runways', []))
+        ils_count = len(data.get('ils_data', []))
+        centerlines_count = len(data.get('centerlines', []))
+        
+        # Update map viewer - LOAD DATA IMMEDIATELY
+        if self.map_viewer:
+            self.map_viewer.rwy_parser = self.rwy_parser
+            self.map_viewer.load_data()  # This should draw data to map
+        
+        self.status_label.config(text=f"Loaded RWY: {os.path.basename(file_path)} - {runways_count} runways, {ils_count} ILS")
+        messagebox.showinfo("Success",
+            f"Loaded RWY file: {file_path}\n"
+            f"Runways: {runways_count}\n"
+            f"ILS Data: {ils_count}\n"
+            f"Centerlines: {centerlines_count}"
+        )
+    
+    def start_load(self, kind, work, on_done):
+        """Parse a file on the background loader; a new load of the same kind replaces a running one"""
+        self.status_label.config(text=f"Loading {kind} file...")
+        self.loader.submit(kind, work, on_done=on_done, on_error=self.on_load_error,
+                           on_progress=self.on_load_progress)
+    
+    def on_load_progress(self, job, progress):
+        fraction, message = progress
+        percent = f" {fraction:.0%}" if fraction is not None else ""
+        self.status_label.config(text=f"Loading {job.name}{percent}: {message}")
+    
+    def on_load_error(self, job, error):
+        self.status_label.config(text=f"Failed to load {job.name} file")
+        messagebox.showerror("Error", f"Failed to load {job.name} file: {str(error)}")
+    
+    def cancel_loading(self):
+        running = self.loader.running()
+        self.loader.cancel()
+        if running:
+            self.status_label.config(text=f"Cancelled loading {', '.join(running)}")
+    
+    def on_close(self):
+        """Cancel background loads and close the window"""
+        self.loader.shutdown()
+        self.parent.winfo_toplevel().destroy()
+    
+    def update_load_controls(self):
+        """Enable the cancel button only while files are loading"""
+        try:
+            self.cancel_load_button.config(state=tk.NORMAL if self.loader.busy else tk.DISABLED)
+            self.parent.after(250, self.update_load_controls)
+        except tk.TclError:
+            # Widget destroyed
+            pass
     
     def generate_random_scenario(self):
         if not self.map_viewer:
             messagebox.showwarning("Warning", "Map viewer not available.")
             return
         
-        generator = self.RandomScenarioGenerator(self)
+        generator = self.RandomScenarioGenerator(self, self.get_training_sectors())
         generator.generate_random_scenario()
     
+    def get_training_sectors(self):
+        """SCT sector names typed into the training sectors box, or None for any"""
+        names = [name.strip() for name in self.training_sectors_entry.get().split(',')]
+        return [name for name in names if name] or None
+    
     def generate_aircraft_at_entry(self):
         if not self.map_viewer:
             messagebox.showwarning("Warning", "Map viewer not available.")
@@ -465,7 +567,7 @@ class HomePage:
             messagebox.showwarning("Warning", "No entry fixes found. Please select an airport first.")
             return
         
-        generator = self.RandomScenarioGenerator(self)
+        generator = self.RandomScenarioGenerator(self, self.get_training_sectors())
         if hasattr(generator, 'generate_aircraft_at_entry_fixes'):
             aircraft_list = generator.generate_aircraft_at_entry_fixes(entry_fixes, airport)
             
@@ -717,10 +819,8 @@ class HomePage:
         if not self.map_viewer or not hasattr(self.map_viewer, 'clear_aircraft'):
             return
         
-        # Clear existing aircraft from map
-        self.map_viewer.clear_aircraft()
-        
-        # Add all aircraft from tree
+        # Collect all aircraft from tree
+        aircraft_list = []
         for item in self.aircraft_details_tree.get_children():
             values = self.aircraft_details_tree.item(item, 'values')
             if values and len(values) >= 5:
@@ -744,8 +844,15 @@ class HomePage:
                     'heading': heading
                 }
                 
-                # Add to map
-                if hasattr(self.map_viewer, 'add_aircraft'):
+                aircraft_list.append(aircraft_data)
+        
+        # Viewers with an aircraft layer only redraw aircraft that changed
+        if hasattr(self.map_viewer, 'set_aircraft'):
+            self.map_viewer.set_aircraft(aircraft_list)
+        else:
+            self.map_viewer.clear_aircraft()
+            if hasattr(self.map_viewer, 'add_aircraft'):
+                for aircraft_data in aircraft_list:
                     self.map_viewer.add_aircraft(aircraft_data)
         
         if hasattr(self.map_viewer, 'redraw_all'):
@@ -766,8 +873,8 @@ class HomePage:
                 print(f"✓ Updated {callsign} position in tree")
                 break
         
-        # Update map
-        if self.map_viewer:
+        # Update map (viewers with an aircraft layer have already moved the marker)
+        if self.map_viewer and not hasattr(self.map_viewer, 'set_aircraft'):
             self.map_viewer.redraw_all()
         
         self.status_label.config(text=f"Updated position for {callsign}")
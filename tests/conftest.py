@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from modules.parsers.sct_parser_simple import SCTParser
+
+# ARTCC LOW grid: GRID_SIZE x GRID_SIZE squares of CELL_DEG degrees from (GRID_LAT, GRID_LON)
+GRID_LAT = -27.0
+GRID_LON = 26.0
+GRID_SIZE = 3
+CELL_DEG = 1.0
+
+
+def dms(value, positive, negative):
+    """SCT DMS token, e.g. S026.30.00.000"""
+    hemisphere = positive if value >= 0 else negative
+    value = abs(value)
+    degrees = int(value)
+    minutes = int((value - degrees) * 60)
+    seconds = ((value - degrees) * 60 - minutes) * 60
+    return f"{hemisphere}{degrees:03d}.{minutes:02d}.{seconds:06.3f}"
+
+
+def dms_pair(lat, lon):
+    return f"{dms(lat, 'N', 'S')} {dms(lon, 'E', 'W')}"
+
+
+def grid_square(row, col):
+    """Corners of one ARTCC LOW grid square, counter-clockwise from the south-west"""
+    lat = GRID_LAT + row * CELL_DEG
+    lon = GRID_LON + col * CELL_DEG
+    return [(lat, lon), (lat, lon + CELL_DEG), (lat + CELL_DEG, lon + CELL_DEG), (lat + CELL_DEG, lon)]
+
+
+HIGH_SECTORS = {
+    'HIGHWEST': [(-27.0, 26.0), (-27.0, 27.5), (-25.5, 27.8), (-24.0, 27.5), (-24.0, 26.0)],
+    'HIGHEAST': [(-27.0, 27.5), (-27.0, 29.0), (-24.0, 29.0), (-24.0, 27.5), (-25.5, 27.8)],
+}
+
+
+def boundary_lines(name, corners, rng):
+    """ARTCC lines of a closed polygon, its edges shuffled and some reversed"""
+    edges = list(zip(corners, corners[1:] + corners[:1]))
+    rng.shuffle(edges)
+    lines = []
+    for i, (start, end) in enumerate(edges):
+        if rng.random() < 0.5:
+            start, end = end, start
+        prefix = f"{name:<12}" if i == 0 else " " * 12
+        lines.append(f"{prefix} {dms_pair(*start)} {dms_pair(*end)}")
+    return lines
+
+
+def write_sct(path, seed=0, fixes=300):
+    """Write a small but complete sector file"""
+    rng = random.Random(seed)
+    lines = ["; test sector", "[INFO]", "Test Sector", "ICAO=FAOR", "Name=Test", "VERSION 1.23", ""]
+
+    lines.append("[VOR]")
+    for i in range(20):
+        lines.append(f"V{i:02d} {rng.uniform(-28, -23):.6f} {rng.uniform(25, 30):.6f} VOR {i} 11{i % 10}.{i:02d}")
+    lines.append("[NDB]")
+    for i in range(20):
+        lines.append(f"N{i:02d} {rng.uniform(-28, -23):.6f} {rng.uniform(25, 30):.6f} NDB {i} {300 + i}")
+    lines.append("[AIRPORT]")
+    for i in range(20):
+        lines.append(f"FA{i:02d} {rng.uniform(-28, -23):.6f} {rng.uniform(25, 30):.6f} Airport {i}")
+    lines.append("[RUNWAY]")
+    for i in range(10):
+        lat = -26.0 + i * 0.01
+        lines.append(f"{i + 1:02d} {i * 10} 3000 45 ASPH {lat:.6f} 28.000000 {lat - 0.02:.6f} 28.010000 ILS 110.{i}0")
+    lines.append("[FREQUENCY]")
+    for i in range(10):
+        lines.append(f"TWR FA{i:02d}_TWR 118.{i:03d}")
+    lines.append("[FIXES]")
+    for i in range(fixes):
+        lines.append(f"F{i:04d} {rng.uniform(-28, -23):.6f} {rng.uniform(25, 30):.6f}")
+    lines.append("[TAXIWAY]")
+    for i in range(5):
+        lines.append(f"{-26.0 + i * 0.001:.6f} {28.0 + i * 0.001:.6f} {-26.001 + i * 0.001:.6f} {28.001 + i * 0.001:.6f}")
+        lines.append("; taxiway break")
+
+    lines.append("[ARTCC HIGH]")
+    for name, corners in HIGH_SECTORS.items():
+        lines.extend(boundary_lines(name, corners, rng))
+    lines.append("[ARTCC LOW]")
+    for row in range(GRID_SIZE):
+        for col in range(GRID_SIZE):
+            lines.extend(boundary_lines(f"GRID{row}{col}", grid_square(row, col), rng))
+    lines.append("[GEO]")
+
+    with open(path, 'w', encoding='latin-1') as f:
+        f.write("\n".join(lines) + "\n")
+    return str(path)
+
+
+def comparable(data):
+    """get_data() output with boundary stores as plain lists and without raw sections"""
+    return {key: value.to_list() if hasattr(value, 'to_list') else value
+            for key, value in dict(data).items() if key != 'raw_sections'}
+
+
+@pytest.fixture
+def sct_path(tmp_path):
+    return write_sct(tmp_path / "test.sct")
+
+
+@pytest.fixture
+def make_parser(tmp_path):
+    """SCTParser factory caching into the test's temporary directory"""
+    def make(path, **attributes):
+        parser = SCTParser(path)
+        parser.cache_dir = str(tmp_path / "cache")
+        for name, value in attributes.items():
+            setattr(parser, name, value)
+        return parser
+    return make
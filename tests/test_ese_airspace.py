@@ -0,0 +1,139 @@
+import pytest
+
+from conftest import dms
+from modules.parsers.ese_airspace import CIRCLE_SEGMENTS, AirspaceModel
+from modules.parsers.ese_parser import ESEParser
+from modules.spatial import haversine_nm
+
+
+def coord(lat, lon):
+    return f"COORD:{dms(lat, 'N', 'S')}:{dms(lon, 'E', 'W')}"
+
+
+def sectorline(line_id, *points):
+    return [f"SECTORLINE:{line_id}"] + [coord(lat, lon) for lat, lon in points]
+
+
+POSITIONS = [
+    "FAOR_APP:Johannesburg Approach:124.500:JA:A:FAOR:APP:-:-:0001:0100:S026.00.00.000:E028.00.00.000",
+    "FAOR_TWR:Johannesburg Tower:118.100:JT:T:FAOR:TWR:-:-:0001:0100:S026.08.00.000:E028.15.00.000",
+    "FAJA_CTR:Johannesburg Control:128.200:JC:C:FAJA:CTR:-:-:0001:0100",
+]
+
+# Two boxes side by side sharing the line MID, a higher sector over both and circles
+AIRSPACE = [
+    *sectorline("WEST", (-27.0, 28.0), (-27.0, 27.0), (-26.0, 27.0), (-26.0, 28.0)),
+    *sectorline("MID", (-27.0, 28.0), (-26.0, 28.0)),
+    *sectorline("EAST", (-26.0, 28.0), (-26.0, 29.0), (-27.0, 29.0), (-27.0, 28.0)),
+    *sectorline("TOP", (-27.0, 27.0), (-27.0, 29.0), (-26.0, 29.0), (-26.0, 27.0), (-27.0, 27.0)),
+    *sectorline("MID", (0.0, 0.0), (1.0, 1.0)),
+    f"CIRCLE_SECTORLINE:RING:{dms(-26.5, 'N', 'S')}:{dms(27.5, 'E', 'W')}:2.5",
+    "CIRCLE_SECTORLINE:NAMED:FAOR:5",
+    "CIRCLE_SECTORLINE:BROKEN:FAOR",
+    "SECTOR:WESTBOX:0:24500",
+    "OWNER:JA:JC",
+    "ALTOWNER:Night:JC",
+    "BORDER:WEST:MID",
+    "SECTOR:EASTBOX:0:24500",
+    "OWNER:JC",
+    "BORDER:MID:EAST",
+    "SECTOR:UPPER:24500:66000",
+    "OWNER:JC",
+    "BORDER:TOP",
+    "SECTOR:TOWER:0:5000",
+    "OWNER:JT:JA",
+    "BORDER:RING",
+    "SECTOR:AROUNDFAOR:0:3000",
+    "OWNER:JT",
+    "BORDER:NAMED",
+]
+
+ESE_TEXT = "\n".join(["[POSITIONS]", *POSITIONS, "[AIRSPACE]", *AIRSPACE,
+                      "[FREETEXT]", "S026.00.00.000:E028.00.00.000:Labels:FAOR"]) + "\n"
+
+
+@pytest.fixture
+def ese_path(tmp_path):
+    path = tmp_path / "test.ese"
+    path.write_text(ESE_TEXT, encoding='latin-1')
+    return str(path)
+
+
+@pytest.fixture
+def model(ese_path):
+    return ESEParser(ese_path).get_airspace_model()
+
+
+def test_lines_and_sectors(model):
+    assert len(model) == 5
+    assert model.line_count == 5
+    assert model.duplicate_lines == 1
+    assert model.unparsed_lines == 1
+    assert model.unresolved_circles == [('NAMED', 'FAOR', 5.0)]
+    assert model.sector('WESTBOX').alt_owners == [('Night', ('JC',))]
+
+
+def test_circle_radius_is_fractional(model):
+    ring = model.line_coords('RING')
+    assert len(ring) == CIRCLE_SEGMENTS + 1
+    for lat, lon in ring:
+        assert haversine_nm(-26.5, 27.5, lat, lon) == pytest.approx(2.5, rel=1e-6)
+
+
+@pytest.mark.parametrize('lat, lon, altitude, sector, owner, callsign', [
+    (-26.2, 27.2, 10000, 'WESTBOX', 'JA', 'FAOR_APP'),
+    (-26.2, 28.8, 10000, 'EASTBOX', 'JC', 'FAJA_CTR'),
+    (-26.2, 27.2, 30000, 'UPPER', 'JC', 'FAJA_CTR'),
+    (-26.5, 27.5, 2000, 'TOWER', 'JT', 'FAOR_TWR'),
+])
+def test_locate(model, lat, lon, altitude, sector, owner, callsign):
+    assert model.locate(lat, lon, altitude) == {
+        'sector': sector, 'floor': model.sector(sector).floor, 'ceiling': model.sector(sector).ceiling,
+        'owner': owner, 'callsign': callsign}
+
+
+def test_locate_outside_and_above(model):
+    assert model.locate(-20.0, 27.5, 10000) is None
+    assert model.locate(-26.2, 27.2, 70000) is None
+
+
+def test_online_owners_fall_through(model):
+    assert model.locate(-26.5, 27.5, 2000, online=['FAOR_APP'])['owner'] == 'JA'
+    # No TOWER owner is online, so the sector around it owns the point
+    located = model.locate(-26.5, 27.5, 2000, online=['JC'])
+    assert (located['sector'], located['owner']) == ('WESTBOX', 'JC')
+    assert model.locate(-26.5, 27.5, 2000, online=[]) is None
+
+
+def test_alternative_owner_list(model):
+    assert model.locate(-26.2, 27.2, 10000, alternative='Night')['owner'] == 'JC'
+    # Sectors without that ALTOWNER keep their OWNER list
+    assert model.locate(-26.5, 27.5, 2000, alternative='Night')['owner'] == 'JT'
+
+
+def test_locate_many_matches_locate(model):
+    points = [(-26.2, 27.2, 10000), (-26.2, 28.8), (-20.0, 20.0, 1000)]
+    assert model.locate_many(points) == [model.locate(-26.2, 27.2, 10000), model.locate(-26.2, 28.8),
+                                         model.locate(-20.0, 20.0, 1000)]
+
+
+def test_sectors_at_brute_force(model):
+    for lat in (-26.9, -26.5, -26.1):
+        for lon in (27.1, 27.5, 27.9, 28.1, 28.9):
+            # Rings are assembled on the first lookup, so query before testing every sector
+            found = {sector.name for sector in model.sectors_at(lat, lon, 1000)}
+            assert found == {sector.name for sector in model.sectors
+                             if sector.covers_level(1000) and sector.contains(lat, lon)}
+
+
+def test_resolve_named_circle(model):
+    placed = model.resolve_circles(lambda name: (-26.1392, 28.2460) if name == 'FAOR' else None)
+    assert placed == 1
+    assert model.unresolved_circles == []
+    assert model.locate(-26.1392, 28.2460, 1000)['sector'] == 'AROUNDFAOR'
+
+
+def test_from_lines_matches_parser(ese_path, model):
+    direct = AirspaceModel.from_lines(AIRSPACE, ESEParser(ese_path).get_positions())
+    assert [sector.name for sector in direct.sectors] == [sector.name for sector in model.sectors]
+    assert list(direct.coords) == list(model.coords)
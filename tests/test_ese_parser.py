@@ -0,0 +1,49 @@
+import os
+
+from modules.parsers.ese_parser import ESEParser
+
+ESE_TEXT = "\n".join([
+    "[POSITIONS]",
+    "FAOR_TWR:Johannesburg Tower:118.100:JT:T:FAOR:TWR:-:-:0001:0100:S026.08.00.000:E028.15.00.000",
+    "[FREETEXT]",
+    "; labels",
+    "S026.00.00.000:E028.00.00.000:Labels:FAOR",
+    "[RADAR]",
+    "RADAR:JNB:S026.00.00.000:E028.00.00.000",
+]) + "\n"
+
+
+def write(path, text):
+    path.write_text(text, encoding='latin-1')
+    return str(path)
+
+
+def test_lazy_sections_parse_on_first_access(tmp_path):
+    parser = ESEParser(write(tmp_path / "test.ese", ESE_TEXT))
+    assert parser.get_positions()[0]['callsign'] == 'FAOR_TWR'
+    assert parser._parsed_sections == set()
+    assert len(parser.get_freetext()) == 1
+    assert parser._parsed_sections == {'FREETEXT'}
+    # The property parses everything that is left
+    assert parser.data['radar'] == parser.get_radar()
+    assert 'RADAR' in parser._parsed_sections
+
+
+def test_changed_file_is_read_again_before_a_lazy_read(tmp_path):
+    path = write(tmp_path / "test.ese", ESE_TEXT)
+    parser = ESEParser(path)
+    stat = os.stat(path)
+    # Longer text, so the old byte ranges would cut lines in the middle
+    write(tmp_path / "test.ese", ESE_TEXT.replace("; labels", "; labels, moved down by this comment")
+          .replace("Labels:FAOR", "Labels:FAOR\nS026.10.00.000:E028.10.00.000:Labels:FALA"))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert len(parser.get_freetext()) == 2
+
+
+def test_assigned_data_is_served_as_is(tmp_path):
+    parser = ESEParser(write(tmp_path / "test.ese", ESE_TEXT))
+    data = {key: [] for key in ESEParser.SECTION_KEYS.values()}
+    data['positions'] = [{'callsign': 'FACT_APP', 'type': 'APP', 'coordinates': []}]
+    parser.data = data
+    assert parser.get_freetext() == []
+    assert parser.get_position_table().find('FACT_APP') == 0
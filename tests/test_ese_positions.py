@@ -0,0 +1,87 @@
+import math
+import random
+
+import pytest
+
+from conftest import dms
+from modules.parsers.ese_parser import ESEParser
+from modules.parsers.ese_positions import PositionTable, callsign_prefix
+
+PREFIXES = ['FAOR', 'FACT', 'FALE', 'FAJA']
+TYPES = ['DEL', 'GND', 'TWR', 'APP', 'CTR']
+
+
+def decimal(token):
+    """Reference DMS decode, e.g. S026.30.00.000 -> -26.5"""
+    degrees, minutes, seconds, millis = token[1:].split('.')
+    value = int(degrees) + int(minutes) / 60 + float(f"{seconds}.{millis}") / 3600
+    return -value if token[0] in 'SW' else value
+
+
+def position_lines(seed, count=200):
+    """Position lines with random prefixes and types, some without a visibility centre"""
+    rng = random.Random(seed)
+    lines = []
+    for i in range(count):
+        prefix, position_type = rng.choice(PREFIXES), rng.choice(TYPES)
+        fields = [f"{prefix}_{i}_{position_type}", "Name", f"1{rng.randint(18, 35)}.{rng.randint(0, 999):03d}",
+                  f"I{i}", "X", prefix, position_type, "-", "-", "0001", "0100"]
+        if rng.random() < 0.8:
+            fields += [dms(rng.uniform(-34, -22), 'N', 'S'), dms(rng.uniform(17, 32), 'E', 'W')]
+        lines.append(":".join(fields))
+    return lines
+
+
+@pytest.fixture
+def ese_path(tmp_path):
+    path = tmp_path / "positions.ese"
+    path.write_text("\n".join(["[POSITIONS]", *position_lines(3), "[AIRSPACE]"]) + "\n", encoding='latin-1')
+    return str(path)
+
+
+@pytest.fixture
+def table(ese_path):
+    return ESEParser(ese_path).get_position_table()
+
+
+@pytest.mark.parametrize('position_type', [None, 'TWR', 'CTR', 'OBS'])
+@pytest.mark.parametrize('prefix', [None, 'FAOR', 'FALE', 'EDDM'])
+@pytest.mark.parametrize('located', [False, True])
+def test_select_matches_brute_force(table, position_type, prefix, located):
+    expected = [row for row, position in enumerate(table.positions)
+                if (position_type is None or position['type'] == position_type)
+                and (prefix is None or callsign_prefix(position['callsign']) == prefix)
+                and (not located or len(position['coordinates']) == 2)]
+    assert table.select(position_type=position_type, prefix=prefix, located=located) == expected
+
+
+def test_rows_decode_the_visibility_centre(table):
+    unlocated = 0
+    for row, position in enumerate(table.positions):
+        assert table.find(position['callsign']) == row
+        decoded = table.row(row)
+        assert decoded['callsign'] == position['callsign']
+        assert decoded['frequency'] == position['frequency']
+        if position['coordinates']:
+            assert decoded['lat'] == pytest.approx(decimal(position['coordinates'][0]))
+            assert decoded['lon'] == pytest.approx(decimal(position['coordinates'][1]))
+        else:
+            unlocated += 1
+            assert decoded['lat'] is None and decoded['lon'] is None
+            assert math.isnan(table.lats[row])
+    assert unlocated
+    assert table.find('EDDM_TWR') is None
+
+
+def test_coordinates_skip_positions_without_a_centre(table):
+    points = table.coordinates()
+    assert [point['name'] for point in points] == [table.callsigns[row] for row in table.located]
+    assert table.coordinates(range(len(table))) == points
+
+
+def test_partial_centre_is_not_located():
+    table = PositionTable([{'callsign': 'FAOR_TWR', 'type': 'TWR', 'coordinates': ['S026.08.00.000']},
+                           {'callsign': 'FAOR_APP', 'type': 'APP', 'coordinates': []}])
+    assert table.located == []
+    assert table.row(0)['lat'] is None
+    assert table.select(located=True) == []
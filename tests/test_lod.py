@@ -0,0 +1,66 @@
+import math
+import random
+
+import pytest
+
+from modules.spatial.geo import mercator_xy
+from modules.spatial.lod import BoundaryLOD, tolerance_for_zoom, vertex_significance
+
+
+def douglas_peucker(path, tolerance):
+    """Reference recursive Douglas-Peucker in normalized Mercator space"""
+    xy = [mercator_xy(lat, lon) for lat, lon in path]
+
+    def distance(i, first, last):
+        (px, py), (x1, y1), (x2, y2) = xy[i], xy[first], xy[last]
+        dx, dy = x2 - x1, y2 - y1
+        length_sq = dx * dx + dy * dy
+        if length_sq == 0.0:
+            return math.hypot(px - x1, py - y1)
+        t = max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / length_sq))
+        return math.hypot(px - x1 - t * dx, py - y1 - t * dy)
+
+    def simplify(first, last):
+        if last - first < 2:
+            return []
+        best = max(range(first + 1, last), key=lambda i: distance(i, first, last))
+        if distance(best, first, last) <= tolerance:
+            return []
+        return simplify(first, best) + [best] + simplify(best, last)
+
+    kept = [0] + simplify(0, len(path) - 1) + [len(path) - 1]
+    return [path[i] for i in kept]
+
+
+def wiggly_path(seed, count=200):
+    rng = random.Random(seed)
+    return [(-26.0 + rng.uniform(-0.05, 0.05), 27.0 + i * 0.01) for i in range(count)]
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+@pytest.mark.parametrize('zoom', [4, 8, 11, 14])
+def test_significance_filter_equals_douglas_peucker(seed, zoom):
+    path = wiggly_path(seed)
+    tolerance = tolerance_for_zoom(zoom)
+    significance = vertex_significance(path)
+    filtered = [point for point, value in zip(path, significance) if value > tolerance]
+    assert filtered == douglas_peucker(path, tolerance)
+
+
+def test_levels_grow_with_zoom_and_end_at_full_detail():
+    lod = BoundaryLOD([wiggly_path(seed) for seed in range(5)])
+    counts = [lod.vertex_count(level) for level in range(lod.min_zoom, lod.max_zoom + 2)]
+    assert counts == sorted(counts)
+    assert counts[-1] == lod.vertex_count()
+    assert lod.paths_for_zoom(30) == lod.paths
+    # End points survive every level
+    for path in lod.paths_for_level(0):
+        assert len(path) >= 2
+
+
+def test_closed_ring_keeps_its_shape_until_it_collapses():
+    # About 0.6 NM across: many pixels at zoom 14, far below one at zoom 0
+    ring = [(-26.0, 27.0), (-26.0, 27.01), (-25.99, 27.01), (-25.99, 27.0), (-26.0, 27.0)]
+    lod = BoundaryLOD([ring])
+    assert lod.paths_for_level(lod.max_zoom) == [ring]
+    assert lod.paths_for_level(0) == []
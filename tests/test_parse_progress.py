@@ -0,0 +1,44 @@
+import pytest
+
+from modules.parsers import rwy_parser
+from modules.parsers.rwy_parser import RWYParser
+
+
+class Cancelled(Exception):
+    pass
+
+
+def cancel(fraction):
+    raise Cancelled
+
+
+@pytest.mark.parametrize('mode', [{}, {'streaming': True}, {'parallel': True}])
+def test_sct_progress_reaches_one(sct_path, make_parser, mode):
+    reported = []
+    make_parser(sct_path, parallel_workers=1).parse(progress=reported.append, **mode)
+    assert reported
+    assert reported == sorted(reported)
+    assert reported[-1] == 1.0
+
+
+@pytest.mark.parametrize('mode', [{}, {'streaming': True}, {'parallel': True}])
+def test_sct_cancel_stops_before_the_cache_write(sct_path, make_parser, mode):
+    parser = make_parser(sct_path, parallel_workers=1)
+    with pytest.raises(Cancelled):
+        parser.parse(progress=cancel, **mode)
+    assert not make_parser(sct_path)._load_from_cache()
+
+
+def test_rwy_progress_and_cancel(tmp_path, monkeypatch):
+    monkeypatch.setattr(rwy_parser, 'PROGRESS_LINES', 2)
+    path = tmp_path / "test.rwy"
+    path.write_text("\n".join(f"RWY:{i:02d}:-26.0:28.0:-26.1:28.1" for i in range(1, 10)) + "\n")
+
+    reported = []
+    data = RWYParser(str(path)).parse(progress=reported.append)
+    assert len(data['runways']) == 9
+    assert reported[-1] == 1.0
+    assert len(reported) > 2
+
+    with pytest.raises(Cancelled):
+        RWYParser(str(path)).parse(progress=cancel)
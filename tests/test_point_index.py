@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from modules.spatial import PointIndex, build_navdata_index, haversine_nm
+
+
+@pytest.fixture(scope='module')
+def points():
+    rng = random.Random(7)
+    points = [(rng.uniform(-30, -20), rng.uniform(20, 35), f"P{i}") for i in range(2000)]
+    # Near the antimeridian and a pole, where the grid wraps and widens
+    points += [(rng.uniform(-10, 10), rng.choice([-1, 1]) * rng.uniform(178, 180), f"A{i}") for i in range(200)]
+    points += [(rng.uniform(85, 90), rng.uniform(-180, 180), f"N{i}") for i in range(200)]
+    return points
+
+
+@pytest.fixture(scope='module')
+def index(points):
+    index = PointIndex(cell_size_deg=0.5)
+    index.extend(points)
+    return index
+
+
+QUERIES = [(-25.0, 27.5, 30.0), (-25.0, 27.5, 150.0), (0.0, 179.9, 120.0), (0.0, -179.9, 60.0),
+           (88.0, 0.0, 200.0), (-29.9, 20.1, 5.0)]
+
+
+def brute_radius(points, lat, lon, radius):
+    found = [(haversine_nm(lat, lon, p_lat, p_lon), name) for p_lat, p_lon, name in points]
+    return sorted((distance, name) for distance, name in found if distance <= radius)
+
+
+@pytest.mark.parametrize('lat, lon, radius', QUERIES)
+def test_within_radius_matches_brute_force(points, index, lat, lon, radius):
+    assert index.within_radius(lat, lon, radius) == brute_radius(points, lat, lon, radius)
+
+
+@pytest.mark.parametrize('lat, lon, _', QUERIES)
+@pytest.mark.parametrize('k', [1, 5, 25])
+def test_nearest_matches_brute_force(points, index, lat, lon, _, k):
+    expected = brute_radius(points, lat, lon, float('inf'))[:k]
+    assert [name for _, name in index.nearest(lat, lon, k)] == [name for _, name in expected]
+
+
+@pytest.mark.parametrize('bbox', [(-26.0, 25.0, -24.0, 28.0), (-5.0, 179.0, 5.0, -179.0), (86.0, -180.0, 90.0, 180.0)])
+def test_within_bbox_matches_brute_force(points, index, bbox):
+    min_lat, min_lon, max_lat, max_lon = bbox
+    wraps = min_lon > max_lon
+
+    def inside(lat, lon):
+        in_lon = (lon >= min_lon or lon <= max_lon) if wraps else min_lon <= lon <= max_lon
+        return min_lat <= lat <= max_lat and in_lon
+
+    expected = [name for lat, lon, name in points if inside(lat, lon)]
+    assert index.within_bbox(*bbox) == expected
+
+
+def test_accept_filters_items(index):
+    accepted = index.within_radius(-25.0, 27.5, 150.0, accept=lambda name: name.endswith('7'))
+    assert accepted
+    assert all(name.endswith('7') for _, name in accepted)
+
+
+def test_navdata_index_covers_every_kind():
+    data = {
+        'fixes': [{'name': 'ALPHA', 'latitude': -26.0, 'longitude': 28.0}],
+        'VOR': [{'id': 'JSV', 'latitude': -26.1, 'longitude': 28.1}],
+        'NDB': [{'id': 'GY', 'latitude': -26.2, 'longitude': 28.2}],
+        'airports': [{'icao': 'FAOR', 'latitude': -26.13, 'longitude': 28.24}, {'icao': 'NOPOS'}],
+    }
+    index = build_navdata_index(data)
+    assert len(index) == 4
+    nearest = index.nearest(-26.13, 28.24)[0][1]
+    assert (nearest['kind'], nearest['name']) == ('airport', 'FAOR')
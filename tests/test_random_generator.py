@@ -0,0 +1,35 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from modules.generators import RandomScenarioGenerator
+
+
+@pytest.fixture
+def creator(sct_path, make_parser):
+    parser = make_parser(sct_path)
+    parser.parse()
+    return SimpleNamespace(sct_parser=parser, map_viewer=None, ese_parser=None)
+
+
+@pytest.mark.parametrize('sectors', [['GRID11'], ['GRID00', 'GRID22']])
+def test_positions_fall_inside_the_training_sectors(creator, sectors):
+    generator = RandomScenarioGenerator(creator, training_sectors=sectors)
+    locator = creator.sct_parser.get_sector_locator()
+    random.seed(4)
+    for _ in range(30):
+        lat, lon = generator.generate_random_position(altitude_ft=5000)
+        assert {match['name'] for match in locator.locate(lat, lon, level='LOW')} & set(sectors)
+
+
+def test_without_training_sectors_positions_are_not_filtered(creator):
+    generator = RandomScenarioGenerator(creator, training_sectors=[])
+    assert generator.training_sectors is None
+
+    def no_lookup():
+        raise AssertionError("sector locator used without training sectors")
+
+    generator.get_sector_locator = no_lookup
+    random.seed(4)
+    generator.generate_random_position(altitude_ft=5000)
@@ -0,0 +1,94 @@
+import random
+
+from modules.parsers.ring_assembly import assemble_paths, assemble_rings, is_closed
+
+
+def ring_segments(corners):
+    return list(zip(corners, corners[1:] + corners[:1]))
+
+
+def same_ring(path, corners):
+    """True if a closed path visits the corners in cyclic order, either direction"""
+    ring = path[:-1]
+    if sorted(ring) != sorted(corners):
+        return False
+    start = ring.index(corners[0])
+    rotated = ring[start:] + ring[:start]
+    return rotated == corners or rotated == corners[:1] + corners[:0:-1]
+
+
+def test_shuffled_and_reversed_segments_form_one_ring():
+    corners = [(0.0, 0.0), (0.0, 1.0), (0.5, 1.5), (1.0, 1.0), (1.0, 0.0)]
+    segments = ring_segments(corners)
+    rng = random.Random(3)
+    for _ in range(20):
+        rng.shuffle(segments)
+        mixed = [(end, start) if rng.random() < 0.5 else (start, end) for start, end in segments]
+        paths = assemble_paths(mixed)
+        assert len(paths) == 1
+        assert is_closed(paths[0])
+        assert same_ring(paths[0], corners)
+
+
+def test_open_chain_is_walked_end_to_end():
+    points = [(0.0, float(i)) for i in range(6)]
+    segments = list(zip(points, points[1:]))
+    random.Random(1).shuffle(segments)
+    paths = assemble_paths(segments)
+    assert len(paths) == 1
+    assert not is_closed(paths[0])
+    assert paths[0] in (points, points[::-1])
+
+
+def test_endpoints_within_the_quantum_are_joined():
+    segments = [((0.0, 0.0), (0.0, 1.0)), ((0.0, 1.0 + 1e-9), (1.0, 1.0)), ((1.0, 1.0), (0.0, 0.0))]
+    paths = assemble_paths(segments)
+    assert len(paths) == 1
+    assert is_closed(paths[0])
+
+
+def test_near_matching_endpoints_join_like_the_old_tolerance():
+    # A few hundredths of an arc-second apart, as boundaries are often digitised
+    segments = [((0.0, 0.0), (0.0, 1.0)), ((0.0, 1.0), (1.0, 1.0)), ((1.0, 1.0), (1.0, 0.0)),
+                ((1.0, 0.00003), (0.0, 0.0))]
+    paths = assemble_paths(segments)
+    assert len(paths) == 1
+    assert is_closed(paths[0])
+
+    # Endpoints on either side of a bucket boundary, in both axes
+    segments = [((0.0, 0.0), (1.000049, 1.000049)), ((1.000051, 1.000051), (0.0, 2.0)),
+                ((0.0, 2.0), (0.0, 0.0))]
+    paths = assemble_paths(segments)
+    assert len(paths) == 1
+    assert is_closed(paths[0])
+
+
+def test_endpoints_beyond_the_tolerance_stay_apart():
+    paths = assemble_paths([((0.0, 0.0), (0.0, 1.0)), ((0.0, 1.0002), (1.0, 1.0))])
+    assert len(paths) == 2
+
+
+def test_shared_edges_are_kept_once_when_deduplicated():
+    left = [(0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (1.0, 0.0)]
+    right = [(0.0, 1.0), (0.0, 2.0), (1.0, 2.0), (1.0, 1.0)]
+    segments = ring_segments(left) + ring_segments(right)
+
+    def edge_count(paths):
+        return sum(len(path) - 1 for path in paths)
+
+    assert edge_count(assemble_paths(segments)) == 8
+    assert edge_count(assemble_paths(segments, dedupe_shared=True)) == 7
+
+
+def test_degenerate_segments_are_dropped():
+    assert assemble_paths([((0.0, 0.0), (0.0, 0.0))]) == []
+
+
+def test_rings_drop_the_repeated_point_and_close_a_lone_open_path():
+    corners = [(0.0, 0.0), (0.0, 1.0), (1.0, 1.0), (1.0, 0.0)]
+    rings = assemble_rings(ring_segments(corners))
+    assert len(rings) == 1 and same_ring(rings[0] + rings[0][:1], corners)
+    # A border that does not quite close
+    assert assemble_rings(ring_segments(corners)[:-1]) == [corners]
+    # Open paths next to a ring are left out
+    assert len(assemble_rings(ring_segments(corners) + [((5.0, 5.0), (6.0, 6.0))])) == 1
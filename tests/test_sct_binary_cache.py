@@ -0,0 +1,46 @@
+import struct
+
+import pytest
+
+from modules.parsers.sct_cache import (CACHE_FORMAT_VERSION, CACHE_MAGIC, CacheFormatError, decode_model,
+                                       encode_model, read_binary_cache, write_binary_cache)
+
+
+def comparable_model(model):
+    return {key: value.to_list() if hasattr(value, 'to_list') else value for key, value in model.items()}
+
+
+@pytest.fixture
+def model(sct_path, make_parser):
+    parser = make_parser(sct_path)
+    parser.parse()
+    return parser._model_to_dict()
+
+
+@pytest.mark.parametrize('compress', [True, False])
+def test_encode_decode_round_trip(model, compress):
+    decoded = decode_model(encode_model(model, compress=compress))
+    assert comparable_model(decoded) == comparable_model(model)
+
+
+def test_file_round_trip(model, tmp_path):
+    path = str(tmp_path / "model.bin")
+    write_binary_cache(path, model)
+    assert comparable_model(read_binary_cache(path)) == comparable_model(model)
+
+
+def test_preamble(model):
+    data = encode_model(model)
+    magic, version, _, _ = struct.unpack_from('<4sHHI', data)
+    assert magic == CACHE_MAGIC
+    assert version == CACHE_FORMAT_VERSION
+
+
+@pytest.mark.parametrize('corrupt', [
+    lambda data: data[:4],
+    lambda data: b'JSON' + data[4:],
+    lambda data: data[:4] + struct.pack('<H', CACHE_FORMAT_VERSION + 1) + data[6:],
+])
+def test_unreadable_files_raise_format_error(model, corrupt):
+    with pytest.raises(CacheFormatError):
+        decode_model(corrupt(encode_model(model)))
@@ -0,0 +1,50 @@
+import os
+
+from conftest import comparable
+
+
+def cache_files(parser):
+    return sorted(name for name in os.listdir(parser.cache_dir) if name.endswith('.bin'))
+
+
+def test_warm_cache_equals_cold_parse(sct_path, make_parser):
+    cold = make_parser(sct_path)
+    cold_data = comparable(cold.parse())
+    assert cache_files(cold)
+
+    warm = make_parser(sct_path)
+    assert warm._load_from_cache()
+    assert comparable(warm.parse()) == cold_data
+
+
+def test_cache_key_follows_parse_options(sct_path, make_parser):
+    plain = make_parser(sct_path)
+    deduped = make_parser(sct_path, dedupe_boundary_edges=True)
+    assert plain._get_cache_filename() != deduped._get_cache_filename()
+
+    plain.parse()
+    # A cache built without deduplication is not reused with it
+    assert not deduped._load_from_cache()
+    deduped.parse()
+    assert len(cache_files(plain)) == 2
+
+
+def test_changed_file_misses_the_cache(sct_path, make_parser):
+    make_parser(sct_path).parse()
+    with open(sct_path, 'a', encoding='latin-1') as f:
+        f.write("[FIXES]\nEXTRA -25.000000 27.000000\n")
+
+    parser = make_parser(sct_path)
+    assert not parser._load_from_cache()
+    assert any(fix['name'] == 'EXTRA' for fix in parser.parse()['fixes'])
+
+
+def test_corrupt_cache_falls_back_to_parsing(sct_path, make_parser):
+    cold = make_parser(sct_path)
+    cold_data = comparable(cold.parse())
+    for name in cache_files(cold):
+        with open(os.path.join(cold.cache_dir, name), 'wb') as f:
+            f.write(b'not a cache')
+
+    parser = make_parser(sct_path)
+    assert comparable(parser.parse()) == cold_data
@@ -0,0 +1,52 @@
+import pytest
+
+from conftest import comparable, write_sct
+from modules.parsers.section_index import scan_section_ranges
+
+
+@pytest.fixture
+def large_sct_path(tmp_path):
+    # Enough fixes for the FIXES section to be split into several parallel chunks
+    return write_sct(tmp_path / "large.sct", seed=1, fixes=3000)
+
+
+def uncached(make_parser, path, **attributes):
+    parser = make_parser(path, **attributes)
+    # Nothing is read from or written to a cache, so every mode really parses
+    parser._load_from_cache = lambda: False
+    parser._save_to_cache = lambda: None
+    return parser
+
+
+@pytest.fixture
+def default_data(large_sct_path, make_parser):
+    return comparable(uncached(make_parser, large_sct_path).parse())
+
+
+def test_streaming_matches_default(large_sct_path, make_parser, default_data):
+    data = uncached(make_parser, large_sct_path).parse(streaming=True)
+    assert comparable(data) == default_data
+
+
+def test_lazy_matches_default(large_sct_path, make_parser, default_data):
+    data = uncached(make_parser, large_sct_path).parse(lazy=True)
+    assert not data.is_loaded('fixes')
+    assert comparable(data) == default_data
+
+
+def test_lazy_lookup_parses_only_its_section(large_sct_path, make_parser):
+    parser = uncached(make_parser, large_sct_path)
+    data = parser.parse(lazy=True)
+    assert parser.get_airport('FA03')['icao'] == 'FA03'
+    assert 'AIRPORT' not in parser._pending_sections
+    assert 'FIXES' in parser._pending_sections
+    assert not data.is_loaded('fixes')
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_parallel_matches_default(large_sct_path, make_parser, default_data, workers):
+    parser = uncached(make_parser, large_sct_path, parallel_chunk_bytes=4096, parallel_workers=workers)
+    # Large sections are split, so there are more tasks than sections
+    assert len(parser._build_parallel_tasks()) > len(scan_section_ranges(large_sct_path))
+    assert comparable(parser.parse(parallel=True)) == default_data
+
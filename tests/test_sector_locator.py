@@ -0,0 +1,90 @@
+import random
+
+import pytest
+
+from conftest import CELL_DEG, GRID_LAT, GRID_LON, GRID_SIZE
+from modules.spatial import SectorLocator
+from modules.spatial.rtree import RTree, path_bbox
+from modules.spatial.sector_locator import rings_contain
+
+
+def brute_locate(boundaries, lat, lon):
+    """Sectors containing the point, testing every boundary's rings"""
+    matches = []
+    for level, layer in boundaries.items():
+        for boundary in layer:
+            rings = [path[:-1] for path in boundary['paths'] if path[0] == path[-1]]
+            if rings_contain(rings, lat, lon):
+                matches.append({'name': boundary['name'], 'level': level})
+    return sorted(matches, key=lambda m: (m['level'], m['name']))
+
+
+@pytest.fixture
+def parser(sct_path, make_parser):
+    parser = make_parser(sct_path)
+    parser.parse()
+    return parser
+
+
+def test_point_in_sector_matches_brute_force(parser):
+    locator = parser.get_sector_locator()
+    data = parser.get_data()
+    boundaries = {'HIGH': data['ARTCC_HIGH'].to_list(), 'LOW': data['ARTCC_LOW'].to_list()}
+    assert len(locator) == 11
+
+    rng = random.Random(5)
+    points = [(rng.uniform(-28, -23), rng.uniform(25, 30)) for _ in range(500)]
+    for lat, lon in points:
+        assert locator.locate(lat, lon) == brute_locate(boundaries, lat, lon)
+
+
+def test_grid_cells_and_levels(parser):
+    locator = parser.get_sector_locator()
+    for row in range(GRID_SIZE):
+        for col in range(GRID_SIZE):
+            lat = GRID_LAT + (row + 0.5) * CELL_DEG
+            lon = GRID_LON + (col + 0.5) * CELL_DEG
+            assert locator.locate(lat, lon, level='LOW') == [{'name': f"GRID{row}{col}", 'level': 'LOW'}]
+    # The altitude picks the layer
+    assert [m['level'] for m in locator.locate(-26.5, 26.5, altitude_ft=35000)] == ['HIGH']
+    assert [m['level'] for m in locator.locate(-26.5, 26.5, altitude_ft=5000)] == ['LOW']
+    assert locator.locate(-20.0, 26.5) == []
+
+
+def test_locate_many_matches_locate(parser):
+    locator = parser.get_sector_locator()
+    points = [(-26.5, 26.5, 35000), (-25.5, 28.5), (-20.0, 20.0, 1000)]
+    expected = [locator.locate(-26.5, 26.5, altitude_ft=35000), locator.locate(-25.5, 28.5),
+                locator.locate(-20.0, 20.0, altitude_ft=1000)]
+    assert locator.locate_many(points) == expected
+
+
+def test_sample_point_is_inside_the_sector(parser):
+    locator = parser.get_sector_locator()
+    random.seed(2)
+    lat, lon = locator.sample_point(['GRID11'], 'LOW')
+    assert locator.locate(lat, lon, level='LOW') == [{'name': 'GRID11', 'level': 'LOW'}]
+
+
+@pytest.mark.parametrize('capacity', [2, 4, 16])
+def test_rtree_search_matches_brute_force(capacity):
+    rng = random.Random(capacity)
+    boxes = []
+    for i in range(300):
+        lat, lon = rng.uniform(-60, 60), rng.uniform(-170, 170)
+        boxes.append((path_bbox([(lat, lon), (lat + rng.uniform(0, 5), lon + rng.uniform(0, 5))]), i))
+    tree = RTree(capacity)
+    for bbox, item in boxes:
+        tree.insert(bbox, item)
+    assert len(tree) == len(boxes)
+
+    for _ in range(200):
+        lat, lon = rng.uniform(-60, 60), rng.uniform(-170, 170)
+        expected = {item for (min_lat, min_lon, max_lat, max_lon), item in boxes
+                    if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon}
+        assert set(tree.search_point(lat, lon)) == expected
+
+        query = (lat, lon, lat + 10, lon + 10)
+        expected = {item for (min_lat, min_lon, max_lat, max_lon), item in boxes
+                    if min_lat <= query[2] and max_lat >= query[0] and min_lon <= query[3] and max_lon >= query[1]}
+        assert set(tree.search_bbox(*query)) == expected
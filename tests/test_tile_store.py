@@ -0,0 +1,51 @@
+import io
+import urllib.request
+
+from PIL import Image
+from tkintermapview.utility_functions import decimal_to_osm
+
+from modules.ui.viewers.tile_overlay import TILE_SIZE, TileOverlay, TileScene, encode_png
+from modules.ui.viewers.tile_store import OfflineBaseMap
+
+BASE_COLOR = (0, 0, 255)
+LINE_COLOR = (255, 0, 0)
+
+
+def fetch(url, zoom, x, y):
+    url = url.replace('{z}', str(zoom)).replace('{x}', str(x)).replace('{y}', str(y))
+    with urllib.request.urlopen(url, timeout=10) as response:
+        return response.read()
+
+
+def test_served_tile_has_overlay_composited_on_base(tmp_path):
+    zoom = 10
+    x, y = (int(value) for value in decimal_to_osm(48.25, 11.25, zoom))
+
+    base_map = OfflineBaseMap(str(tmp_path / "basemap.mbtiles"), upstream="http://127.0.0.1:9/{z}/{x}/{y}.png")
+    base_map.store.put(zoom, x, y, encode_png(Image.new('RGB', (TILE_SIZE, TILE_SIZE), BASE_COLOR)))
+
+    scene = TileScene()
+    scene.add_paths([[(48.0, 11.0), (48.5, 11.5)]], 'red', 3)
+    overlay = TileOverlay(scene, cache_dir=str(tmp_path / "tiles"), workers=1)
+    base_map.set_overlay(overlay)
+    try:
+        data = fetch(base_map.start(), zoom, x, y)
+    finally:
+        overlay.stop()
+        base_map.stop()
+
+    image = Image.open(io.BytesIO(data)).convert('RGB')
+    assert image.size == (TILE_SIZE, TILE_SIZE)
+    colors = {color for _, color in image.getcolors(TILE_SIZE * TILE_SIZE)}
+    assert BASE_COLOR in colors
+    assert LINE_COLOR in colors
+
+
+def test_served_tile_without_overlay_is_the_stored_tile(tmp_path):
+    base_map = OfflineBaseMap(str(tmp_path / "basemap.mbtiles"), upstream="http://127.0.0.1:9/{z}/{x}/{y}.png")
+    stored = encode_png(Image.new('RGB', (TILE_SIZE, TILE_SIZE), BASE_COLOR))
+    base_map.store.put(3, 4, 2, stored)
+    try:
+        assert fetch(base_map.start(), 3, 4, 2) == stored
+    finally:
+        base_map.stop()